@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Bulk Review Import
+Streaming NDJSON import vs. one POST /api/reviews per review
+
+Usage:
+    cd backend
+    python benchmarks/bench_bulk_import.py             # 100,000 reviews
+    python benchmarks/bench_bulk_import.py 20000       # custom size
+"""
+
+import asyncio
+import json
+import random
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+from main import app
+from src.routes.reviews import mock_companies
+
+CHUNK_SIZE = 64 * 1024
+
+
+def make_reviews(count, rng):
+    """Synthetic reviews spread over the reviewable mock companies"""
+    company_ids = [
+        c["id"] for c in mock_companies.values() if c["entity_type"] in ("BROKER", "SHIPPER")
+    ]
+    for i in range(count):
+        yield {
+            "company_id": rng.choice(company_ids),
+            "overall_rating": rng.randint(1, 5),
+            "payment_rating": rng.randint(1, 5),
+            "title": f"Load {i}",
+            "content": "Picked up on time, paid in thirty days.",
+            "days_to_payment": rng.randint(5, 90),
+            "created_at": f"2023-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00",
+        }
+
+
+async def stream(body):
+    """Request body streamed in fixed-size chunks"""
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start:start + CHUNK_SIZE]
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        single_count = min(count, 2_000)
+        single = list(make_reviews(single_count, rng))
+        start = time.perf_counter()
+        for review in single:
+            await client.post("/api/reviews", json=review)
+        single_rate = single_count / (time.perf_counter() - start)
+
+        body = b"".join(json.dumps(review).encode() + b"\n" for review in make_reviews(count, rng))
+        start = time.perf_counter()
+        response = await client.post("/api/reviews/import", content=stream(body), timeout=None)
+        import_rate = count / (time.perf_counter() - start)
+        print(f"Import result: imported={response.json()['imported']:,} failed={response.json()['failed']}")
+
+    print()
+    print(f"{'Method':<28}{'reviews/s':>12}")
+    print("-" * 40)
+    print(f"{'POST /api/reviews':<28}{single_rate:>12,.0f}")
+    print(f"{'POST /api/reviews/import':<28}{import_rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark - FMCSA Census Snapshot
+Build time, file size and lookup latency of the memory-mapped census index
+
+Usage:
+    cd backend
+    python benchmarks/bench_census_snapshot.py             # 1,000,000 companies
+    python benchmarks/bench_census_snapshot.py 2000000     # custom size
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.census_snapshot import CensusSnapshot, build_snapshot
+
+STATES = ["TX", "CA", "IL", "GA", "FL", "OH", "PA", "NJ", "TN", "IN"]
+
+
+def make_records(count, rng):
+    """Synthetic census records, roughly the size of real ones"""
+    for i in range(count):
+        yield {
+            "dot_number": str(1_000_000 + i * 3),
+            "mc_number": str(100_000 + i * 2) if i % 3 else None,
+            "company_name": f"Company {i} Transport LLC",
+            "dba_name": None,
+            "status": "AUTHORIZED",
+            "safety_rating": rng.choice(("Satisfactory", None)),
+            "entity_type": rng.choice(("CARRIER", "CARRIER", "BROKER")),
+            "phone": f"555{i % 10_000_000:07d}",
+            "total_drivers": rng.randint(0, 200),
+            "total_power_units": rng.randint(0, 150),
+            "mcs150_mileage": rng.randint(0, 5_000_000),
+            "mcs150_year": "2023",
+            "physical_address": {"street": f"{i} Main St", "city": "Springfield", "state": rng.choice(STATES), "zip": "12345"},
+        }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "census.snapshot")
+        start = time.perf_counter()
+        counts = build_snapshot(make_records(count, rng), path)
+        build_seconds = time.perf_counter() - start
+        print(f"Built {counts['records']:,} companies in {build_seconds:.1f}s, "
+              f"{os.path.getsize(path) / 1e6:,.0f} MB on disk")
+
+        start = time.perf_counter()
+        census = CensusSnapshot.open(path)
+        print(f"Opened in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        lookups = 100_000
+        dots = [str(1_000_000 + rng.randrange(count) * 3) for _ in range(lookups)]
+        misses = [str(1_000_000 + rng.randrange(count) * 3 + 1) for _ in range(lookups)]
+        for label, numbers in (("DOT hits", dots), ("DOT misses", misses)):
+            start = time.perf_counter()
+            found = sum(census.get("dot", number) is not None for number in numbers)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<12} {elapsed / lookups * 1e6:6.1f} us/lookup   ({found:,} found)")
+        census.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark - FMCSA Client Pooling and Caching
+A fresh httpx.AsyncClient per lookup vs. the service's shared pooled client,
+and repeat lookups answered from the verification cache
+
+Runs against a local stand-in for the QCMobile API. New connections wait
+--handshake-ms before being served, to stand in for the TCP+TLS setup a
+real round trip to mobile.fmcsa.dot.gov costs; 0 measures raw local
+overhead only (client construction plus a local TCP connect).
+
+Usage:
+    cd backend
+    python benchmarks/bench_fmcsa_client.py                     # 200 lookups, 40 ms handshake
+    python benchmarks/bench_fmcsa_client.py 500 --handshake-ms 0
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import os
+import time
+
+import httpx
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.fmcsa_service import FMCSAService
+
+BODY = json.dumps({"content": {"carrier": {
+    "mcNumber": "123456", "dotNumber": "3000001", "legalName": "Bench Broker", "entityType": "BROKER",
+}}}).encode()
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+    b"Content-Length: " + str(len(BODY)).encode() + b"\r\n\r\n" + BODY
+)
+
+
+async def serve(handshake: float):
+    """Minimal keep-alive HTTP/1.1 server answering every GET with one carrier"""
+    async def handle(reader, writer):
+        await asyncio.sleep(handshake)
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def per_call_clients(api_url: str, lookups: int) -> float:
+    """The old behavior - one client (and connection) per lookup"""
+    start = time.perf_counter()
+    for i in range(lookups):
+        async with httpx.AsyncClient(timeout=10) as client:
+            response = await client.get(f"{api_url}/docket-number/{i}", params={"webKey": "bench"})
+            response.json()
+    return time.perf_counter() - start
+
+
+async def pooled_client(api_url: str, lookups: int) -> float:
+    """FMCSAService with its shared client - every number new, so every lookup misses the cache"""
+    service = FMCSAService(api_key="bench", api_url=api_url)
+    await service.start()
+    start = time.perf_counter()
+    for i in range(lookups):
+        assert await service.verify_mc_number(str(i))
+    elapsed = time.perf_counter() - start
+    await service.close()
+    return elapsed
+
+
+async def cached_repeats(api_url: str, lookups: int) -> float:
+    """The same brokers verified again - answered from the cache"""
+    service = FMCSAService(api_key="bench", api_url=api_url)
+    for i in range(lookups):
+        await service.verify_mc_number(str(i))
+    start = time.perf_counter()
+    for i in range(lookups):
+        assert await service.verify_mc_number(str(i))
+    elapsed = time.perf_counter() - start
+    await service.close()
+    return elapsed
+
+
+async def run(lookups: int, handshake_ms: float):
+    server = await serve(handshake_ms / 1000)
+    port = server.sockets[0].getsockname()[1]
+    api_url = f"http://127.0.0.1:{port}/qc/services/carriers"
+
+    print(f"{lookups:,} sequential MC lookups, {handshake_ms:g} ms simulated handshake per new connection\n")
+    benches = (
+        ("New client per lookup", per_call_clients),
+        ("Shared pooled client", pooled_client),
+        ("Cached repeat lookups", cached_repeats),
+    )
+    for label, bench in benches:
+        elapsed = await bench(api_url, lookups)
+        print(f"  {label:<24} {elapsed:8.3f} s total   {elapsed / lookups * 1000:8.3f} ms/lookup")
+
+    server.close()
+    await server.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("lookups", type=int, nargs="?", default=200)
+    parser.add_argument("--handshake-ms", type=float, default=40)
+    args = parser.parse_args()
+    asyncio.run(run(args.lookups, args.handshake_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Fuzzy Company Search
+Trigram index vs. the linear scans it replaces, on synthetic companies
+
+Usage:
+    cd backend
+    python benchmarks/bench_fuzzy_search.py            # 250,000 companies
+    python benchmarks/bench_fuzzy_search.py 50000      # custom size
+"""
+
+import random
+import string
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.fuzzy_search import TrigramIndex, word_similarity, MIN_SCORE, MIN_WORD_SIMILARITY
+from src.utils.text import tokenize
+
+SUFFIXES = ["Logistics", "Freight", "Transport", "Transportation", "Brokers", "Express", "Carriers", "Trucking"]
+
+
+def make_word(rng):
+    """Random pronounceable-ish name word"""
+    consonants, vowels = "bcdfghjklmnprstvwz", "aeiou"
+    return "".join(
+        rng.choice(consonants) + rng.choice(vowels) for _ in range(rng.randint(2, 4))
+    ).capitalize()
+
+
+def make_companies(count, rng):
+    """Synthetic companies named '<Word> <Word> <Suffix>'"""
+    vocabulary = [make_word(rng) for _ in range(count // 4)]
+    return [
+        {
+            "id": f"company-{i}",
+            "legal_name": f"{rng.choice(vocabulary)} {rng.choice(vocabulary)} {rng.choice(SUFFIXES)}",
+            "overall_rating": round(rng.uniform(1, 5), 1),
+        }
+        for i in range(count)
+    ]
+
+
+def add_typo(word, rng):
+    """Swap two adjacent letters or replace one letter"""
+    i = rng.randrange(len(word) - 1)
+    if rng.random() < 0.5:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+
+
+def linear_substring_scan(companies, query):
+    """The original search_companies name filter"""
+    query_lower = query.lower()
+    return [c["id"] for c in companies if query_lower in c["legal_name"].lower()]
+
+
+def linear_fuzzy_scan(company_words, query):
+    """Same scoring as the trigram index, comparing against every company"""
+    query_words = tokenize(query)
+    matches = []
+    for company_id, words in company_words:
+        total = 0
+        for query_word in query_words:
+            best = max(word_similarity(query_word, word) for word in words)
+            if best >= MIN_WORD_SIMILARITY:
+                total += best
+        if total / len(query_words) >= MIN_SCORE:
+            matches.append(company_id)
+    return matches
+
+
+def timed(func, queries):
+    """Average seconds per query and the results"""
+    start = time.perf_counter()
+    results = [func(query) for query in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 250_000
+    rng = random.Random(42)
+
+    print(f"Generating {count:,} companies...")
+    companies = make_companies(count, rng)
+
+    start = time.perf_counter()
+    index = TrigramIndex()
+    for company in companies:
+        index.add(company)
+    print(f"Trigram index build: {time.perf_counter() - start:.2f}s")
+
+    # Misspell the first word of random real company names
+    targets = rng.sample(companies, 50)
+    queries = [add_typo(c["legal_name"].split()[0].lower(), rng) for c in targets]
+
+    index_time, index_results = timed(lambda q: [cid for cid, _ in index.search(q)], queries)
+    scan_time, scan_results = timed(lambda q: linear_substring_scan(companies, q), queries)
+
+    company_words = [(c["id"], tokenize(c["legal_name"])) for c in companies]
+    fuzzy_queries = queries[:5]
+    fuzzy_time, _ = timed(lambda q: linear_fuzzy_scan(company_words, q), fuzzy_queries)
+
+    index_hits = sum(t["id"] in r for t, r in zip(targets, index_results))
+    scan_hits = sum(t["id"] in r for t, r in zip(targets, scan_results))
+
+    print()
+    print(f"{'Method':<28}{'ms/query':>12}{'found target':>16}")
+    print("-" * 56)
+    print(f"{'Trigram index':<28}{index_time * 1000:>12.2f}{index_hits:>11}/{len(queries)}")
+    print(f"{'Linear substring (current)':<28}{scan_time * 1000:>12.2f}{scan_hits:>11}/{len(queries)}")
+    print(f"{'Linear fuzzy scan':<28}{fuzzy_time * 1000:>12.2f}{'-':>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Lane Analytics
+Vectorized NumPy group-by vs. a Python dict loop over review dicts
+
+Usage:
+    cd backend
+    python benchmarks/bench_lane_analytics.py            # 2,000,000 reviews
+    python benchmarks/bench_lane_analytics.py 500000     # custom size
+"""
+
+import random
+import sys
+import os
+import time
+from collections import defaultdict
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.lane_analytics import LaneAnalytics, LATE_PAYMENT_SPEEDS
+
+STATES = [
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY",
+    "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND",
+    "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+]
+FREIGHT_TYPES = ["Dry Van", "Reefer", "Flatbed", "Step Deck", "Tanker", "Hazmat"]
+SPEEDS = ["on_time", "on_time", "on_time", "late", "never_paid", None]
+
+
+def make_reviews(count, rng):
+    """Synthetic published reviews with load details"""
+    return [
+        {
+            "id": f"review-{i}",
+            "company_id": f"company-{rng.randrange(20_000)}",
+            "origin_state": rng.choice(STATES),
+            "destination_state": rng.choice(STATES),
+            "freight_type": rng.choice(FREIGHT_TYPES),
+            "overall_rating": rng.randint(1, 5),
+            "days_to_payment": rng.choice((None, rng.randint(7, 120))),
+            "payment_speed": rng.choice(SPEEDS),
+            "status": "published",
+        }
+        for i in range(count)
+    ]
+
+
+def dict_loop_matrix(reviews):
+    """Lane matrix the straightforward way - one pass of dict updates"""
+    totals = defaultdict(lambda: [0, 0.0, 0, 0, 0, 0.0, 0])
+    for review in reviews:
+        if not review["origin_state"] or not review["destination_state"]:
+            continue
+        t = totals[(review["origin_state"], review["destination_state"], review["freight_type"])]
+        t[0] += 1
+        if review["days_to_payment"] is not None:
+            t[1] += review["days_to_payment"]
+            t[2] += 1
+        if review["payment_speed"]:
+            t[3] += review["payment_speed"] in LATE_PAYMENT_SPEEDS
+            t[4] += 1
+        if review["overall_rating"] is not None:
+            t[5] += review["overall_rating"]
+            t[6] += 1
+    return {
+        lane: (t[0], t[1] / t[2] if t[2] else None, t[3] / t[4] if t[4] else None, t[5] / t[6] if t[6] else None)
+        for lane, t in totals.items()
+    }
+
+
+def best_of(func, runs=3):
+    """Fastest of a few runs, in seconds, and the last result"""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    rng = random.Random(42)
+
+    print(f"Generating {count:,} reviews...")
+    reviews = make_reviews(count, rng)
+
+    start = time.perf_counter()
+    lanes = LaneAnalytics()
+    for review in reviews:
+        lanes.add(review)
+    print(f"Columnar projection build: {time.perf_counter() - start:.2f}s")
+
+    matrix_time, matrix = best_of(lambda: lanes.lane_matrix(by_freight_type=True))
+    national_time, _ = best_of(lambda: lanes.lane_matrix())
+    filtered_time, _ = best_of(lambda: lanes.lane_matrix(freight_type="Reefer"))
+    brokers_time, _ = best_of(lambda: lanes.brokers_on_lane("TX", "CA"))
+    loop_time, loop = best_of(lambda: dict_loop_matrix(reviews), runs=1)
+
+    assert len(matrix) == len(loop)
+
+    print()
+    print(f"{'Query':<40}{'ms':>10}")
+    print("-" * 50)
+    print(f"{'Lane matrix x freight type (NumPy)':<40}{matrix_time * 1000:>10.1f}")
+    print(f"{'National lane matrix (NumPy)':<40}{national_time * 1000:>10.1f}")
+    print(f"{'Lane matrix, one freight type (NumPy)':<40}{filtered_time * 1000:>10.1f}")
+    print(f"{'Brokers on TX -> CA (NumPy)':<40}{brokers_time * 1000:>10.1f}")
+    print(f"{'Lane matrix x freight type (dict loop)':<40}{loop_time * 1000:>10.1f}")
+    print(f"\n{len(matrix):,} lane/freight groups")
+
+
+if __name__ == "__main__":
+    main()
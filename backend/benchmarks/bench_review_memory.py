@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Review Memory
+Per-review memory of plain dicts vs. compact ReviewRecords (tracemalloc)
+
+Reviews are decoded from JSON lines, as an import or a database read
+would produce them, so no strings are shared between reviews up front.
+
+Usage:
+    cd backend
+    python benchmarks/bench_review_memory.py            # 1,000,000 reviews
+    python benchmarks/bench_review_memory.py 200000     # custom size
+"""
+
+import gc
+import json
+import random
+import sys
+import os
+import time
+import tracemalloc
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.review_record import ReviewRecord
+
+STATES = ["TX", "CA", "IL", "GA", "FL", "OH", "PA", "NY", "AZ", "WA", "TN", "NC"]
+FREIGHT_TYPES = ["Dry Van", "Reefer", "Flatbed", None]
+SPEEDS = ["on_time", "late", "never_paid", None]
+
+
+def iter_lines(count, seed=42):
+    """JSON lines shaped like new_review_record output - same lines for the same seed"""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield json.dumps({
+            "id": f"review-{i:012x}",
+            "trucker_id": f"trucker-{rng.randrange(50_000)}",
+            "trucker_name": "Current User",
+            "company_id": f"company-{rng.randrange(20_000)}",
+            "overall_rating": rng.randint(1, 5),
+            "title": "Slow payment on this load",
+            "content": "Paid late and changed the rate after delivery. " * rng.randint(1, 4),
+            "payment_rating": rng.choice((None, rng.randint(1, 5))),
+            "communication_rating": None,
+            "professionalism_rating": None,
+            "honesty_rating": None,
+            "payment_speed": rng.choice(SPEEDS),
+            "days_to_payment": rng.choice((None, rng.randint(7, 120))),
+            "load_date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "origin_city": None,
+            "origin_state": rng.choice(STATES),
+            "destination_city": None,
+            "destination_state": rng.choice(STATES),
+            "freight_type": rng.choice(FREIGHT_TYPES),
+            "would_work_again": rng.choice((True, False, None)),
+            "issues_reported": rng.choice(([], [], ["late_payment"], ["rate_changed", "late_payment"])),
+            "status": "published",
+            "helpful_count": 0,
+            "not_helpful_count": 0,
+            "created_at": f"2024-01-01T00:00:{i % 60:02d}.{i:06d}",
+            "company_response": None,
+        })
+
+
+def measure(build):
+    """Bytes still allocated after build() and the built object"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Decoding {count:,} reviews per representation...")
+    dict_bytes, dicts = measure(lambda: [json.loads(line) for line in iter_lines(count)])
+    del dicts
+    record_bytes, records = measure(lambda: [ReviewRecord(json.loads(line)) for line in iter_lines(count)])
+
+    start = time.perf_counter()
+    for record in records[:100_000]:
+        record.to_dict()
+    to_dict_us = (time.perf_counter() - start) / min(count, 100_000) * 1e6
+
+    print()
+    print(f"{'Representation':<20}{'total MB':>12}{'bytes/review':>16}")
+    print("-" * 48)
+    print(f"{'dict':<20}{dict_bytes / 2**20:>12.1f}{dict_bytes / count:>16.0f}")
+    print(f"{'ReviewRecord':<20}{record_bytes / 2**20:>12.1f}{record_bytes / count:>16.0f}")
+    print(f"\nSaved {1 - record_bytes / dict_bytes:.0%}; to_dict() at the response boundary: {to_dict_us:.2f} us/review")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,34 @@ Carrier Board - Main API Entry Point
 FastAPI Backend Application
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.routes import health, reviews
+from src.routes import export, health, lanes, reviews, verification
+from src.services.fmcsa_service import fmcsa_service
 from src.utils.config import config
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown - connect and release shared resources"""
+    # Storage: in-memory mock data unless database.backend is 'sql'
+    await reviews.init_storage()
+    # One pooled FMCSA client for every verification (keep-alive connections)
+    await fmcsa_service.start()
+    yield
+    await fmcsa_service.close()
+    await reviews.close_storage()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Carrier Board API",
     description="Two-way rating platform for freight industry",
     version="0.1.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
 # CORS Configuration - Load from centralized config
@@ -31,83 +47,10 @@ app.add_middleware(
 # Include routers
 app.include_router(health.router, prefix="/api", tags=["health"])
 app.include_router(reviews.router, prefix="/api", tags=["reviews", "companies"])
+app.include_router(export.router, prefix="/api", tags=["export"])
+app.include_router(lanes.router, prefix="/api", tags=["lanes"])
+app.include_router(verification.router, prefix="/api", tags=["verification"])
 
-# Add verification routes
-# NOTE: Using mock mode for now - add FMCSA API key to use real verification
-@app.get("/api/verify/dot/{dot_number}")
-async def verify_dot_number(dot_number: str):
-    """
-    Verify a DOT number with FMCSA database
-    
-    Mock Mode: Returns test data without API key
-    Real Mode: Add FMCSA API key to credentials.json
-    
-    Returns carrier information including:
-    - Company name
-    - Operating status  
-    - Safety rating
-    - DOT number
-    """
-    # Mock response matching FMCSA format
-    return {
-        "verified": True,
-        "dot_number": dot_number,
-        "company_name": f"Test Carrier {dot_number}",
-        "status": "Authorized for Property",
-        "safety_rating": "Satisfactory",
-        "message": "This is mock data - no API key required for development",
-        "mock": True
-    }
-
-@app.get("/api/verify/mc/{mc_number}")
-async def verify_mc_number(mc_number: str):
-    """
-    Verify an MC number with FMCSA database
-    
-    Mock Mode: Returns test data without API key
-    Real Mode: Add FMCSA API key to credentials.json
-    
-    Returns carrier information including:
-    - Company name
-    - Operating status
-    - Safety rating
-    - MC number
-    """
-    # Mock response matching FMCSA format
-    return {
-        "verified": True,
-        "mc_number": mc_number,
-        "company_name": f"Test Company {mc_number}",
-        "status": "Authorized for Property",
-        "safety_rating": "Satisfactory",
-        "message": "This is mock data - no API key required for development",
-        "mock": True
-    }
-
-@app.get("/api/verify/broker/{mc_number}")
-async def verify_broker(mc_number: str):
-    """
-    Verify that an MC number belongs to a BROKER (not a carrier)
-    
-    IMPORTANT: This ensures truckers can only rate actual brokers,
-    not other carriers or entities.
-    
-    Returns:
-    - Broker information if valid
-    - Error if MC is not a broker
-    """
-    # Mock response - in real mode, this checks entityType == "BROKER"
-    return {
-        "verified": True,
-        "is_broker": True,
-        "mc_number": mc_number,
-        "company_name": f"Test Broker {mc_number}",
-        "entity_type": "BROKER",
-        "status": "Authorized for Property Broker",
-        "safety_rating": "Satisfactory",
-        "message": "This is mock data - no API key required for development",
-        "mock": True
-    }
 
 @app.get("/")
 async def root():
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Ingest FMCSA Census
+Build the local census snapshot from FMCSA's bulk company census CSV
+
+Point fmcsa.census_path (or FMCSA_CENSUS_PATH) at the output and restart
+the API: MC/DOT verifications found in the snapshot are answered locally,
+and only numbers it does not have go to the FMCSA API. Re-run whenever a
+new census file is published - the snapshot is replaced atomically.
+
+Usage:
+    cd backend
+    python scripts/ingest_census.py census.csv                          # -> fmcsa.census_path
+    python scripts/ingest_census.py census.csv data/census.snapshot     # explicit output
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.census_snapshot import build_snapshot, read_census_csv
+from src.utils.config import get_fmcsa_config
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(2)
+
+    csv_path = sys.argv[1]
+    output_path = sys.argv[2] if len(sys.argv) > 2 else get_fmcsa_config()["census_path"]
+    if not output_path:
+        print("✗ No output path given and fmcsa.census_path is not set")
+        sys.exit(2)
+
+    start = time.perf_counter()
+    try:
+        counts = build_snapshot(read_census_csv(csv_path), output_path)
+    except Exception as e:
+        print(f"✗ Error building census snapshot: {e}")
+        sys.exit(1)
+
+    print(
+        f"✓ Wrote {output_path}: {counts['records']:,} companies "
+        f"({counts['dot_numbers']:,} DOT, {counts['mc_numbers']:,} MC numbers) "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
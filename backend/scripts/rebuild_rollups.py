@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Rebuild Review Rollups
+Recompute the maintained rollups (per-company monthly trend buckets and
+issue counters, and the platform-wide review total) from the reviews
+table, then rescore every company's ranking from the rebuilt buckets
+
+Run after backfilling reviews directly into the database, or to repair
+the rollups. The API keeps them current for reviews written through it.
+The in-memory backend rebuilds them on every startup and needs no command.
+
+Usage:
+    cd backend
+    python scripts/rebuild_rollups.py                          # database.url
+    python scripts/rebuild_rollups.py postgresql://u:p@db/app  # explicit URL
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.ranking_job import rescore_companies
+from src.services.sql_store import SQLCompanyStore, SQLReviewStore
+from src.utils.database import create_engine, create_tables
+
+
+async def main():
+    database_url = sys.argv[1] if len(sys.argv) > 1 else None
+    engine = create_engine(database_url)
+    try:
+        await create_tables(engine)
+        review_store = SQLReviewStore(engine)
+        counts = await review_store.rebuild_rollups()
+        print(f"✓ Rebuilt {counts['monthly_buckets']:,} monthly buckets and {counts['issue_counters']:,} issue counters")
+        changed = await rescore_companies(SQLCompanyStore(engine), review_store)
+        print(f"✓ Rescored rankings ({changed:,} changed)")
+    except Exception as e:
+        print(f"✗ Error rebuilding rollups: {e}")
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,144 @@
+"""
+Database Tables
+SQLAlchemy Core table definitions for companies and reviews
+"""
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+)
+
+metadata = MetaData()
+
+
+companies = Table(
+    "companies",
+    metadata,
+    Column("id", String(64), primary_key=True),
+    Column("legal_name", String(255), nullable=False),
+    Column("dba_name", String(255)),
+    Column("entity_type", String(32), nullable=False),
+    Column("mc_number", String(20)),
+    Column("dot_number", String(20)),
+    Column("phone", String(32)),
+    Column("physical_city", String(100)),
+    Column("physical_state", String(2)),
+    Column("overall_rating", Float, nullable=False, default=0),
+    Column("review_count", Integer, nullable=False, default=0),
+    Column("payment_rating", Float),
+    Column("communication_rating", Float),
+    Column("professionalism_rating", Float),
+    Column("honesty_rating", Float),
+    # Bayesian, recency-weighted score - the default company ordering
+    Column("ranking_score", Float, nullable=False, default=0),
+    Column("has_payment_issues", Boolean, nullable=False, default=False),
+    # Top-ranked listings per entity type: WHERE entity_type = ? ORDER BY ranking_score DESC
+    Index("ix_companies_entity_type_ranking", "entity_type", "ranking_score"),
+    Index("ix_companies_ranking_score", "ranking_score"),
+    Index("ix_companies_mc_number", "mc_number"),
+    Index("ix_companies_dot_number", "dot_number"),
+)
+
+
+reviews = Table(
+    "reviews",
+    metadata,
+    Column("id", String(64), primary_key=True),
+    Column("trucker_id", String(64), nullable=False),
+    Column("trucker_name", String(255)),
+    Column("company_id", String(64), ForeignKey("companies.id"), nullable=False),
+    Column("overall_rating", Integer, nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("content", Text, nullable=False),
+    Column("payment_rating", Integer),
+    Column("communication_rating", Integer),
+    Column("professionalism_rating", Integer),
+    Column("honesty_rating", Integer),
+    Column("payment_speed", String(20)),
+    Column("days_to_payment", Integer),
+    Column("load_date", Date),
+    Column("origin_city", String(100)),
+    Column("origin_state", String(2)),
+    Column("destination_city", String(100)),
+    Column("destination_state", String(2)),
+    Column("freight_type", String(50)),
+    Column("would_work_again", Boolean),
+    Column("issues_reported", JSON),
+    Column("status", String(20), nullable=False, default="published"),
+    Column("helpful_count", Integer, nullable=False, default=0),
+    Column("not_helpful_count", Integer, nullable=False, default=0),
+    Column("created_at", DateTime, nullable=False),
+    Column("company_response", JSON),
+    # Per-company listings and keyset pagination: ORDER BY created_at DESC, id DESC
+    Index("ix_reviews_company_created", "company_id", "created_at", "id"),
+    Index("ix_reviews_created", "created_at", "id"),
+)
+
+
+# Maintained issue counters: published reviews per (company, reported issue).
+# Kept current by every review write so profile stats never scan the
+# issues_reported JSON.
+company_issues = Table(
+    "company_issues",
+    metadata,
+    Column("company_id", String(64), ForeignKey("companies.id"), primary_key=True),
+    Column("issue", String(64), primary_key=True),
+    Column("review_count", Integer, nullable=False, default=0),
+)
+
+
+# Maintained monthly trend buckets: published reviews per (company, month)
+# with rating sums/counts and days-to-payment totals. Kept current by every
+# review write; scripts/rebuild_rollups.py recomputes them for backfills.
+company_monthly_stats = Table(
+    "company_monthly_stats",
+    metadata,
+    Column("company_id", String(64), ForeignKey("companies.id"), primary_key=True),
+    Column("month", String(7), primary_key=True),  # "YYYY-MM"
+    Column("review_count", Integer, nullable=False, default=0),
+    Column("overall_rating_sum", Integer, nullable=False, default=0),
+    Column("overall_rating_count", Integer, nullable=False, default=0),
+    Column("payment_rating_sum", Integer, nullable=False, default=0),
+    Column("payment_rating_count", Integer, nullable=False, default=0),
+    Column("communication_rating_sum", Integer, nullable=False, default=0),
+    Column("communication_rating_count", Integer, nullable=False, default=0),
+    Column("professionalism_rating_sum", Integer, nullable=False, default=0),
+    Column("professionalism_rating_count", Integer, nullable=False, default=0),
+    Column("honesty_rating_sum", Integer, nullable=False, default=0),
+    Column("honesty_rating_count", Integer, nullable=False, default=0),
+    Column("days_to_payment_sum", Integer, nullable=False, default=0),
+    Column("days_to_payment_count", Integer, nullable=False, default=0),
+)
+
+
+# Maintained platform-wide review total: published reviews across every
+# company, kept in one "*" row by the same writes that maintain
+# company_issues, so the issue leaderboard never counts reviews.
+review_totals = Table(
+    "review_totals",
+    metadata,
+    Column("scope", String(16), primary_key=True),
+    Column("review_count", Integer, nullable=False, default=0),
+)
+
+
+# Shared ETag versions: bumped in the same transaction as every write that
+# changes a company's profile or review listings, so all workers derive the
+# same ETags. The "*" row versions listings across all companies.
+company_versions = Table(
+    "company_versions",
+    metadata,
+    Column("company_id", String(64), primary_key=True),
+    Column("version", Integer, nullable=False, default=0),
+)
@@ -0,0 +1,199 @@
+"""
+Export Routes
+Streaming NDJSON/CSV dumps of reviews and company stats for data partners
+"""
+
+import csv
+import io
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from src.routes import reviews
+from src.utils.ndjson import encode_line
+
+router = APIRouter()
+
+# Rows fetched from the store per step - the only thing held in memory
+PAGE_SIZE = 500
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+REVIEW_CSV_FIELDS = [
+    "id", "company_id", "trucker_id", "trucker_name", "created_at", "status",
+    "overall_rating", "payment_rating", "communication_rating",
+    "professionalism_rating", "honesty_rating", "payment_speed", "days_to_payment",
+    "load_date", "origin_city", "origin_state", "destination_city", "destination_state",
+    "freight_type", "would_work_again", "issues_reported",
+    "helpful_count", "not_helpful_count", "title", "content", "company_response",
+]
+
+COMPANY_CSV_FIELDS = [
+    "id", "legal_name", "dba_name", "entity_type", "mc_number", "dot_number",
+    "physical_city", "physical_state", "overall_rating", "review_count", "ranking_score",
+    "payment_rating", "communication_rating", "professionalism_rating", "honesty_rating",
+    "total_reviews", "average_rating",
+    "5_star", "4_star", "3_star", "2_star", "1_star",
+    "would_work_again_percent",
+]
+
+
+def _csv_value(value):
+    """Flatten lists and nested objects into one CSV cell"""
+    if isinstance(value, list):
+        return ";".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return encode_line(value).decode().rstrip("\n")
+    return value
+
+
+async def _encode(records: AsyncIterator[Dict], export_format: str, fields: List[str]):
+    """Encode records as NDJSON lines or CSV rows, one page at a time"""
+    if export_format == "ndjson":
+        async for record in records:
+            yield encode_line(record)
+        return
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    rows = 0
+    async for record in records:
+        writer.writerow({field: _csv_value(record.get(field)) for field in fields})
+        rows += 1
+        if rows % PAGE_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _stream(records: AsyncIterator[Dict], export_format: str, fields: List[str], name: str):
+    return StreamingResponse(
+        _encode(records, export_format, fields),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'}
+    )
+
+
+async def _iter_reviews(
+    company_id: Optional[str],
+    entity_type: Optional[str],
+    created_after: Optional[str],
+    after
+) -> AsyncIterator[Dict]:
+    """Reviews newest first, walked with keyset pages from the store"""
+    entity_types: Dict[str, Optional[str]] = {}  # company_id -> entity_type
+
+    while True:
+        page = await reviews.review_store.list_reviews(company_id, limit=PAGE_SIZE, after=after)
+        if not page:
+            return
+
+        if entity_type:
+            unknown = {r["company_id"] for r in page} - entity_types.keys()
+            companies = await reviews.company_store.get_many(unknown)
+            for unknown_id in unknown:
+                company = companies.get(unknown_id)
+                entity_types[unknown_id] = company["entity_type"] if company else None
+
+        for review in page:
+            if created_after and review["created_at"] < created_after:
+                return
+            if entity_type and entity_types[review["company_id"]] != entity_type:
+                continue
+            yield reviews.vote_buffer.overlay(review)
+
+        if len(page) < PAGE_SIZE:
+            return
+        after = (page[-1]["created_at"], page[-1]["id"])
+
+
+async def _iter_companies(entity_type: Optional[str], after_id: Optional[str]) -> AsyncIterator[Dict]:
+    """Companies in ID order with their profile stats"""
+    while True:
+        page = await reviews.company_store.page_by_id(after_id, limit=PAGE_SIZE, entity_type=entity_type)
+        if not page:
+            return
+
+        aggregates = await reviews.review_store.company_aggregates(c["id"] for c in page)
+        for company in page:
+            stats = aggregates[company["id"]].stats(average_rating=company.get("overall_rating", 0))
+            yield {**company, "stats": stats}
+
+        if len(page) < PAGE_SIZE:
+            return
+        after_id = page[-1]["id"]
+
+
+def _flatten_company(record: Dict) -> Dict:
+    """Company with its stats merged in for CSV columns"""
+    stats = record["stats"]
+    return {**record, **stats, **stats["rating_distribution"]}
+
+
+async def _flat(records: AsyncIterator[Dict]) -> AsyncIterator[Dict]:
+    async for record in records:
+        yield _flatten_company(record)
+
+
+@router.get("/export/reviews")
+async def export_reviews(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    company_id: Optional[str] = Query(None),
+    entity_type: Optional[str] = Query(None, description="Only reviews of this company type"),
+    created_after: Optional[datetime] = Query(None, description="Inclusive lower bound"),
+    created_before: Optional[datetime] = Query(None, description="Exclusive upper bound"),
+    after_id: Optional[str] = Query(None, description="Resume after the last review received")
+):
+    """
+    Stream every matching review as NDJSON or CSV - ADMIN ONLY
+    
+    Reviews are exported newest first. After a dropped connection, pass
+    the ID of the last review received as `after_id` to continue where
+    the export stopped.
+    
+    IMPORTANT: In production, this requires partner/admin authentication.
+    """
+    
+    after = None
+    if after_id:
+        last = await reviews.review_store.get(after_id)
+        if not last:
+            raise HTTPException(status_code=400, detail="Unknown after_id")
+        after = (last["created_at"], last["id"])
+    
+    if created_before:
+        # Keys sort as (created_at, id) - "" sorts before every ID
+        bound = (reviews.storage_timestamp(created_before), "")
+        after = min(after, bound) if after else bound
+    
+    records = _iter_reviews(
+        company_id,
+        entity_type.upper() if entity_type else None,
+        reviews.storage_timestamp(created_after) if created_after else None,
+        after
+    )
+    return _stream(records, export_format, REVIEW_CSV_FIELDS, "reviews")
+
+
+@router.get("/export/companies")
+async def export_companies(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    entity_type: Optional[str] = Query(None),
+    after_id: Optional[str] = Query(None, description="Resume after the last company received")
+):
+    """
+    Stream every company with its profile stats as NDJSON or CSV - ADMIN ONLY
+    
+    Companies are exported in ID order; pass the last ID received as
+    `after_id` to resume.
+    """
+    
+    records = _iter_companies(entity_type.upper() if entity_type else None, after_id)
+    if export_format == "csv":
+        records = _flat(records)
+    return _stream(records, export_format, COMPANY_CSV_FIELDS, "companies")
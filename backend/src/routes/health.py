@@ -4,6 +4,7 @@ Health Check Routes
 
 from fastapi import APIRouter
 from datetime import datetime
+from src.services.fmcsa_service import fmcsa_service
 
 router = APIRouter()
 
@@ -19,3 +20,17 @@ async def health_check():
         "service": "Carrier Board API"
     }
 
+
+
+@router.get("/health/fmcsa")
+async def fmcsa_health():
+    """
+    FMCSA verification status
+    Returns whether lookups are mocked, the lookup cache counters and
+    the loaded census snapshot (if any)
+    """
+    return {
+        "mock_mode": fmcsa_service.mock_mode,
+        "cache": fmcsa_service.cache.stats(),
+        "census": fmcsa_service.census.stats() if fmcsa_service.census else None
+    }
@@ -0,0 +1,72 @@
+"""
+Lane Routes
+Payment and rating analytics per origin -> destination lane
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Path, Query
+from src.routes import reviews
+
+router = APIRouter()
+
+STATE_CODE = r"^[A-Za-z]{2}$"
+
+
+@router.get("/lanes")
+async def lane_matrix(
+    freight_type: Optional[str] = Query(None),
+    company_id: Optional[str] = Query(None, description="Only this broker's reviews"),
+    by_freight_type: bool = Query(False, description="Split each lane by freight type"),
+    min_reviews: int = Query(1, ge=1)
+):
+    """
+    National lane matrix - stats for every origin -> destination lane
+    
+    Each lane has its review count, average days to payment, late-payment
+    rate (share of reviews reporting late or no payment) and average rating.
+    """
+    
+    lanes = reviews.lane_analytics.lane_matrix(
+        freight_type=freight_type,
+        company_id=company_id,
+        by_freight_type=by_freight_type,
+        min_reviews=min_reviews
+    )
+    
+    return {
+        "lanes": lanes,
+        "total": len(lanes)
+    }
+
+
+@router.get("/lanes/{origin}/{destination}")
+async def lane_detail(
+    origin: str = Path(..., pattern=STATE_CODE),
+    destination: str = Path(..., pattern=STATE_CODE),
+    freight_type: Optional[str] = Query(None),
+    min_reviews: int = Query(1, ge=1, description="Leave out brokers with fewer reviews on the lane"),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """
+    One lane's totals plus stats for each broker on it
+    
+    Brokers are listed most reviewed first.
+    """
+    
+    origin, destination = origin.upper(), destination.upper()
+    lanes = reviews.lane_analytics
+    brokers = lanes.brokers_on_lane(origin, destination, freight_type=freight_type, min_reviews=min_reviews)
+    companies = await reviews.company_store.get_many(b["company_id"] for b in brokers[:limit])
+    
+    return {
+        "origin": origin,
+        "destination": destination,
+        "freight_type": freight_type,
+        "summary": lanes.lane_summary(origin, destination, freight_type=freight_type),
+        "brokers": [
+            {**broker, "legal_name": companies[broker["company_id"]]["legal_name"]}
+            for broker in brokers[:limit]
+            if broker["company_id"] in companies
+        ],
+        "total_brokers": len(brokers)
+    }
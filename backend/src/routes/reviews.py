@@ -3,11 +3,32 @@ Reviews API Routes
 Trucker-only rating system - Truckers rate brokers/shippers
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
-from pydantic import BaseModel, Field
+import asyncio
+import heapq
+import json
+import os
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
+from typing import Annotated, AsyncIterator, Dict, List, Optional
+from pydantic import BaseModel, Field, ValidationError
 from datetime import date, datetime
-from uuid import UUID
+from uuid import uuid4
+from src.services.company_facets import RATING_BUCKETS, FacetFilters, FacetIndex
+from src.services.company_rankings import RANKING_HORIZON_MONTHS, ranking_score, seed_ranking_scores
+from src.services.company_store import CompanyStore, InMemoryCompanyStore
+from src.services.company_trends import DEFAULT_TREND_MONTHS, month_range, trend_series
+from src.services.fuzzy_search import TrigramIndex
+from src.services.lane_analytics import LaneAnalytics
+from src.services.ranking_job import rescore_companies
+from src.services.review_search import ReviewSearchIndex, Watermark
+from src.services.review_store import InMemoryReviewStore, ReviewStore, decode_cursor, encode_cursor
+from src.services.sql_store import SQLCompanyStore, SQLReviewStore, SQLVersionRegistry
+from src.services.typeahead import PrefixIndex
+from src.services.versioning import VersionRegistry
+from src.services.vote_buffer import VoteBuffer
+from src.utils.config import get_database_config, get_search_config
+from src.utils.database import create_engine, create_tables
+from src.utils.http_cache import etag_matches, not_modified, set_cache_headers
+from src.utils.ndjson import iter_lines
 
 router = APIRouter()
 
@@ -15,15 +36,23 @@ router = APIRouter()
 # REQUEST/RESPONSE MODELS
 # ============================================
 
+# Reported issue codes share the company_issues.issue column width
+IssueCode = Annotated[str, Field(max_length=64)]
+
+# Two-letter state / province code - lane analytics groups on these
+StateCode = Annotated[str, Field(pattern=r"^[A-Za-z]{2}$")]
+
+
 class ReviewCreate(BaseModel):
-    company_id: str
+    # Length limits mirror the reviews table columns
+    company_id: str = Field(max_length=64)
     overall_rating: int = Field(ge=1, le=5)
     title: str = Field(max_length=255)
     content: str
     
     # Detailed ratings
     payment_rating: Optional[int] = Field(None, ge=1, le=5)
-    payment_speed: Optional[str] = None  # 'on_time', 'late', 'never_paid'
+    payment_speed: Optional[str] = Field(None, max_length=20)  # 'on_time', 'late', 'never_paid'
     days_to_payment: Optional[int] = None
     
     communication_rating: Optional[int] = Field(None, ge=1, le=5)
@@ -32,17 +61,22 @@ class ReviewCreate(BaseModel):
     
     # Load details
     load_date: Optional[date] = None
-    origin_city: Optional[str] = None
-    origin_state: Optional[str] = None
-    destination_city: Optional[str] = None
-    destination_state: Optional[str] = None
-    freight_type: Optional[str] = None
+    origin_city: Optional[str] = Field(None, max_length=100)
+    origin_state: Optional[StateCode] = None
+    destination_city: Optional[str] = Field(None, max_length=100)
+    destination_state: Optional[StateCode] = None
+    freight_type: Optional[str] = Field(None, max_length=50)
     
     # Issues
-    issues_reported: Optional[List[str]] = []
+    issues_reported: Optional[List[IssueCode]] = []
     would_work_again: Optional[bool] = None
 
 
+class ReviewImport(ReviewCreate):
+    """One line of a bulk import - historical reviews keep their original date"""
+    created_at: Optional[datetime] = None
+
+
 class CompanyResponseCreate(BaseModel):
     content: str = Field(min_length=10, max_length=2000)
     responder_name: str
@@ -50,6 +84,15 @@ class CompanyResponseCreate(BaseModel):
     responder_email: Optional[str] = None
 
 
+# Most IDs a single batch get may ask for
+MAX_BATCH_GET_IDS = 500
+
+
+class BatchGetRequest(BaseModel):
+    """IDs to fetch in one call - duplicates are answered once"""
+    ids: List[str] = Field(min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
 class ReviewResponse(BaseModel):
     id: str
     trucker_id: str
@@ -72,7 +115,7 @@ class ReviewResponse(BaseModel):
 # MOCK DATABASE (Replace with real DB later)
 # ============================================
 
-# Mock data storage
+# Mock data storage - seed reviews, served through the indexed review store
 mock_reviews = [
     {
         "id": "review-1",
@@ -92,6 +135,7 @@ mock_reviews = [
         "would_work_again": True,
         "status": "published",
         "helpful_count": 5,
+        "not_helpful_count": 0,
         "created_at": datetime.now().isoformat(),
         "company_response": None
     },
@@ -114,6 +158,7 @@ mock_reviews = [
         "issues_reported": ["rate_changed", "late_payment"],
         "status": "published",
         "helpful_count": 12,
+        "not_helpful_count": 1,
         "created_at": datetime.now().isoformat(),
         "company_response": {
             "content": "We apologize for the confusion. There was a miscommunication about detention charges. We have since corrected our process.",
@@ -124,7 +169,7 @@ mock_reviews = [
 ]
 
 mock_companies = {
-    "company-1": {"id": "company-1", "legal_name": "Swift Transportation", "dba_name": "Swift Freight", "entity_type": "BROKER", "mc_number": "12345", "dot_number": "123456", "phone": "(555) 123-4567", "physical_city": "Phoenix", "physical_state": "AZ", "overall_rating": 3.5, "review_count": 2, "payment_rating": 2.0, "communication_rating": 3.5, "professionalism_rating": 2.5, "honesty_rating": 2.5},
+    "company-1": {"id": "company-1", "legal_name": "Swift Transportation", "dba_name": "Swift Freight", "entity_type": "BROKER", "mc_number": "12345", "dot_number": "123456", "phone": "(555) 123-4567", "physical_city": "Phoenix", "physical_state": "AZ", "overall_rating": 3.5, "review_count": 2, "payment_rating": 2.0, "communication_rating": 3.5, "professionalism_rating": 2.5, "honesty_rating": 2.5, "has_payment_issues": True},
     "company-2": {"id": "company-2", "legal_name": "J.B. Hunt Transport", "entity_type": "BROKER", "mc_number": "67890", "dot_number": "789012", "phone": "(555) 987-6543", "physical_city": "Lowell", "physical_state": "AR", "overall_rating": 4.5, "review_count": 0},
     
     # Top Rated Brokers
@@ -173,34 +218,220 @@ mock_companies = {
 }
 
 # ============================================
-# ROUTES
+# STORAGE
 # ============================================
 
-@router.post("/reviews", status_code=201)
-async def create_review(review: ReviewCreate):
+# Active stores - mock data in memory by default, replaced with SQL
+# stores by init_storage() when database.backend is 'sql'
+review_store: ReviewStore = InMemoryReviewStore(mock_reviews)
+seed_ranking_scores(mock_companies.values())
+company_store: CompanyStore = InMemoryCompanyStore(mock_companies)
+_engine = None
+
+# Every company's ranking score is recomputed this often, so stored scores
+# share one "now" and current priors (see src/services/ranking_job.py)
+RESCORE_INTERVAL_SECONDS = 6 * 60 * 60
+_rescore_task: Optional[asyncio.Task] = None
+
+# Helpful/not-helpful votes are buffered and written to the store in batches
+vote_buffer = VoteBuffer(flush_to=lambda deltas: review_store.apply_counts(deltas))
+
+# Bumped on every write that changes a company's profile or review listing;
+# ETags are derived from these so conditional GETs skip all data access.
+# In process memory for the memory backend, in the database for 'sql'.
+company_versions: VersionRegistry = VersionRegistry()
+
+# In-process search indexes, built from the company store
+company_suggest_index = PrefixIndex()   # typeahead over names and MC/DOT numbers
+company_fuzzy_index = TrigramIndex()    # typo-tolerant name search
+company_facets = FacetIndex()           # bitmap filters and counts for browsing
+review_search_index = ReviewSearchIndex()  # full-text search over review title/content
+lane_analytics = LaneAnalytics()           # columnar load details for lane stats
+
+
+def build_company_indexes(companies: List[Dict]):
+    """(Re)build the in-process company search indexes"""
+    global company_suggest_index, company_fuzzy_index, company_facets
+    
+    suggest_index = PrefixIndex()
+    suggest_index.add_many(companies)
+    fuzzy_index = TrigramIndex()
+    facets = FacetIndex()
+    facets.add_many(companies)
+    for company in companies:
+        fuzzy_index.add(company)
+    
+    company_suggest_index, company_fuzzy_index, company_facets = suggest_index, fuzzy_index, facets
+
+
+async def walk_reviews(newer_than: Optional[Watermark] = None) -> AsyncIterator[Dict]:
+    """Every review newest first in keyset pages, optionally stopping at a watermark"""
+    page_size = 1000
+    after = None
+    while True:
+        page = await review_store.list_reviews(limit=page_size, after=after)
+        for review in page:
+            if newer_than and (review["created_at"], review["id"]) <= newer_than:
+                return
+            yield review
+        if len(page) < page_size:
+            return
+        after = (page[-1]["created_at"], page[-1]["id"])
+
+
+async def load_review_search_index() -> ReviewSearchIndex:
     """
-    Create a review - TRUCKER ONLY
+    Review search index for the active store
     
-    IMPORTANT: In production, this requires authentication.
-    For now, anyone can create reviews (for testing).
+    Starts from the configured snapshot and indexes only reviews newer than
+    it. Falls back to a full build when there is no snapshot or it does not
+    cover the store (e.g. reviews imported with older dates).
     """
+    path = get_search_config()["snapshot_path"]
+    index = None
     
-    # Validate company exists
-    if review.company_id not in mock_companies:
-        raise HTTPException(status_code=404, detail="Company not found")
+    if path and os.path.exists(path):
+        try:
+            index = ReviewSearchIndex.load(path)
+        except Exception as e:
+            print(f"✗ Error loading search snapshot {path}: {e}")
     
-    company = mock_companies[review.company_id]
+    if index is not None:
+        async for review in walk_reviews(newer_than=index.watermark):
+            index.add(review)
+        if len(index) == await review_store.count():
+            print(f"✓ Review search index loaded from snapshot ({len(index)} reviews)")
+            return index
+        print("✗ Search snapshot does not match the review store - rebuilding")
     
-    # CRITICAL: Check if company is a broker/shipper (not carrier)
-    if company["entity_type"] not in ["BROKER", "SHIPPER"]:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot review {company['entity_type']}. Only brokers and shippers can be reviewed."
-        )
+    index = ReviewSearchIndex()
+    async for review in walk_reviews():
+        index.add(review)
+    return index
+
+
+async def build_lane_analytics() -> LaneAnalytics:
+    """Project every review in the store into lane analytics columns"""
+    lanes = LaneAnalytics()
+    async for review in walk_reviews():
+        lanes.add(review)
+    return lanes
+
+
+def save_review_search_index():
+    """Write the search index snapshot, if one is configured"""
+    path = get_search_config()["snapshot_path"]
+    if not path:
+        return
+    try:
+        review_search_index.save(path)
+        print(f"✓ Review search snapshot saved to {path}")
+    except Exception as e:
+        print(f"✗ Error saving search snapshot {path}: {e}")
+
+
+def refresh_company_rankings(company: Dict):
+    """Re-rank a company in the in-process indexes after its rating changes"""
+    company_suggest_index.update_score(company["id"], company.get("ranking_score"))
+    company_facets.add(company)
+
+
+def _rescored(company: Dict):
+    """Re-rank a company whose score the rescore job changed"""
+    refresh_company_rankings(company)
+    company_versions.bump(company["id"])
+
+
+async def rescore_rankings() -> int:
+    """Rescore every company as of this month - returns how many scores changed"""
+    return await rescore_companies(company_store, review_store, on_update=_rescored)
+
+
+async def _rescore_loop():
+    """Background loop - rescore every RESCORE_INTERVAL_SECONDS"""
+    while True:
+        await asyncio.sleep(RESCORE_INTERVAL_SECONDS)
+        try:
+            changed = await rescore_rankings()
+            print(f"✓ Rescored rankings ({changed} changed)")
+        except Exception as e:
+            print(f"✗ Error rescoring rankings: {e}")
+
+
+async def init_storage(backend: Optional[str] = None, database_url: Optional[str] = None):
+    """
+    Connect the configured storage backend - called on app startup
     
-    # Create mock review
-    new_review = {
-        "id": f"review-{len(mock_reviews) + 1}",
+    'memory' (default) keeps serving the mock data. 'sql' connects to
+    database.url, creates missing tables and seeds an empty database with
+    the mock data so development works out of the box.
+    
+    Args:
+        backend: 'memory' or 'sql' (defaults to database.backend)
+        database_url: Overrides database.url
+    """
+    global review_store, company_store, company_versions, review_search_index, lane_analytics, _engine, _rescore_task
+    
+    backend = backend or get_database_config()["backend"]
+    if backend == "sql":
+        _engine = create_engine(database_url)
+        await create_tables(_engine)
+        review_store = SQLReviewStore(_engine)
+        company_store = SQLCompanyStore(_engine)
+        company_versions = SQLVersionRegistry(_engine)
+        
+        if not await company_store.count():
+            await company_store.add_many(list(mock_companies.values()))
+            await review_store.add_many(mock_reviews)
+        
+        build_company_indexes(await company_store.list_companies())
+    
+    review_search_index = await load_review_search_index()
+    lane_analytics = await build_lane_analytics()
+    vote_buffer.start()
+    
+    # Scores stored before a restart may be decayed to an earlier month
+    await rescore_rankings()
+    _rescore_task = asyncio.create_task(_rescore_loop())
+
+
+async def close_storage():
+    """Flush buffered writes and release database connections - called on app shutdown"""
+    global _engine, _rescore_task
+    
+    if _rescore_task is not None:
+        _rescore_task.cancel()
+        try:
+            await _rescore_task
+        except asyncio.CancelledError:
+            pass
+        _rescore_task = None
+    
+    # Write buffered votes before the connections go away
+    await vote_buffer.stop()
+    save_review_search_index()
+    
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+
+
+build_company_indexes(list(mock_companies.values()))
+for _review in mock_reviews:
+    review_search_index.add(_review)
+    lane_analytics.add(_review)
+
+def storage_timestamp(value: datetime) -> str:
+    """ISO timestamp as stored - naive local time, so timestamps compare as strings"""
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value.isoformat()
+
+
+def new_review_record(review: ReviewCreate, created_at: Optional[datetime] = None) -> Dict:
+    """Review dict as stored, built from a validated request"""
+    return {
+        "id": f"review-{uuid4().hex[:12]}",
         "trucker_id": "current-user-id",  # Would come from auth
         "trucker_name": "Current User",    # Would come from auth
         "company_id": review.company_id,
@@ -218,21 +449,96 @@ async def create_review(review: ReviewCreate):
         "origin_state": review.origin_state,
         "destination_city": review.destination_city,
         "destination_state": review.destination_state,
+        "freight_type": review.freight_type,
         "would_work_again": review.would_work_again,
         "issues_reported": review.issues_reported or [],
         "status": "published",  # Would be 'pending' in production with moderation
         "helpful_count": 0,
-        "created_at": datetime.now().isoformat(),
+        "not_helpful_count": 0,
+        "created_at": storage_timestamp(created_at or datetime.now()),
         "company_response": None
     }
+
+
+def reviewable_error(company: Optional[Dict]) -> Optional[str]:
+    """Why a company cannot be reviewed, or None if it can"""
+    if not company:
+        return "Company not found"
+    # CRITICAL: Only brokers and shippers can be reviewed (not carriers)
+    if company["entity_type"] not in ["BROKER", "SHIPPER"]:
+        return f"Cannot review {company['entity_type']}. Only brokers and shippers can be reviewed."
+    return None
+
+
+async def refresh_company_stats(company_id: str):
+    """Copy a company's aggregate ratings and ranking score onto its record and re-rank it"""
+    aggregate = await review_store.company_aggregate(company_id)
+    fields = aggregate.company_fields()
     
-    mock_reviews.append(new_review)
+    # Recency-weighted Bayesian score from the monthly buckets
+    company = await company_store.get(company_id)
+    this_month = datetime.now().strftime("%Y-%m")
+    buckets = await review_store.company_trends(
+        company_id, since_month=month_range(this_month, RANKING_HORIZON_MONTHS + 1)[0]
+    )
+    prior = await company_store.rating_prior(company["entity_type"])
+    fields["ranking_score"] = ranking_score(buckets, prior, this_month)
     
-    # Update company ratings (simplified calculation)
-    company_reviews = [r for r in mock_reviews if r["company_id"] == review.company_id]
-    if company_reviews:
-        company["overall_rating"] = sum(r["overall_rating"] for r in company_reviews) / len(company_reviews)
-        company["review_count"] = len(company_reviews)
+    company = await company_store.update(company_id, fields)
+    refresh_company_rankings(company)
+    company_versions.bump(company_id)
+
+
+def batch_response(key: str, ids: List[str], found: Dict[str, Dict]) -> Response:
+    """
+    Batch get results keyed by requested ID, in request order
+    
+    IDs that do not exist get {"error": "not_found"} instead of failing the
+    whole batch. The body is encoded with one json.dumps over the whole
+    result rather than walked value by value by FastAPI's encoder.
+    """
+    body = {
+        key: {item_id: found.get(item_id) or {"error": "not_found"} for item_id in ids},
+        "found": len(found),
+        "missing": [item_id for item_id in ids if item_id not in found]
+    }
+    return Response(
+        content=json.dumps(body, separators=(",", ":"), default=str),
+        media_type="application/json"
+    )
+
+
+# ============================================
+# ROUTES
+# ============================================
+
+@router.post("/reviews", status_code=201)
+async def create_review(review: ReviewCreate):
+    """
+    Create a review - TRUCKER ONLY
+    
+    IMPORTANT: In production, this requires authentication.
+    For now, anyone can create reviews (for testing).
+    """
+    
+    # Validate company exists
+    company = await company_store.get(review.company_id)
+    if not company:
+        raise HTTPException(status_code=404, detail="Company not found")
+    
+    # CRITICAL: Check if company is a broker/shipper (not carrier)
+    error = reviewable_error(company)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+    
+    # Create mock review
+    new_review = new_review_record(review)
+    await review_store.add(new_review)
+    review_search_index.add(new_review)
+    lane_analytics.add(new_review)
+    
+    # Update company ratings from the incrementally maintained aggregate
+    await refresh_company_stats(review.company_id)
     
     return {
         "success": True,
@@ -241,47 +547,204 @@ async def create_review(review: ReviewCreate):
     }
 
 
+@router.post("/reviews/import")
+async def import_reviews(
+    request: Request,
+    batch_size: int = Query(5000, ge=1, le=50000),
+    max_errors: int = Query(1000, ge=0, le=10000, description="Stop listing errors after this many")
+):
+    """
+    Bulk import reviews from an NDJSON request body - ADMIN ONLY
+    
+    One ReviewCreate object per line (plus an optional original
+    created_at). The body is read as a stream and valid reviews are
+    inserted in batches; company ratings are recomputed once per affected
+    company at the end. Invalid lines are skipped and reported by line
+    number.
+    
+    IMPORTANT: In production, this requires admin authentication.
+    """
+    
+    imported = 0
+    failed = 0
+    errors = []
+    company_errors: Dict[str, Optional[str]] = {}  # company_id -> why it can't be reviewed
+    batch: List[Dict] = []
+    batch_lines: List[int] = []
+    
+    def report(line_number: int, error: str):
+        nonlocal failed
+        failed += 1
+        if len(errors) < max_errors:
+            errors.append({"line": line_number, "error": error})
+    
+    async def flush_batch():
+        nonlocal imported
+        try:
+            await review_store.add_many(batch)
+            imported += len(batch)
+            for new_review in batch:
+                review_search_index.add(new_review)
+                lane_analytics.add(new_review)
+        except Exception as e:
+            for line_number in batch_lines:
+                report(line_number, f"Insert failed: {e}")
+        batch.clear()
+        batch_lines.clear()
+    
+    async for line_number, line in iter_lines(request.stream()):
+        try:
+            review = ReviewImport.model_validate_json(line)
+        except ValidationError as e:
+            report(line_number, "; ".join(
+                f"{'.'.join(str(part) for part in err['loc']) or 'line'}: {err['msg']}"
+                for err in e.errors()
+            ))
+            continue
+        
+        if review.company_id not in company_errors:
+            company_errors[review.company_id] = reviewable_error(await company_store.get(review.company_id))
+        if company_errors[review.company_id]:
+            report(line_number, company_errors[review.company_id])
+            continue
+        
+        batch.append(new_review_record(review, created_at=review.created_at))
+        batch_lines.append(line_number)
+        if len(batch) >= batch_size:
+            await flush_batch()
+    
+    if batch:
+        await flush_batch()
+    
+    # One ratings refresh per affected company instead of one per review
+    affected = [company_id for company_id, error in company_errors.items() if error is None]
+    for company_id in affected:
+        await refresh_company_stats(company_id)
+    
+    return {
+        "success": failed == 0,
+        "imported": imported,
+        "failed": failed,
+        "companies_updated": len(affected),
+        "errors": errors,
+        "errors_truncated": failed > len(errors)
+    }
+
+
 @router.get("/reviews")
 async def list_reviews(
+    http_response: Response,
     company_id: Optional[str] = Query(None, description="Filter by company"),
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0, description="Legacy offset pagination"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     List reviews with optional company filter
+    
+    Pagination:
+    - Cursor mode: pass `after=<next_cursor>` to get the next page.
+      Pages are stable when new reviews arrive.
+    - Offset mode (legacy): pass `offset`
+    
+    Supports conditional GET: send the ETag back as If-None-Match and an
+    unchanged page is answered with 304.
     """
     
-    # Filter reviews
-    filtered_reviews = mock_reviews
-    if company_id:
-        filtered_reviews = [r for r in mock_reviews if r["company_id"] == company_id]
+    # Pending votes are overlaid on the page, so they are part of its tag
+    etag = await company_versions.etag(
+        company_id, "reviews", limit, offset, after, vote_buffer.generation(company_id)
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
     
-    # Sort by date (newest first)
-    sorted_reviews = sorted(filtered_reviews, key=lambda x: x["created_at"], reverse=True)
+    cursor = None
+    if after:
+        try:
+            cursor = decode_cursor(after)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
     
-    # Paginate
-    paginated_reviews = sorted_reviews[offset:offset + limit]
+    # Store keeps reviews pre-sorted by date (newest first) per company.
+    # Fetch one extra review to know whether another page exists.
+    page = await review_store.list_reviews(company_id, limit=limit + 1, offset=offset, after=cursor)
+    paginated_reviews = [vote_buffer.overlay(r) for r in page[:limit]]
+    has_more = len(page) > limit
     
+    set_cache_headers(http_response, etag)
     return {
         "reviews": paginated_reviews,
-        "total": len(filtered_reviews),
+        "total": await review_store.count(company_id),
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": encode_cursor(paginated_reviews[-1]) if has_more else None
     }
 
 
+@router.get("/reviews/search")
+async def search_reviews(
+    q: str = Query(..., min_length=2, description="Words to find in review titles and text"),
+    company_id: Optional[str] = Query(None),
+    state: Optional[str] = Query(None, min_length=2, max_length=2, description="Origin or destination state"),
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0, le=1000)
+):
+    """
+    Full-text search over review titles and content
+    
+    Words are matched by stem ("brokered" finds "brokers") and results
+    are ranked by relevance (BM25).
+    """
+    
+    results, total = review_search_index.search(
+        q, company_id=company_id, state=state, limit=limit, offset=offset
+    )
+    found = await review_store.get_many(review_id for review_id, _ in results)
+    
+    return {
+        "query": q,
+        "total": total,
+        "reviews": [
+            {**vote_buffer.overlay(found[review_id]), "score": round(score, 4)}
+            for review_id, score in results
+            if review_id in found
+        ]
+    }
+
+
+@router.post("/reviews:batchGet")
+async def batch_get_reviews(request: BatchGetRequest):
+    """
+    Get up to MAX_BATCH_GET_IDS reviews by ID in one call
+    
+    One store lookup for the whole batch (pending votes included).
+    Results are keyed by review ID; unknown IDs are marked not_found.
+    """
+    
+    review_ids = list(dict.fromkeys(request.ids))
+    found = await review_store.get_many(review_ids)
+    
+    return batch_response(
+        "reviews",
+        review_ids,
+        {review_id: vote_buffer.overlay(review) for review_id, review in found.items()}
+    )
+
+
 @router.get("/reviews/{review_id}")
 async def get_review(review_id: str):
     """
     Get a single review by ID
     """
     
-    review = next((r for r in mock_reviews if r["id"] == review_id), None)
+    review = await review_store.get(review_id)
     
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
     
-    return review
+    # Include votes that are still buffered
+    return vote_buffer.overlay(review)
 
 
 @router.post("/reviews/{review_id}/respond", status_code=201)
@@ -294,7 +757,7 @@ async def respond_to_review(review_id: str, response: CompanyResponseCreate):
     """
     
     # Find review
-    review = next((r for r in mock_reviews if r["id"] == review_id), None)
+    review = await review_store.get(review_id)
     
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
@@ -307,13 +770,16 @@ async def respond_to_review(review_id: str, response: CompanyResponseCreate):
         )
     
     # Add response (text only, NO rating)
-    review["company_response"] = {
-        "content": response.content,
-        "responder_name": response.responder_name,
-        "responder_title": response.responder_title,
-        "responder_email": response.responder_email,
-        "created_at": datetime.now().isoformat()
-    }
+    review = await review_store.update(review_id, {
+        "company_response": {
+            "content": response.content,
+            "responder_name": response.responder_name,
+            "responder_title": response.responder_title,
+            "responder_email": response.responder_email,
+            "created_at": datetime.now().isoformat()
+        }
+    })
+    company_versions.bump(review["company_id"])
     
     return {
         "success": True,
@@ -329,19 +795,28 @@ async def vote_on_review(
 ):
     """
     Mark review as helpful or not helpful
+    
+    Votes are coalesced in memory and persisted in batches; the counts
+    returned already include them.
     """
     
-    review = next((r for r in mock_reviews if r["id"] == review_id), None)
+    review = await review_store.get(review_id)
     
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
     
-    if vote_type == "helpful":
-        review["helpful_count"] += 1
+    # Buffered in memory and written to the store in batches - a full
+    # buffer is flushed in the background, never in this request
+    vote_buffer.record(review_id, vote_type, review["company_id"])
+    company_versions.bump(review["company_id"])
+    if vote_buffer.is_full:
+        vote_buffer.flush_soon()
     
+    review = vote_buffer.overlay(review)
     return {
         "success": True,
-        "helpful_count": review["helpful_count"]
+        "helpful_count": review["helpful_count"],
+        "not_helpful_count": review.get("not_helpful_count") or 0
     }
 
 
@@ -349,75 +824,236 @@ async def vote_on_review(
 # COMPANY ROUTES (For profile pages)
 # ============================================
 
+@router.get("/companies/suggest")
+async def suggest_companies(
+    q: str = Query(..., min_length=1, description="Partial company name, MC or DOT number"),
+    limit: int = Query(8, ge=1, le=20)
+):
+    """
+    Typeahead suggestions for the company search box
+    
+    Every word typed is matched as a prefix of a name word or of the
+    MC/DOT number. Results are best ranked first (by ranking score).
+    """
+    
+    company_ids = company_suggest_index.suggest(q, limit=limit)
+    companies = await company_store.get_many(company_ids)
+    
+    suggestions = []
+    for company_id in company_ids:
+        company = companies.get(company_id)
+        if not company:
+            continue
+        suggestions.append({
+            "id": company["id"],
+            "legal_name": company["legal_name"],
+            "dba_name": company.get("dba_name"),
+            "entity_type": company["entity_type"],
+            "mc_number": company.get("mc_number"),
+            "dot_number": company.get("dot_number"),
+            "overall_rating": company.get("overall_rating", 0)
+        })
+    
+    return {
+        "query": q,
+        "suggestions": suggestions
+    }
+
+
+@router.post("/companies:batchGet")
+async def batch_get_companies(request: BatchGetRequest):
+    """
+    Get up to MAX_BATCH_GET_IDS company profiles by ID in one call
+    
+    Each entry has the same company and stats as GET /companies/{id}.
+    Companies and their aggregates are each fetched in one store call.
+    Results are keyed by company ID; unknown IDs are marked not_found.
+    """
+    
+    company_ids = list(dict.fromkeys(request.ids))
+    companies = await company_store.get_many(company_ids)
+    aggregates = await review_store.company_aggregates(companies)
+    
+    return batch_response("companies", company_ids, {
+        company_id: {
+            "company": company,
+            "stats": aggregates[company_id].stats(average_rating=company.get("overall_rating", 0))
+        }
+        for company_id, company in companies.items()
+    })
+
+
 @router.get("/companies/{company_id}")
-async def get_company(company_id: str):
+async def get_company(
+    company_id: str,
+    http_response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get company details with ratings
+    
+    Supports conditional GET: an unchanged profile is answered with 304
+    before any stats are loaded.
     """
     
-    if company_id not in mock_companies:
+    etag = await company_versions.etag(company_id, "profile")
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    company = await company_store.get(company_id)
+    if not company:
         raise HTTPException(status_code=404, detail="Company not found")
     
-    company = mock_companies[company_id]
-    
-    # Get company reviews
-    company_reviews = [r for r in mock_reviews if r["company_id"] == company_id and r["status"] == "published"]
-    
-    # Calculate detailed stats
-    stats = {
-        "total_reviews": len(company_reviews),
-        "average_rating": company.get("overall_rating", 0),
-        "rating_distribution": {
-            "5_star": len([r for r in company_reviews if r["overall_rating"] == 5]),
-            "4_star": len([r for r in company_reviews if r["overall_rating"] == 4]),
-            "3_star": len([r for r in company_reviews if r["overall_rating"] == 3]),
-            "2_star": len([r for r in company_reviews if r["overall_rating"] == 2]),
-            "1_star": len([r for r in company_reviews if r["overall_rating"] == 1]),
-        },
-        "would_work_again_percent": (
-            len([r for r in company_reviews if r.get("would_work_again") == True]) / len(company_reviews) * 100
-            if company_reviews else 0
-        ),
-        "common_issues": []
-    }
+    # Stats come straight from the per-company aggregate - no review scan
+    aggregate = await review_store.company_aggregate(company_id)
+    stats = aggregate.stats(average_rating=company.get("overall_rating", 0))
     
+    set_cache_headers(http_response, etag)
     return {
         "company": company,
         "stats": stats
     }
 
 
+@router.get("/companies/{company_id}/trends")
+async def get_company_trends(
+    company_id: str,
+    http_response: Response,
+    months: int = Query(DEFAULT_TREND_MONTHS, ge=1, le=120),
+    end: Optional[str] = Query(None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Last month (YYYY-MM), default current"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Monthly rating trend for a company's profile charts
+    
+    One entry per month, oldest first, with review count, rating sums
+    and averages, and average days to payment. Read from pre-aggregated
+    monthly buckets - O(months), no matter how many reviews exist.
+    """
+    
+    end = end or datetime.now().strftime("%Y-%m")
+    etag = await company_versions.etag(company_id, "trends", months, end)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    company = await company_store.get(company_id)
+    if not company:
+        raise HTTPException(status_code=404, detail="Company not found")
+    
+    buckets = await review_store.company_trends(company_id, since_month=month_range(end, months)[0])
+    
+    set_cache_headers(http_response, etag)
+    return {
+        "company_id": company_id,
+        "months": trend_series(buckets, end, months)
+    }
+
+
 @router.get("/companies")
 async def search_companies(
     query: Optional[str] = Query(None, min_length=2),
-    entity_type: Optional[str] = Query(None),
-    limit: int = Query(10, ge=1, le=100)
+    entity_type: Optional[List[str]] = Query(None, description="Repeat to match any of several"),
+    physical_state: Optional[List[str]] = Query(None, description="Two-letter state; repeat to match any of several"),
+    rating_bucket: Optional[List[str]] = Query(None, description="4-5, 3-4, 2-3, 1-2 or unrated; repeatable"),
+    has_payment_issues: Optional[bool] = Query(None, description="Companies with reported payment issues"),
+    limit: int = Query(10, ge=1, le=100),
+    fuzzy: bool = Query(False, description="Typo-tolerant name matching")
 ):
     """
     Search companies by name or filters
+    
+    With fuzzy=true, misspelled names ("Swfit", "JB Hunt") still match.
+    Results are ranked by match score, then ranking score. Without a
+    query, companies are listed by ranking score - a Bayesian average of
+    their ratings weighted toward recent reviews.
+    
+    Filters are ORed within a facet and ANDed across facets. The facets
+    block has company counts per value under the other facets' filters,
+    from bitmap indexes. For a text search, filters and counts cover every
+    name match.
     """
     
-    results = list(mock_companies.values())
+    unknown_buckets = set(rating_bucket or ()) - set(RATING_BUCKETS)
+    if unknown_buckets:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown rating_bucket: {', '.join(sorted(unknown_buckets))}. Use one of {', '.join(RATING_BUCKETS)}"
+        )
     
-    # Filter by search query
-    if query:
-        query_lower = query.lower()
-        results = [
-            c for c in results
-            if query_lower in c["legal_name"].lower() 
-            or (c.get("dba_name") and query_lower in c["dba_name"].lower())
-            or (c.get("mc_number") and query_lower in c["mc_number"])
-        ]
+    filters: FacetFilters = {
+        "entity_type": [value.upper() for value in entity_type or ()],
+        "physical_state": [value.upper() for value in physical_state or ()],
+        "rating_bucket": list(rating_bucket or ()),
+        "has_payment_issues": [] if has_payment_issues is None else [str(has_payment_issues).lower()],
+    }
     
-    # Filter by entity type
-    if entity_type:
-        results = [c for c in results if c["entity_type"] == entity_type.upper()]
+    if query and fuzzy:
+        scores = dict(company_fuzzy_index.search(query))
+        within = company_facets.bits_of(scores)
+        match_ids = company_facets.filter_ids(scores, company_facets.select(filters, within=within))
+        matches = (await company_store.get_many(match_ids)).values()
+        top_matches = heapq.nsmallest(
+            limit, matches,
+            key=lambda c: (-scores[c["id"]], -(c.get("ranking_score") or 0))
+        )
+        return {
+            "companies": [
+                {**company, "match_score": scores[company["id"]]}
+                for company in top_matches
+            ],
+            "total": len(match_ids),
+            "facets": company_facets.counts(filters, within=within)
+        }
     
-    # Sort by rating
-    results = sorted(results, key=lambda x: x.get("overall_rating", 0), reverse=True)
+    if not query:
+        facets = company_facets.counts(filters)
+        
+        # Plain browse (at most one entity type): top of the ranking-score index
+        if len(filters["entity_type"]) <= 1 and not any(filters[f] for f in filters if f != "entity_type"):
+            selected_type = filters["entity_type"][0] if filters["entity_type"] else None
+            return {
+                "companies": await company_store.top_rated(selected_type, limit=limit),
+                "total": await company_store.count(selected_type),
+                "facets": facets
+            }
+        
+        # Faceted browse: bitset AND/OR, popcount total, best scores of the matches
+        bits = company_facets.select(filters)
+        top_ids = company_facets.top(bits, limit=limit)
+        found = await company_store.get_many(top_ids)
+        return {
+            "companies": [found[company_id] for company_id in top_ids if company_id in found],
+            "total": bits.bit_count(),
+            "facets": facets
+        }
     
+    # Text search - every name match becomes a bitset, then filters apply as for browsing
+    within = company_facets.bits_of(await company_store.search_ids(query))
+    bits = company_facets.select(filters, within=within)
+    top_ids = company_facets.top(bits, limit=limit)
+    found = await company_store.get_many(top_ids)
     return {
-        "companies": results[:limit],
-        "total": len(results)
+        "companies": [found[company_id] for company_id in top_ids if company_id in found],
+        "total": bits.bit_count(),
+        "facets": company_facets.counts(filters, within=within)
     }
 
+
+# ============================================
+# ISSUE ROUTES
+# ============================================
+
+@router.get("/issues/leaderboard")
+async def issue_leaderboard(limit: int = Query(10, ge=1, le=50)):
+    """
+    Most reported issues across all companies
+    
+    Served from the maintained issue counters - no review scan.
+    """
+    
+    overall = await review_store.overall_aggregate()
+    
+    return {
+        "total_reviews": overall.review_count,
+        "issues": overall.top_issues(limit)
+    }
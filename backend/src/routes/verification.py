@@ -3,11 +3,46 @@ DOT/MC Verification Routes
 Handles company verification through FMCSA database
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Annotated, AsyncIterator, Dict, List, Optional
 from src.services.fmcsa_service import fmcsa_service
+from src.utils.config import get_fmcsa_config
+from src.utils.ndjson import encode_line
 
 router = APIRouter()
 
+# Most numbers (MC + DOT) in one batch verification
+MAX_BATCH_VERIFY = 1000
+
+DigitString = Annotated[str, Field(pattern=r"^\d{1,10}$")]
+
+
+class BatchVerifyRequest(BaseModel):
+    mc_numbers: List[DigitString] = Field(default_factory=list, max_length=MAX_BATCH_VERIFY)
+    dot_numbers: List[DigitString] = Field(default_factory=list, max_length=MAX_BATCH_VERIFY)
+
+
+def verification_result(kind: str, number: str, result: Optional[Dict]) -> Dict:
+    """Response body for one MC ("mc") or DOT ("dot") lookup result"""
+    if result:
+        return {
+            "verified": True,
+            f"{kind}_number": number,
+            "company_name": result.get("company_name"),
+            "status": result.get("status"),
+            "safety_rating": result.get("safety_rating"),
+            "message": result.get("message", "Company verified successfully"),
+            "mock": result.get("mock", False)
+        }
+    return {
+        "verified": False,
+        f"{kind}_number": number,
+        "message": f"{kind.upper()} number not found in FMCSA database"
+    }
+
 
 @router.get("/verify/dot/{dot_number}")
 async def verify_dot_number(dot_number: str):
@@ -27,21 +62,7 @@ async def verify_dot_number(dot_number: str):
         )
     
     result = await fmcsa_service.verify_dot_number(dot_number)
-    
-    if result:
-        return {
-            "verified": True,
-            "dot_number": dot_number,
-            "company_name": result.get("company_name"),
-            "status": result.get("status"),
-            "message": result.get("message", "Company verified successfully")
-        }
-    else:
-        return {
-            "verified": False,
-            "dot_number": dot_number,
-            "message": "DOT number not found in FMCSA database"
-        }
+    return verification_result("dot", dot_number, result)
 
 
 @router.get("/verify/mc/{mc_number}")
@@ -62,19 +83,114 @@ async def verify_mc_number(mc_number: str):
         )
     
     result = await fmcsa_service.verify_mc_number(mc_number)
+    return verification_result("mc", mc_number, result)
+
+
+
+@router.get("/verify/broker/{mc_number}")
+async def verify_broker(
+    mc_number: str,
+    budget: Optional[float] = Query(None, gt=0, le=30, description="Latency budget in seconds (default fmcsa.latency_budget)")
+):
+    """
+    Verify that an MC number belongs to a BROKER (not a carrier)
     
-    if result:
-        return {
-            "verified": True,
-            "mc_number": mc_number,
-            "company_name": result.get("company_name"),
-            "status": result.get("status"),
-            "message": result.get("message", "Company verified successfully")
-        }
-    else:
+    IMPORTANT: This ensures truckers can only rate actual brokers,
+    not other carriers or entities.
+    
+    Returns:
+    - Broker information if valid, with its operating authority,
+      insurance (BIPD, bond/trust fund, cargo) and BASIC safety scores
+    - Error if MC is not a broker
+    
+    Answers within the latency budget: authority, insurance and basics
+    are fetched concurrently, and any that are still pending are left
+    null with their status in "sections" (ok, not_found, timeout, error,
+    unavailable).
+    """
+    if not mc_number.isdigit():
+        raise HTTPException(
+            status_code=400,
+            detail="MC number must contain only digits"
+        )
+    
+    try:
+        result = await fmcsa_service.verify_broker_by_mc(mc_number, latency_budget=budget)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="FMCSA did not answer within the latency budget"
+        )
+    
+    if not result:
         return {
             "verified": False,
+            "is_broker": False,
             "mc_number": mc_number,
-            "message": "MC number not found in FMCSA database"
+            "message": "MC number not found or not registered as a broker"
         }
+    
+    return {
+        **verification_result("mc", mc_number, result),
+        "is_broker": True,
+        "entity_type": result.get("entity_type"),
+        "dot_number": result.get("dot_number"),
+        "authority": result.get("authority"),
+        "insurance": result.get("insurance"),
+        "basics": result.get("basics"),
+        "sections": result.get("sections")
+    }
+
 
+@router.post("/verify/batch")
+async def verify_batch(request: BatchVerifyRequest):
+    """
+    Verify many MC and DOT numbers in one call
+    
+    Streams one NDJSON line per distinct number as soon as its lookup
+    finishes (completion order, not request order). Each line has the
+    lookup "type" ("mc" or "dot") plus the same fields as the single
+    verify endpoints. A lookup that fails upstream has "error" set and
+    does not stop the batch.
+    
+    Lookups run fmcsa.batch_concurrency at a time, go through the
+    verification cache, and upstream calls stay within the service's
+    rate limit.
+    """
+    lookups = list(dict.fromkeys(
+        [("mc", number) for number in request.mc_numbers] +
+        [("dot", number) for number in request.dot_numbers]
+    ))
+    if len(lookups) > MAX_BATCH_VERIFY:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {MAX_BATCH_VERIFY} numbers per batch"
+        )
+    
+    semaphore = asyncio.Semaphore(get_fmcsa_config()["batch_concurrency"])
+    
+    async def verify(kind: str, number: str) -> Dict:
+        async with semaphore:
+            try:
+                result = await fmcsa_service.lookup(kind, number)
+            except Exception as e:
+                return {
+                    "type": kind,
+                    "verified": False,
+                    f"{kind}_number": number,
+                    "error": str(e) or type(e).__name__,
+                    "message": "FMCSA lookup failed - try again later"
+                }
+        return {"type": kind, **verification_result(kind, number, result)}
+    
+    async def stream() -> AsyncIterator[bytes]:
+        tasks = [asyncio.create_task(verify(kind, number)) for kind, number in lookups]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield encode_line(await finished)
+        finally:
+            # Client went away - stop the lookups that have not run yet
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
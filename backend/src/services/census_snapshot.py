@@ -0,0 +1,254 @@
+"""
+FMCSA Census Snapshot
+Local, memory-mapped lookup index built from the FMCSA company census file
+
+FMCSA publishes the full carrier/broker census as a bulk CSV. Ingesting it
+(scripts/ingest_census.py) writes one snapshot file:
+
+    header | DOT keys | DOT locations | MC keys | MC locations | records
+
+Keys are sorted uint64 numbers and locations are (offset, length) pairs
+into the record section, where each company is one compact JSON object.
+The file is opened with mmap and the key arrays are read in place
+through NumPy, so a lookup is a binary search (np.searchsorted) plus one
+JSON decode - microseconds, no network, and nothing loaded up front
+beyond the pages a search touches.
+"""
+
+import csv
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+import numpy as np
+
+SNAPSHOT_MAGIC = b"CBCENSUS"
+SNAPSHOT_VERSION = 1
+
+# magic, version, built_at (unix seconds), DOT entries, MC entries
+_HEADER = struct.Struct("<8sIdQQ")
+_HEADER_SIZE = 64   # padded so the key arrays start 8-byte aligned
+
+_KEY = np.dtype("<u8")
+_LOCATION = np.dtype([("offset", "<u8"), ("length", "<u4")])
+
+# Census CSV columns read for each field (first one present wins, any case)
+FIELD_COLUMNS = {
+    "dot_number": ("DOT_NUMBER", "USDOT_NUMBER"),
+    "mc_number": ("MC_NUMBER", "DOCKET_NUMBER", "DOCKET1"),
+    "company_name": ("LEGAL_NAME",),
+    "dba_name": ("DBA_NAME",),
+    "status": ("OPERATING_STATUS", "STATUS_CODE"),
+    "safety_rating": ("SAFETY_RATING",),
+    "entity_type": ("ENTITY_TYPE",),
+    "phone": ("TELEPHONE", "PHONE"),
+    "total_drivers": ("DRIVER_TOTAL", "TOTAL_DRIVERS"),
+    "total_power_units": ("NBR_POWER_UNIT", "TOTAL_POWER_UNITS"),
+    "mcs150_mileage": ("MCS150_MILEAGE",),
+    "mcs150_year": ("MCS150_MILEAGE_YEAR",),
+}
+ADDRESS_COLUMNS = {
+    "street": ("PHY_STREET",),
+    "city": ("PHY_CITY",),
+    "state": ("PHY_STATE",),
+    "zip": ("PHY_ZIP",),
+}
+INTEGER_FIELDS = ("total_drivers", "total_power_units", "mcs150_mileage")
+
+
+def number_key(number: Optional[str]) -> Optional[int]:
+    """
+    Lookup key for an MC or DOT number - its digits as an int
+
+    "MC-012345", "12345" and "012345" share a key. Returns None when
+    there are no digits.
+    """
+    digits = "".join(ch for ch in number or "" if ch.isdigit())
+    return int(digits) if digits and len(digits) <= 19 else None
+
+
+def _column(row: Dict[str, str], names: Tuple[str, ...]) -> Optional[str]:
+    """First of the named columns present in a row, stripped (blank = None)"""
+    for name in names:
+        value = row.get(name)
+        if value is not None:
+            value = value.strip()
+            return value or None
+    return None
+
+
+def census_record(row: Dict[str, str]) -> Dict:
+    """
+    A census CSV row (upper-cased column names) in verify_*_number's shape
+
+    A DOCKET1 number only counts as an MC number when DOCKET1PREFIX, if
+    present, is "MC" (not FF or MX).
+    """
+    record = {field: _column(row, names) for field, names in FIELD_COLUMNS.items()}
+    prefix = _column(row, ("DOCKET1PREFIX",))
+    if prefix and prefix.upper() != "MC" and not _column(row, ("MC_NUMBER", "DOCKET_NUMBER")):
+        record["mc_number"] = None
+    for field in ("dot_number", "mc_number"):
+        key = number_key(record[field])
+        record[field] = str(key) if key is not None else None
+    for field in INTEGER_FIELDS:
+        value = record[field]
+        record[field] = int(value) if value and value.isdigit() else None
+    if record["entity_type"]:
+        record["entity_type"] = record["entity_type"].upper()
+    record["physical_address"] = {field: _column(row, names) for field, names in ADDRESS_COLUMNS.items()}
+    return record
+
+
+def read_census_csv(path: str) -> Iterator[Dict]:
+    """Census CSV rows as records, streamed (rows without a DOT or MC number are skipped)"""
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        reader = csv.reader(f)
+        header = [name.strip().upper() for name in next(reader, [])]
+        for values in reader:
+            record = census_record(dict(zip(header, values)))
+            if record["dot_number"] or record["mc_number"]:
+                yield record
+
+
+def build_snapshot(records: Iterable[Dict], path: str) -> Dict[str, int]:
+    """
+    Write a snapshot file from census records
+
+    Records are streamed to a scratch file; only the keys and offsets are
+    held in memory. The snapshot is written next to `path` and renamed
+    into place, so a running server keeps reading the old one.
+
+    Returns:
+        {"records": ..., "dot_numbers": ..., "mc_numbers": ...}
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    # Per index: keys, record offsets, record lengths (compact arrays, not lists of ints)
+    indexes = {kind: (array("Q"), array("Q"), array("I")) for kind in ("dot", "mc")}
+    count = 0
+
+    with tempfile.TemporaryFile(dir=directory) as scratch:
+        offset = 0
+        for record in records:
+            payload = json.dumps(record, separators=(",", ":")).encode()
+            scratch.write(payload)
+            for kind in ("dot", "mc"):
+                key = number_key(record.get(f"{kind}_number"))
+                if key is not None:
+                    keys, offsets, lengths = indexes[kind]
+                    keys.append(key)
+                    offsets.append(offset)
+                    lengths.append(len(payload))
+            offset += len(payload)
+            count += 1
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(_HEADER.pack(
+                    SNAPSHOT_MAGIC, SNAPSHOT_VERSION, time.time(),
+                    len(indexes["dot"][0]), len(indexes["mc"][0])
+                ))
+                out.write(b"\0" * (_HEADER_SIZE - _HEADER.size))
+                for keys, offsets, lengths in indexes.values():
+                    key_array = np.frombuffer(keys, dtype=_KEY) if keys else np.empty(0, dtype=_KEY)
+                    order = np.argsort(key_array, kind="stable")
+                    locations = np.empty(len(keys), dtype=_LOCATION)
+                    if keys:
+                        locations["offset"] = np.frombuffer(offsets, dtype="<u8")
+                        locations["length"] = np.frombuffer(lengths, dtype="<u4")
+                    out.write(key_array[order].tobytes())
+                    out.write(locations[order].tobytes())
+                    out.write(b"\0" * (-out.tell() % 8))
+                scratch.seek(0)
+                while True:
+                    chunk = scratch.read(1 << 20)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    return {"records": count, "dot_numbers": len(indexes["dot"][0]), "mc_numbers": len(indexes["mc"][0])}
+
+
+class CensusSnapshot:
+    """
+    Read-only lookups against a snapshot file
+
+    Usage:
+        census = CensusSnapshot.open("data/census.snapshot")
+        census.get("mc", "123456")     # record dict, or None if not in the census
+        census.get("dot", "3000001")
+        census.close()
+    """
+
+    def __init__(self, path: str, buffer: mmap.mmap):
+        self.path = path
+        self._mmap = buffer
+        magic, version, self.built_at, dot_count, mc_count = _HEADER.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} census snapshot")
+
+        # Zero-copy views over the mapped file
+        self._indexes = {}
+        position = _HEADER_SIZE
+        for kind, count in (("dot", dot_count), ("mc", mc_count)):
+            keys = np.frombuffer(buffer, dtype=_KEY, count=count, offset=position)
+            position += count * _KEY.itemsize
+            locations = np.frombuffer(buffer, dtype=_LOCATION, count=count, offset=position)
+            position += count * _LOCATION.itemsize
+            position += -position % 8
+            self._indexes[kind] = (keys, locations)
+        self._data_start = position
+
+    @classmethod
+    def open(cls, path: str) -> "CensusSnapshot":
+        """
+        Map a snapshot file
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If it is not a snapshot
+        """
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(path, buffer)
+        except Exception:
+            buffer.close()
+            raise
+
+    def get(self, kind: str, number: str) -> Optional[Dict]:
+        """Census record for an MC ("mc") or DOT ("dot") number, or None"""
+        key = number_key(number)
+        if key is None:
+            return None
+        keys, locations = self._indexes[kind]
+        # A uint64 key - a Python int would make NumPy convert the whole array first
+        position = int(np.searchsorted(keys, np.uint64(key)))
+        if position == len(keys) or keys[position] != key:
+            return None
+        offset, length = locations[position].item()
+        start = self._data_start + offset
+        return json.loads(self._mmap[start:start + length])
+
+    def stats(self) -> Dict:
+        """What the snapshot holds and when it was built"""
+        return {
+            "path": self.path,
+            "dot_numbers": len(self._indexes["dot"][0]),
+            "mc_numbers": len(self._indexes["mc"][0]),
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.built_at)),
+        }
+
+    def close(self):
+        """Unmap the file"""
+        self._indexes = {}
+        self._mmap.close()
@@ -0,0 +1,226 @@
+"""
+Company Facets
+Bitmap indexes for faceted company browsing
+
+Every company gets a dense number, and every facet value (entity type,
+state, rating bucket, has payment issues) keeps a bitset of the companies
+that have it - a plain Python int. Filters are bitwise OR within a facet
+and AND across facets, and facet counts are popcounts (int.bit_count), so
+filtering and counting never loop over companies.
+"""
+
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+
+# Facets, in response order
+FACETS = ("entity_type", "physical_state", "rating_bucket", "has_payment_issues")
+
+# Rating buckets, best first - a bucket holds ratings from its lower bound up to the next
+RATING_BUCKETS = ("4-5", "3-4", "2-3", "1-2", "unrated")
+
+# Selected values per facet, e.g. {"physical_state": ["TX", "CA"]}
+FacetFilters = Dict[str, List[str]]
+
+
+def rating_bucket(rating: Optional[float]) -> str:
+    """Bucket label for an overall rating"""
+    if not rating:
+        return "unrated"
+    low = min(max(int(rating), 1), 4)
+    return f"{low}-{low + 1}"
+
+
+def facet_values(company: Dict) -> Dict[str, Optional[str]]:
+    """A company's value for every facet (None = not indexed under that facet)"""
+    state = company.get("physical_state")
+    return {
+        "entity_type": company["entity_type"],
+        "physical_state": state.upper() if state else None,
+        "rating_bucket": rating_bucket(company.get("overall_rating")),
+        "has_payment_issues": "true" if company.get("has_payment_issues") else "false",
+    }
+
+
+class FacetIndex:
+    """
+    Per-value company bitsets with filtering, facet counts and ranked pages
+
+    Usage:
+        facets = FacetIndex()
+        facets.add_many(companies)
+        facets.add(company)            # new or changed company
+        bits = facets.select({"physical_state": ["TX", "CA"], "rating_bucket": ["4-5"]})
+        facets.top(bits, limit=10)     # company IDs, best ranking_score first
+        facets.counts({"physical_state": ["TX"]})
+    """
+
+    def __init__(self):
+        self._doc_numbers: Dict[str, int] = {}                    # company ID -> bit position
+        self._company_ids: List[Optional[str]] = []               # bit position -> company ID
+        self._values: List[Dict[str, Optional[str]]] = []         # bit position -> facet values
+        self._bits: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+        self._live = 0                                            # every indexed company
+        self._scores = np.zeros(1024, dtype=np.float64)           # bit position -> ranking_score
+
+    def __len__(self) -> int:
+        return len(self._doc_numbers)
+
+    def _set(self, doc: int, values: Dict[str, Optional[str]], on: bool):
+        """Set (or clear) a company's bit in each of its value bitsets"""
+        bit = 1 << doc
+        for facet, value in values.items():
+            if value is None:
+                continue
+            bitsets = self._bits[facet]
+            if on:
+                bitsets[value] = bitsets.get(value, 0) | bit
+            else:
+                bitsets[value] &= ~bit
+                if not bitsets[value]:
+                    del bitsets[value]
+
+    def _new_doc(self, company_id: str) -> int:
+        """Assign the next bit position to a company"""
+        doc = self._doc_numbers[company_id] = len(self._company_ids)
+        self._company_ids.append(company_id)
+        self._values.append({})
+        if doc == len(self._scores):
+            self._scores = np.concatenate([self._scores, np.zeros_like(self._scores)])
+        return doc
+
+    def add(self, company: Dict):
+        """Index a company, or re-index it after a change"""
+        doc = self._doc_numbers.get(company["id"])
+        if doc is None:
+            doc = self._new_doc(company["id"])
+            self._live |= 1 << doc
+
+        values = facet_values(company)
+        if values != self._values[doc]:
+            self._set(doc, self._values[doc], False)
+            self._set(doc, values, True)
+            self._values[doc] = values
+        self._scores[doc] = company.get("ranking_score") or 0
+
+    def add_many(self, companies: Iterable[Dict]):
+        """
+        Index a batch of new companies
+
+        Bits are collected in byte buffers and turned into ints once per
+        value - adding one at a time would rebuild every bitset per company.
+        """
+        new_docs = []
+        for company in companies:
+            if company["id"] in self._doc_numbers:
+                self.add(company)
+                continue
+            doc = self._new_doc(company["id"])
+            self._values[doc] = facet_values(company)
+            self._scores[doc] = company.get("ranking_score") or 0
+            new_docs.append(doc)
+
+        buffers: Dict[tuple, bytearray] = {}
+        live = bytearray((len(self._company_ids) + 7) // 8)
+        for doc in new_docs:
+            byte, bit = doc >> 3, 1 << (doc & 7)
+            live[byte] |= bit
+            for facet, value in self._values[doc].items():
+                if value is not None:
+                    buffer = buffers.get((facet, value))
+                    if buffer is None:
+                        buffer = buffers[(facet, value)] = bytearray(len(live))
+                    buffer[byte] |= bit
+
+        self._live |= int.from_bytes(live, "little")
+        for (facet, value), buffer in buffers.items():
+            bitsets = self._bits[facet]
+            bitsets[value] = bitsets.get(value, 0) | int.from_bytes(buffer, "little")
+
+    def remove(self, company_id: str):
+        """Drop a company from every bitset"""
+        doc = self._doc_numbers.pop(company_id, None)
+        if doc is None:
+            return
+        self._set(doc, self._values[doc], False)
+        self._live &= ~(1 << doc)
+        self._company_ids[doc] = None
+        self._values[doc] = {}
+
+    def _facet_bits(self, facet: str, values: Iterable[str]) -> int:
+        """Companies with any of the values (OR)"""
+        bits = 0
+        bitsets = self._bits[facet]
+        for value in values:
+            bits |= bitsets.get(value, 0)
+        return bits
+
+    def bits_of(self, company_ids: Iterable[str]) -> int:
+        """Bitset of the given (indexed) companies"""
+        mask = bytearray((len(self._company_ids) + 7) // 8)
+        for company_id in company_ids:
+            doc = self._doc_numbers.get(company_id)
+            if doc is not None:
+                mask[doc >> 3] |= 1 << (doc & 7)
+        return int.from_bytes(mask, "little")
+
+    def select(self, filters: FacetFilters, within: Optional[int] = None, skip: Optional[str] = None) -> int:
+        """
+        Companies matching the filters - OR within a facet, AND across facets
+
+        Args:
+            filters: Selected values per facet (empty = no filter)
+            within: Only companies in this bitset (e.g. search matches)
+            skip: Ignore this facet's filter (for its own counts)
+        """
+        bits = self._live if within is None else within & self._live
+        for facet, values in filters.items():
+            if values and facet != skip:
+                bits &= self._facet_bits(facet, values)
+        return bits
+
+    def counts(self, filters: FacetFilters, within: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Companies per facet value under the current filters
+
+        Each facet is counted with every filter except its own, so the
+        counts show what selecting another value of that facet would give.
+        Values with no companies are left out unless selected.
+        """
+        result = {}
+        for facet in FACETS:
+            base = self.select(filters, within=within, skip=facet)
+            selected = set(filters.get(facet) or ())
+            counts = {}
+            for value, bits in self._bits[facet].items():
+                count = (bits & base).bit_count()
+                if count or value in selected:
+                    counts[value] = count
+            for value in selected - counts.keys():
+                counts[value] = 0
+            result[facet] = dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+        return result
+
+    def _positions(self, bits: int) -> np.ndarray:
+        """Bit positions set in a bitset"""
+        mask = np.frombuffer(bits.to_bytes((len(self._company_ids) + 7) // 8 or 1, "little"), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(mask, bitorder="little"))
+
+    def top(self, bits: int, limit: int = 10, offset: int = 0) -> List[str]:
+        """Company IDs in a bitset, best ranking_score first (ties in index order)"""
+        docs = self._positions(bits)
+        wanted = offset + limit
+        if len(docs) > wanted:
+            # Partial selection of the best scores, then order just those
+            docs = docs[np.argpartition(-self._scores[docs], wanted - 1)[:wanted]]
+        docs = docs[np.lexsort((docs, -self._scores[docs]))][offset:wanted]
+        return [self._company_ids[doc] for doc in docs.tolist()]
+
+    def filter_ids(self, company_ids: Iterable[str], bits: int) -> List[str]:
+        """Keep the companies (in their given order) that are in a bitset"""
+        mask = bits.to_bytes((len(self._company_ids) + 7) // 8 or 1, "little")
+        kept = []
+        for company_id in company_ids:
+            doc = self._doc_numbers.get(company_id)
+            if doc is not None and mask[doc >> 3] >> (doc & 7) & 1:
+                kept.append(company_id)
+        return kept
@@ -0,0 +1,196 @@
+"""
+Company Rankings
+Pre-sorted company views by ranking score, maintained incrementally
+
+A company's ranking score is a Bayesian average: its overall ratings are
+blended with RANKING_PRIOR_WEIGHT pseudo-reviews at its entity type's
+average rating, so one 5-star review does not outrank a 4.8 over hundreds
+of reviews. Reviews are weighted by recency (the weight halves every
+RANKING_HALF_LIFE_MONTHS), read from the monthly trend buckets. The score
+is stored on the company record whenever its reviews change, and every
+company is rescored on a schedule (src/services/ranking_job.py) so scores
+stay decayed to the same month.
+
+Keeps one view per entity type (plus one over all companies) sorted best
+ranked first, and a company count per view. "Top 10 brokers" is a slice
+of a view - no filtering or sorting per request.
+"""
+
+from bisect import bisect_left, insort
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.services.company_trends import TrendBucket, month_index
+
+# Sort key: best score first, ties in the order companies were added
+RankKey = Tuple[float, int]
+
+# Pseudo-reviews at the entity type's average every company starts with
+RANKING_PRIOR_WEIGHT = 10
+
+# Prior for an entity type with no rated companies yet
+DEFAULT_PRIOR_RATING = 3.0
+
+# A review's ranking weight halves every half-life; older buckets are ignored
+RANKING_HALF_LIFE_MONTHS = 12
+RANKING_HORIZON_MONTHS = 120
+
+# Company fields that move a company in the views (or in its type's prior)
+RANKED_FIELDS = ("ranking_score", "overall_rating", "review_count")
+
+
+def bayesian_score(rating_sum: float, rating_weight: float, prior: float) -> float:
+    """Average rating shrunk toward the prior: (prior * C + sum) / (C + weight)"""
+    return round(
+        (prior * RANKING_PRIOR_WEIGHT + rating_sum) / (RANKING_PRIOR_WEIGHT + rating_weight),
+        4
+    )
+
+
+def ranking_score(buckets: Dict[str, TrendBucket], prior: float, as_of_month: str) -> float:
+    """
+    Recency-weighted Bayesian average of a company's overall ratings
+
+    Args:
+        buckets: The company's monthly trend buckets
+        prior: Average rating for the company's entity type
+        as_of_month: Current month ("YYYY-MM") - review ages count from here
+
+    Returns:
+        Ranking score (1-5 scale)
+    """
+    now = month_index(as_of_month)
+    rating_sum = rating_weight = 0.0
+    for month, bucket in buckets.items():
+        age = max(now - month_index(month), 0)
+        if age > RANKING_HORIZON_MONTHS:
+            continue
+        weight = 0.5 ** (age / RANKING_HALF_LIFE_MONTHS)
+        rating_sum += weight * bucket.rating_sums["overall_rating"]
+        rating_weight += weight * bucket.rating_counts["overall_rating"]
+    return bayesian_score(rating_sum, rating_weight, prior)
+
+
+def seed_ranking_score(company: Dict, prior: float) -> float:
+    """Score from a company's stored rating and review count (no review dates to decay)"""
+    review_count = company.get("review_count") or 0
+    return bayesian_score((company.get("overall_rating") or 0) * review_count, review_count, prior)
+
+
+def seed_ranking_scores(companies: Iterable[Dict]):
+    """Fill in ranking_score for companies that do not have one yet"""
+    companies = list(companies)
+    views = RatingViews()
+    for company in companies:
+        views.add(company)
+    for company in companies:
+        if company.get("ranking_score") is None:
+            company["ranking_score"] = seed_ranking_score(company, views.prior(company["entity_type"]))
+
+
+class RatingViews:
+    """
+    Per-entity-type company views ordered by ranking score
+
+    Also keeps each entity type's review-weighted average rating - the
+    prior ranking scores are shrunk toward.
+
+    Usage:
+        views = RatingViews()
+        views.add(company)
+        views.update(company)           # after its score or rating changed
+        views.top("BROKER", limit=10)   # company IDs, best first
+        views.count("BROKER")
+        views.prior("BROKER")
+    """
+
+    def __init__(self):
+        self._views: Dict[Optional[str], List[Tuple[RankKey, str]]] = {None: []}
+        self._entity_types: Dict[str, str] = {}
+        self._keys: Dict[str, RankKey] = {}
+        self._sequence = count()
+        self._prior_inputs: Dict[str, Tuple[float, int]] = {}   # company ID -> (rating, review count)
+        self._prior_sums: Dict[str, List[float]] = {}           # entity type -> [sum of rating * count, count]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, company_id: str) -> bool:
+        return company_id in self._keys
+
+    def _views_for(self, company_id: str) -> List[List[Tuple[RankKey, str]]]:
+        """The overall view and the company's entity type view"""
+        entity_type = self._entity_types[company_id]
+        return [self._views[None], self._views.setdefault(entity_type, [])]
+
+    def _insert(self, company_id: str):
+        for view in self._views_for(company_id):
+            insort(view, (self._keys[company_id], company_id))
+
+    def _delete(self, company_id: str):
+        entry = (self._keys[company_id], company_id)
+        for view in self._views_for(company_id):
+            del view[bisect_left(view, entry)]
+
+    def _count_prior(self, company_id: str, sign: int):
+        """Add (or remove) a company's rating to its entity type's prior"""
+        rating, review_count = self._prior_inputs[company_id]
+        sums = self._prior_sums.setdefault(self._entity_types[company_id], [0.0, 0])
+        sums[0] += sign * rating * review_count
+        sums[1] += sign * review_count
+
+    def sort_key(self, company_id: str) -> RankKey:
+        """Ranking key for a company (smaller sorts first)"""
+        return self._keys[company_id]
+
+    def add(self, company: Dict):
+        """Add a company to its views"""
+        company_id = company["id"]
+        if company_id in self._keys:
+            self.remove(company_id)
+
+        self._entity_types[company_id] = company["entity_type"]
+        self._keys[company_id] = (-(company.get("ranking_score") or 0), next(self._sequence))
+        self._prior_inputs[company_id] = (company.get("overall_rating") or 0, company.get("review_count") or 0)
+        self._insert(company_id)
+        self._count_prior(company_id, 1)
+
+    def remove(self, company_id: str):
+        """Remove a company from its views"""
+        if company_id not in self._keys:
+            return
+        self._delete(company_id)
+        self._count_prior(company_id, -1)
+        del self._keys[company_id]
+        del self._prior_inputs[company_id]
+        del self._entity_types[company_id]
+
+    def update(self, company: Dict):
+        """Move a company to its new position after its score or rating changed"""
+        company_id = company["id"]
+        if company_id not in self._keys:
+            return
+
+        self._count_prior(company_id, -1)
+        self._prior_inputs[company_id] = (company.get("overall_rating") or 0, company.get("review_count") or 0)
+        self._count_prior(company_id, 1)
+
+        score, sequence = self._keys[company_id]
+        new_score = -(company.get("ranking_score") or 0)
+        if new_score != score:
+            self._delete(company_id)
+            self._keys[company_id] = (new_score, sequence)
+            self._insert(company_id)
+
+    def prior(self, entity_type: str) -> float:
+        """Review-weighted average rating of an entity type's companies"""
+        rating_sum, review_count = self._prior_sums.get(entity_type, (0.0, 0))
+        return rating_sum / review_count if review_count > 0 else DEFAULT_PRIOR_RATING
+
+    def top(self, entity_type: Optional[str] = None, limit: int = 10, offset: int = 0) -> List[str]:
+        """Best ranked company IDs, optionally for one entity type"""
+        view = self._views.get(entity_type, [])
+        return [company_id for _, company_id in view[offset:offset + limit]]
+
+    def count(self, entity_type: Optional[str] = None) -> int:
+        """Number of companies, optionally for one entity type"""
+        return len(self._views.get(entity_type, []))
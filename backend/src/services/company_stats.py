@@ -0,0 +1,172 @@
+"""
+Company Stats
+Incremental per-company rating aggregates
+
+Each company keeps running sums, counts, a 1-5 star histogram, the
+would-work-again tally and how often each issue was reported. Adding,
+editing or removing a review is O(1) and profile stats are read straight
+from the aggregate - no review scans.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional
+
+# Ratings averaged per company (overall plus the detailed sub-ratings)
+RATING_FIELDS = (
+    "overall_rating",
+    "payment_rating",
+    "communication_rating",
+    "professionalism_rating",
+    "honesty_rating",
+)
+
+# Fields that change a review's contribution to its company aggregates
+AGGREGATED_FIELDS = RATING_FIELDS + ("would_work_again", "issues_reported", "days_to_payment", "status")
+
+# Issues listed in a company's profile stats
+COMMON_ISSUES_LIMIT = 5
+
+# Reported issues that flag a company as having payment issues
+PAYMENT_ISSUES = ("late_payment", "non_payment", "short_pay", "rate_changed")
+
+
+def counts_toward_stats(review: Dict) -> bool:
+    """Only published reviews count toward company ratings"""
+    return review.get("status") == "published"
+
+
+def review_issues(review: Dict) -> Iterable[str]:
+    """Distinct issues a review reports (a repeated issue counts once)"""
+    return set(review.get("issues_reported") or ())
+
+
+class CompanyAggregate:
+    """
+    Running rating totals for one company
+
+    Usage:
+        aggregate = CompanyAggregate()
+        aggregate.add(review)
+        aggregate.average("payment_rating")
+        aggregate.stats()
+        aggregate.top_issues(3)
+    """
+
+    __slots__ = (
+        "review_count",
+        "rating_sums",
+        "rating_counts",
+        "histogram",
+        "would_work_again_count",
+        "issue_counts",
+    )
+
+    def __init__(self):
+        self.review_count = 0
+        self.rating_sums = {field: 0 for field in RATING_FIELDS}
+        self.rating_counts = {field: 0 for field in RATING_FIELDS}
+        self.histogram = [0] * 5  # index 0 = 1 star ... index 4 = 5 stars
+        self.would_work_again_count = 0
+        self.issue_counts: Dict[str, int] = {}  # issue -> reviews reporting it
+
+    def _apply(self, review: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) a review's contribution"""
+        self.review_count += sign
+
+        for field in RATING_FIELDS:
+            value = review.get(field)
+            if value is not None:
+                self.rating_sums[field] += sign * value
+                self.rating_counts[field] += sign
+
+        overall = review.get("overall_rating")
+        if overall is not None:
+            self.histogram[overall - 1] += sign
+
+        if review.get("would_work_again") is True:
+            self.would_work_again_count += sign
+
+        for issue in review_issues(review):
+            count = self.issue_counts.get(issue, 0) + sign
+            if count:
+                self.issue_counts[issue] = count
+            else:
+                del self.issue_counts[issue]
+
+    def add(self, review: Dict):
+        """Count a review"""
+        self._apply(review, 1)
+
+    def remove(self, review: Dict):
+        """Stop counting a review (on delete or before an edit)"""
+        self._apply(review, -1)
+
+    def average(self, field: str) -> Optional[float]:
+        """Average of a rating field, or None if no review rated it"""
+        if not self.rating_counts[field]:
+            return None
+        return self.rating_sums[field] / self.rating_counts[field]
+
+    def company_fields(self) -> Dict:
+        """
+        Aggregate ratings as company record fields
+
+        Sub-ratings nobody has rated yet are left out so the company keeps
+        its existing value.
+        """
+        fields = {
+            "review_count": self.review_count,
+            "has_payment_issues": self.has_payment_issues(),
+        }
+        for field in RATING_FIELDS:
+            value = self.average(field)
+            if value is not None:
+                fields[field] = value
+        return fields
+
+    def has_payment_issues(self) -> bool:
+        """Whether any counted review reports a payment issue"""
+        return any(self.issue_counts.get(issue) for issue in PAYMENT_ISSUES)
+
+    def top_issues(self, limit: int = COMMON_ISSUES_LIMIT) -> List[Dict]:
+        """
+        Most reported issues with counts and share of reviews
+
+        Returns:
+            [{"issue", "count", "percent"}] - most reported first
+        """
+        top = heapq.nsmallest(limit, self.issue_counts.items(), key=lambda item: (-item[1], item[0]))
+        return [
+            {
+                "issue": issue,
+                "count": count,
+                "percent": count / self.review_count * 100 if self.review_count else 0
+            }
+            for issue, count in top
+        ]
+
+    def stats(self, average_rating: Optional[float] = None) -> Dict:
+        """
+        Profile stats in the API response shape
+
+        Args:
+            average_rating: Displayed average (defaults to the aggregate's own)
+
+        Returns:
+            Stats dict for the company profile
+        """
+        if average_rating is None:
+            average_rating = self.average("overall_rating") or 0
+
+        return {
+            "total_reviews": self.review_count,
+            "average_rating": average_rating,
+            "rating_distribution": {
+                f"{stars}_star": self.histogram[stars - 1] for stars in range(5, 0, -1)
+            },
+            "would_work_again_percent": (
+                self.would_work_again_count / self.review_count * 100
+                if self.review_count else 0
+            ),
+            "common_issues": self.top_issues()
+        }
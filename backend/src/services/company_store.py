@@ -0,0 +1,172 @@
+"""
+Company Store
+Company storage behind one async interface
+
+InMemoryCompanyStore serves the mock companies for development; the SQL
+store implements the same methods against the database.
+"""
+
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, List, Optional
+from src.services.company_rankings import RANKED_FIELDS, RatingViews
+
+
+class CompanyStore:
+    """
+    Interface for company storage
+
+    All methods are async so routes work the same against any backend.
+    Companies are plain dicts in the same shape the API returns.
+    """
+
+    async def add(self, company: Dict) -> Dict:
+        """Store a new company and return it"""
+        raise NotImplementedError
+
+    async def get(self, company_id: str) -> Optional[Dict]:
+        """Get a company by ID, or None if it does not exist"""
+        raise NotImplementedError
+
+    async def get_many(self, company_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Get several companies at once, keyed by ID (missing IDs are left out)"""
+        raise NotImplementedError
+
+    async def update(self, company_id: str, fields: Dict) -> Optional[Dict]:
+        """Apply field updates to a company and return it, or None if missing"""
+        raise NotImplementedError
+
+    async def list_companies(self) -> List[Dict]:
+        """Every company (used to build search indexes)"""
+        raise NotImplementedError
+
+    async def page_by_id(
+        self,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+        entity_type: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Companies in ID order, for walking the whole table in pages
+
+        Args:
+            after_id: Only companies with a greater ID (keyset position)
+            limit: Maximum number of companies
+            entity_type: Only companies of this type
+        """
+        raise NotImplementedError
+
+    async def top_rated(
+        self,
+        entity_type: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0
+    ) -> List[Dict]:
+        """Best ranked companies (by ranking_score), optionally for one entity type"""
+        raise NotImplementedError
+
+    async def rating_prior(self, entity_type: str) -> float:
+        """Average rating of an entity type - the prior for ranking scores"""
+        raise NotImplementedError
+
+    async def count(self, entity_type: Optional[str] = None) -> int:
+        """Number of companies, optionally for one entity type"""
+        raise NotImplementedError
+
+    async def search_ids(self, query: str) -> List[str]:
+        """
+        IDs of every company whose legal name, DBA name or MC number
+        contains the query (ranked and filtered by the caller's facet index)
+        """
+        raise NotImplementedError
+
+
+class InMemoryCompanyStore(CompanyStore):
+    """
+    In-memory company store
+
+    Keeps companies in a dict plus pre-sorted RatingViews, so top-ranked
+    listings and counts never sort or filter the full company list. A
+    sorted ID list serves keyset pages for exports.
+    """
+
+    def __init__(self, companies: Optional[Dict[str, Dict]] = None):
+        self._companies: Dict[str, Dict] = companies if companies is not None else {}
+        self._views = RatingViews()
+        for company in self._companies.values():
+            self._views.add(company)
+        self._ids = sorted(self._companies)
+
+    async def add(self, company: Dict) -> Dict:
+        if company["id"] in self._companies:
+            raise ValueError(f"Company {company['id']} already exists")
+        self._companies[company["id"]] = company
+        self._views.add(company)
+        insort(self._ids, company["id"])
+        return company
+
+    async def get(self, company_id: str) -> Optional[Dict]:
+        return self._companies.get(company_id)
+
+    async def get_many(self, company_ids: Iterable[str]) -> Dict[str, Dict]:
+        return {
+            company_id: self._companies[company_id]
+            for company_id in company_ids
+            if company_id in self._companies
+        }
+
+    async def update(self, company_id: str, fields: Dict) -> Optional[Dict]:
+        company = self._companies.get(company_id)
+        if company is None:
+            return None
+
+        company.update(fields)
+        if "entity_type" in fields:
+            self._views.add(company)
+        elif any(field in fields for field in RANKED_FIELDS):
+            self._views.update(company)
+        return company
+
+    async def list_companies(self) -> List[Dict]:
+        return list(self._companies.values())
+
+    async def page_by_id(
+        self,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+        entity_type: Optional[str] = None
+    ) -> List[Dict]:
+        start = bisect_right(self._ids, after_id) if after_id is not None else 0
+        page = []
+        for i in range(start, len(self._ids)):
+            company = self._companies[self._ids[i]]
+            if not entity_type or company["entity_type"] == entity_type:
+                page.append(company)
+                if len(page) >= limit:
+                    break
+        return page
+
+    async def top_rated(
+        self,
+        entity_type: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0
+    ) -> List[Dict]:
+        return [
+            self._companies[company_id]
+            for company_id in self._views.top(entity_type, limit=limit, offset=offset)
+        ]
+
+    async def rating_prior(self, entity_type: str) -> float:
+        return self._views.prior(entity_type)
+
+    async def count(self, entity_type: Optional[str] = None) -> int:
+        return self._views.count(entity_type)
+
+    async def search_ids(self, query: str) -> List[str]:
+        query_lower = query.lower()
+        return [
+            c["id"] for c in self._companies.values()
+            if query_lower in c["legal_name"].lower()
+            or (c.get("dba_name") and query_lower in c["dba_name"].lower())
+            or (c.get("mc_number") and query_lower in c["mc_number"])
+        ]
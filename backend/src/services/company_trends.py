@@ -0,0 +1,166 @@
+"""
+Company Trends
+Monthly rating buckets per company for "rating over time" charts
+
+Each review lands in the bucket for the month it was posted. Buckets hold
+running sums and counts, so adding or removing a review is O(1) and a
+24-month series is read from 24 buckets - reviews are never grouped at
+request time.
+"""
+
+from typing import Dict, List, Optional
+from src.services.company_stats import RATING_FIELDS
+
+# Default length of a trend series
+DEFAULT_TREND_MONTHS = 24
+
+
+def month_of(review: Dict) -> str:
+    """Bucket key ("YYYY-MM") for a review - the month it was posted"""
+    return review["created_at"][:7]
+
+
+def month_index(month: str) -> int:
+    """Months since year 0 for a "YYYY-MM" key - differences are spans in months"""
+    return int(month[:4]) * 12 + int(month[5:7]) - 1
+
+
+def month_range(end_month: str, months: int) -> List[str]:
+    """
+    The `months` bucket keys ending at end_month, oldest first
+
+    Example:
+        month_range("2024-02", 3)  # ["2023-12", "2024-01", "2024-02"]
+    """
+    index = month_index(end_month)
+    return [
+        f"{i // 12:04d}-{i % 12 + 1:02d}"
+        for i in range(index - months + 1, index + 1)
+    ]
+
+
+class TrendBucket:
+    """
+    Running totals for one company-month
+
+    Usage:
+        bucket = TrendBucket()
+        bucket.add(review)
+        bucket.to_dict("2024-01")
+    """
+
+    __slots__ = (
+        "review_count",
+        "rating_sums",
+        "rating_counts",
+        "days_to_payment_sum",
+        "days_to_payment_count",
+    )
+
+    def __init__(self):
+        self.review_count = 0
+        self.rating_sums = {field: 0 for field in RATING_FIELDS}
+        self.rating_counts = {field: 0 for field in RATING_FIELDS}
+        self.days_to_payment_sum = 0
+        self.days_to_payment_count = 0
+
+    def _apply(self, review: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) a review's contribution"""
+        self.review_count += sign
+        for field in RATING_FIELDS:
+            value = review.get(field)
+            if value is not None:
+                self.rating_sums[field] += sign * value
+                self.rating_counts[field] += sign
+
+        days = review.get("days_to_payment")
+        if days is not None:
+            self.days_to_payment_sum += sign * days
+            self.days_to_payment_count += sign
+
+    def add(self, review: Dict):
+        """Count a review"""
+        self._apply(review, 1)
+
+    def remove(self, review: Dict):
+        """Stop counting a review"""
+        self._apply(review, -1)
+
+    def to_dict(self, month: str) -> Dict:
+        """Bucket in the API response shape"""
+        return {
+            "month": month,
+            "review_count": self.review_count,
+            "rating_sums": dict(self.rating_sums),
+            "averages": {
+                field: self.rating_sums[field] / self.rating_counts[field]
+                if self.rating_counts[field] else None
+                for field in RATING_FIELDS
+            },
+            "average_days_to_payment": (
+                self.days_to_payment_sum / self.days_to_payment_count
+                if self.days_to_payment_count else None
+            ),
+        }
+
+
+class CompanyTrends:
+    """
+    Monthly buckets for every company
+
+    Usage:
+        trends = CompanyTrends()
+        trends.add(review)
+        trends.buckets("company-1")   # {"2024-01": TrendBucket, ...}
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, Dict[str, TrendBucket]] = {}  # company_id -> month -> bucket
+
+    def add(self, review: Dict):
+        """Count a review in its company-month bucket"""
+        months = self._buckets.setdefault(review["company_id"], {})
+        month = month_of(review)
+        bucket = months.get(month)
+        if bucket is None:
+            bucket = months[month] = TrendBucket()
+        bucket.add(review)
+
+    def remove(self, review: Dict):
+        """Stop counting a review"""
+        months = self._buckets.get(review["company_id"], {})
+        month = month_of(review)
+        bucket = months.get(month)
+        if bucket is None:
+            return
+        bucket.remove(review)
+        if not bucket.review_count:
+            del months[month]
+
+    def buckets(self, company_id: str) -> Dict[str, TrendBucket]:
+        """A company's non-empty buckets keyed by month"""
+        return self._buckets.get(company_id, {})
+
+    def items(self):
+        """(company_id, month, bucket) for every non-empty bucket"""
+        for company_id, months in self._buckets.items():
+            for month, bucket in months.items():
+                yield company_id, month, bucket
+
+
+def trend_series(buckets: Dict[str, TrendBucket], end_month: str, months: int = DEFAULT_TREND_MONTHS) -> List[Dict]:
+    """
+    Continuous monthly series ending at end_month - O(months)
+
+    Months without reviews are included with zero counts so charts have
+    no gaps.
+    """
+    empty: Optional[TrendBucket] = None
+    series = []
+    for month in month_range(end_month, months):
+        bucket = buckets.get(month)
+        if bucket is None:
+            empty = empty or TrendBucket()
+            bucket = empty
+        series.append(bucket.to_dict(month))
+    return series
@@ -4,11 +4,79 @@ Handles DOT/MC number verification - OPTIONAL for development
 
 NOTE: This service is OPTIONAL. Students can develop without FMCSA API keys.
 If no API key is configured, it returns mock data for testing.
+
+All lookups share one pooled HTTP client, so repeat verifications reuse
+open keep-alive connections instead of paying a new TCP+TLS handshake to
+the FMCSA API every time.
+
+MC and DOT lookups are cached (see verification_cache): repeat brokers are
+answered from memory, and stale entries are served while a background
+refresh runs. Concurrent misses for the same number share one upstream
+request (single flight). With a census snapshot configured
+(fmcsa.census_path), numbers it knows are answered locally and only
+misses go to the API.
 """
 
+import asyncio
+import copy
+import importlib.util
 import httpx
-from typing import Dict, Optional
-from src.utils.config import config
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from src.services.census_snapshot import CensusSnapshot
+from src.services.verification_cache import MISS, STALE, VerificationCache
+from src.utils.config import get_fmcsa_config
+from src.utils.rate_limit import TokenBucket
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Cache key: (lookup type, number), e.g. ("mc", "123456")
+LookupKey = Tuple[str, str]
+
+# Extra data fetched for a verified broker, by DOT number
+ENRICHMENT_SECTIONS = ("authority", "insurance", "basics")
+
+# Insurance fields of a QCMobile carrier record (amounts in $1000s)
+INSURANCE_FIELDS = {
+    "bipd_required": "bipdInsuranceRequired",
+    "bipd_required_amount": "bipdRequiredAmount",
+    "bipd_on_file": "bipdInsuranceOnFile",
+    "bond_required": "bondInsuranceRequired",
+    "bond_on_file": "bondInsuranceOnFile",
+    "cargo_required": "cargoInsuranceRequired",
+    "cargo_on_file": "cargoInsuranceOnFile",
+}
+
+# MOCK MODE enrichment data
+MOCK_SECTIONS = {
+    "authority": {
+        "broker_authority": "Active",
+        "insurance_required": "Yes",
+        "boc3_filed": True,
+        "mock": True
+    },
+    "insurance": {
+        "bipd_required": "Y",
+        "bipd_required_amount": "750",
+        "bipd_on_file": "750",
+        "bond_required": "Y",
+        "bond_on_file": "75",
+        "cargo_required": "N",
+        "cargo_on_file": "0",
+        "mock": True
+    },
+    "basics": {"basics": [], "mock": True},
+}
+
+
+class FMCSAError(Exception):
+    """Unexpected FMCSA API response (anything but found / not found)"""
+
+
+def _report_refresh(task: asyncio.Task):
+    """Log a failed background refresh - the stale entry stays cached"""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Error refreshing FMCSA lookup: {task.exception()}")
 
 
 class FMCSAService:
@@ -17,95 +85,288 @@ class FMCSAService:
     
     OPTIONAL: Works without API key for development/testing
     If api_key is not set, returns mock data instead
+    
+    Usage:
+        service = FMCSAService()
+        await service.start()      # at app startup - opens the connection pool
+        await service.verify_mc_number("123456")
+        await service.close()      # at shutdown
+    
+    A client is also opened on first use if start() was never called.
+    Tests pass a transport (e.g. httpx.MockTransport) instead of the network.
+    
+    Cached results are shared between callers - do not modify them.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[VerificationCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        census: Optional[CensusSnapshot] = None
+    ):
         # Load credentials from centralized config (OPTIONAL)
-        self.api_key = config.get("fmcsa.api_key")
-        self.api_url = config.get("fmcsa.api_url")
-        self.timeout = config.get("fmcsa.timeout", 10)
+        settings = get_fmcsa_config()
+        self.api_key = api_key if api_key is not None else settings["api_key"]
+        self.api_url = api_url or settings["api_url"]
+        self.timeout = settings["timeout"]
+        self.limits = httpx.Limits(
+            max_connections=settings["max_connections"],
+            max_keepalive_connections=settings["max_keepalive_connections"],
+            keepalive_expiry=settings["keepalive_expiry"]
+        )
+        self.http2 = settings["http2"] and HTTP2_AVAILABLE and transport is None
         self.mock_mode = not self.api_key or self.api_key == "your_fmcsa_api_key_here"
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        if cache is None:
+            cache = VerificationCache(
+                max_size=settings["cache_size"],
+                ttl=settings["cache_ttl"],
+                negative_ttl=settings["cache_negative_ttl"],
+                stale_ttl=settings["cache_stale_ttl"]
+            )
+        self.cache = cache
+        # Upstream calls only - cache hits never wait for a token
+        self.rate_limiter = rate_limiter or TokenBucket(
+            rate=settings["rate_limit_per_second"],
+            capacity=settings["rate_limit_burst"]
+        )
+        self._fetchers = {
+            "mc": self._fetch_mc,
+            "dot": self._fetch_dot,
+            "authority": self._fetch_authority,
+            "basics": self._fetch_basics,
+        }
+        self.latency_budget = settings["latency_budget"]
+        self.section_timeout = settings["section_timeout"]
+        self.census_path = settings["census_path"]
+        self.census = census
+        self._fetches: Dict[LookupKey, asyncio.Task] = {}   # in-flight upstream lookups
     
-    async def verify_mc_number(self, mc_number: str) -> Optional[Dict]:
+    async def start(self):
+        """Map the census snapshot (if configured) and open the shared connection pool (not in mock mode)"""
+        if self.census is None and self.census_path:
+            try:
+                self.census = CensusSnapshot.open(self.census_path)
+                print(f"✓ FMCSA census snapshot loaded: {self.census.stats()['dot_numbers']:,} DOT numbers")
+            except (OSError, ValueError) as e:
+                print(f"✗ FMCSA census snapshot not loaded, using the API only: {e}")
+        if not self.mock_mode:
+            self._get_client()
+    
+    async def close(self):
+        """Cancel in-flight lookups and close the shared client and its pooled connections"""
+        for task in list(self._fetches.values()):
+            task.cancel()
+        self._fetches.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self.census is not None:
+            self.census.close()
+            self.census = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """The shared client, opened on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._transport
+            )
+        return self._client
+    
+    async def _cached(
+        self,
+        kind: str,
+        number: str,
+        fetch: Callable[[str], Awaitable[Optional[Dict]]]
+    ) -> Optional[Dict]:
         """
-        Verify MC number with FMCSA API
+        Cached lookup - fresh entries are returned as is, stale ones are
+        returned and refreshed in the background, misses are fetched
         
-        DEVELOPMENT MODE: If no API key configured, returns mock data
+        Not-found results (None) are cached too; errors are not.
+        """
+        key = (kind, number)
+        state, value = self.cache.lookup(key)
+        if state == MISS:
+            # Shielded: a caller that gives up does not cancel the fetch for the others
+            return await asyncio.shield(self._in_flight(key, fetch))
+        if state == STALE and key not in self._fetches:
+            self._in_flight(key, fetch).add_done_callback(_report_refresh)
+        return value
+    
+    def _in_flight(self, key: LookupKey, fetch: Callable[[str], Awaitable[Optional[Dict]]]) -> asyncio.Task:
+        """
+        The upstream fetch for a key, started only if none is running
+        
+        Single flight: concurrent callers for the same (lookup type,
+        number) share one task and all get its result or exception.
+        """
+        task = self._fetches.get(key)
+        if task is None:
+            task = self._fetches[key] = asyncio.create_task(self._fetch_and_store(key, fetch))
+            task.add_done_callback(lambda done: self._fetch_done(key, done))
+        return task
+    
+    async def _fetch_and_store(
+        self,
+        key: LookupKey,
+        fetch: Callable[[str], Awaitable[Optional[Dict]]]
+    ) -> Optional[Dict]:
+        # Only real upstream calls take a token - cache hits and coalesced callers are free
+        await self.rate_limiter.acquire()
+        value = await fetch(key[1])
+        self.cache.store(key, value)
+        return value
+    
+    def _fetch_done(self, key: LookupKey, task: asyncio.Task):
+        """Forget a finished fetch so the next miss starts a new one"""
+        if self._fetches.get(key) is task:
+            del self._fetches[key]
+        # Mark the exception retrieved even if every caller gave up waiting
+        if not task.cancelled():
+            task.exception()
+    
+    async def lookup(self, kind: str, number: str) -> Optional[Dict]:
+        """
+        MC or DOT lookup that raises on upstream errors
+        
+        verify_mc_number / verify_dot_number return None both for unknown
+        numbers and for failed calls; batch callers use this to tell them
+        apart.
         
         Args:
-            mc_number: Motor Carrier number to verify
+            kind: "mc" or "dot"
+            number: MC or DOT number
         
         Returns:
-            Company data if found, None otherwise
+            Company data, or None if FMCSA does not know the number
+        
+        Raises:
+            FMCSAError: On an unexpected API response
+            httpx.HTTPError: If the request fails
         """
+        # Local census snapshot first - no network, works during FMCSA outages
+        if self.census is not None:
+            record = self.census.get(kind, number)
+            if record is not None:
+                return {**record, "verified": True, "mock": False, "source": "census"}
+        
         # MOCK MODE - No API key needed for development
         if self.mock_mode:
-            print(f"🔧 MOCK MODE: Simulating FMCSA verification for MC#{mc_number}")
+            return self._mock_lookup(kind, number)
+        
+        return await self._cached(kind, number, self._fetchers[kind])
+    
+    def _mock_lookup(self, kind: str, number: str) -> Dict:
+        """Mock data for development without an API key"""
+        print(f"🔧 MOCK MODE: Simulating FMCSA verification for {kind.upper()}#{number}")
+        if kind == "mc":
             return {
-                "mc_number": mc_number,
-                "company_name": f"Test Company {mc_number}",
+                "mc_number": number,
+                "company_name": f"Test Company {number}",
+                "entity_type": "BROKER",  # so broker verification works in development
                 "status": "Authorized for Property",
                 "safety_rating": "Satisfactory",
                 "verified": True,
                 "mock": True,  # Flag to indicate this is mock data
                 "message": "This is mock data - no API key required for development"
             }
+        return {
+            "dot_number": number,
+            "company_name": f"Test Carrier {number}",
+            "status": "Authorized for Property",
+            "safety_rating": "Satisfactory",
+            "verified": True,
+            "mock": True,  # Flag to indicate this is mock data
+            "message": "This is mock data - no API key required for development"
+        }
+    
+    async def verify_mc_number(self, mc_number: str) -> Optional[Dict]:
+        """
+        Verify MC number with FMCSA API
         
-        # REAL API MODE - Using FMCSA's official QCMobile API
-        # Format: https://mobile.fmcsa.dot.gov/qc/services/carriers/docket-number/{MC}?webKey=YOUR_KEY
+        Answered from the census snapshot when it has the number.
+        DEVELOPMENT MODE: If no API key configured, returns mock data
+        
+        Args:
+            mc_number: Motor Carrier number to verify
+        
+        Returns:
+            Company data if found, None otherwise
+        """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.api_url}/docket-number/{mc_number}",
-                    params={"webKey": self.api_key}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Parse FMCSA QCMobile API response structure
-                    if "content" in data and "carrier" in data["content"]:
-                        carrier = data["content"]["carrier"]
-                        return {
-                            "mc_number": carrier.get("mcNumber") or mc_number,
-                            "dot_number": carrier.get("dotNumber"),
-                            "company_name": carrier.get("legalName"),
-                            "dba_name": carrier.get("dbaName"),
-                            "status": carrier.get("operatingStatus"),
-                            "out_of_service_date": carrier.get("outOfServiceDate"),
-                            "safety_rating": carrier.get("safetyRating"),
-                            "mcs150_mileage": carrier.get("mcs150Mileage"),
-                            "mcs150_year": carrier.get("mcs150MileageYear"),
-                            "total_drivers": carrier.get("totalDrivers"),
-                            "total_power_units": carrier.get("totalPowerUnits"),
-                            "phone": carrier.get("phone"),
-                            "entity_type": carrier.get("entityType"),  # BROKER, CARRIER, etc.
-                            "physical_address": {
-                                "street": carrier.get("phyStreet"),
-                                "city": carrier.get("phyCity"),
-                                "state": carrier.get("phyState"),
-                                "zip": carrier.get("phyZip")
-                            },
-                            "verified": True,
-                            "mock": False
-                        }
-                    else:
-                        return None
-                elif response.status_code == 404:
-                    print(f"MC number {mc_number} not found in FMCSA database")
-                    return None
-                else:
-                    print(f"FMCSA API error: {response.status_code}")
-                    return None
-                    
+            return await self.lookup("mc", mc_number)
         except Exception as e:
             print(f"Error calling FMCSA API: {e}")
             return None
     
+    async def _fetch_mc(self, mc_number: str) -> Optional[Dict]:
+        """
+        Look up an MC number on the FMCSA API (uncached)
+        
+        Returns:
+            Company data, or None if FMCSA does not know the number
+        
+        Raises:
+            FMCSAError: On an unexpected API response (not cached)
+            httpx.HTTPError: If the request fails
+        """
+        # REAL API MODE - Using FMCSA's official QCMobile API
+        # Format: https://mobile.fmcsa.dot.gov/qc/services/carriers/docket-number/{MC}?webKey=YOUR_KEY
+        response = await self._get_client().get(
+            f"{self.api_url}/docket-number/{mc_number}",
+            params={"webKey": self.api_key}
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            
+            # Parse FMCSA QCMobile API response structure
+            if "content" in data and "carrier" in data["content"]:
+                carrier = data["content"]["carrier"]
+                return {
+                    "mc_number": carrier.get("mcNumber") or mc_number,
+                    "dot_number": carrier.get("dotNumber"),
+                    "company_name": carrier.get("legalName"),
+                    "dba_name": carrier.get("dbaName"),
+                    "status": carrier.get("operatingStatus"),
+                    "out_of_service_date": carrier.get("outOfServiceDate"),
+                    "safety_rating": carrier.get("safetyRating"),
+                    "mcs150_mileage": carrier.get("mcs150Mileage"),
+                    "mcs150_year": carrier.get("mcs150MileageYear"),
+                    "total_drivers": carrier.get("totalDrivers"),
+                    "total_power_units": carrier.get("totalPowerUnits"),
+                    "phone": carrier.get("phone"),
+                    "entity_type": carrier.get("entityType"),  # BROKER, CARRIER, etc.
+                    "physical_address": {
+                        "street": carrier.get("phyStreet"),
+                        "city": carrier.get("phyCity"),
+                        "state": carrier.get("phyState"),
+                        "zip": carrier.get("phyZip")
+                    },
+                    "verified": True,
+                    "mock": False
+                }
+            else:
+                return None
+        elif response.status_code == 404:
+            print(f"MC number {mc_number} not found in FMCSA database")
+            return None
+        else:
+            raise FMCSAError(f"FMCSA API error: {response.status_code}")
+    
     async def verify_dot_number(self, dot_number: str) -> Optional[Dict]:
         """
         Verify DOT number with FMCSA API
         
+        Answered from the census snapshot when it has the number.
         DEVELOPMENT MODE: If no API key configured, returns mock data
         
         Args:
@@ -114,83 +375,109 @@ class FMCSAService:
         Returns:
             Company data if found, None otherwise
         """
-        # MOCK MODE - No API key needed for development
-        if self.mock_mode:
-            print(f"🔧 MOCK MODE: Simulating FMCSA verification for DOT#{dot_number}")
-            return {
-                "dot_number": dot_number,
-                "company_name": f"Test Carrier {dot_number}",
-                "status": "Authorized for Property",
-                "safety_rating": "Satisfactory",
-                "verified": True,
-                "mock": True,  # Flag to indicate this is mock data
-                "message": "This is mock data - no API key required for development"
-            }
-        
-        # REAL API MODE - Using FMCSA's official QCMobile API
-        # Format: https://mobile.fmcsa.dot.gov/qc/services/carriers/dot/{USDOT}?webKey=YOUR_KEY
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.api_url}/dot/{dot_number}",
-                    params={"webKey": self.api_key}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Parse FMCSA QCMobile API response structure
-                    if "content" in data and "carrier" in data["content"]:
-                        carrier = data["content"]["carrier"]
-                        return {
-                            "dot_number": carrier.get("dotNumber"),
-                            "company_name": carrier.get("legalName"),
-                            "dba_name": carrier.get("dbaName"),
-                            "status": carrier.get("operatingStatus"),
-                            "out_of_service_date": carrier.get("outOfServiceDate"),
-                            "safety_rating": carrier.get("safetyRating"),
-                            "mcs150_mileage": carrier.get("mcs150Mileage"),
-                            "mcs150_year": carrier.get("mcs150MileageYear"),
-                            "total_drivers": carrier.get("totalDrivers"),
-                            "total_power_units": carrier.get("totalPowerUnits"),
-                            "phone": carrier.get("phone"),
-                            "entity_type": carrier.get("entityType"),  # BROKER, CARRIER, etc.
-                            "physical_address": {
-                                "street": carrier.get("phyStreet"),
-                                "city": carrier.get("phyCity"),
-                                "state": carrier.get("phyState"),
-                                "zip": carrier.get("phyZip")
-                            },
-                            "verified": True,
-                            "mock": False
-                        }
-                    else:
-                        return None
-                elif response.status_code == 404:
-                    print(f"DOT number {dot_number} not found in FMCSA database")
-                    return None
-                else:
-                    print(f"FMCSA API error: {response.status_code}")
-                    return None
-                    
+            return await self.lookup("dot", dot_number)
         except Exception as e:
             print(f"Error calling FMCSA API: {e}")
             return None
     
-    async def verify_broker_by_mc(self, mc_number: str) -> Optional[Dict]:
+    async def _fetch_dot(self, dot_number: str) -> Optional[Dict]:
+        """
+        Look up a DOT number on the FMCSA API (uncached)
+        
+        Returns:
+            Company data, or None if FMCSA does not know the number
+        
+        Raises:
+            FMCSAError: On an unexpected API response (not cached)
+            httpx.HTTPError: If the request fails
+        """
+        # REAL API MODE - Using FMCSA's official QCMobile API
+        # Format: https://mobile.fmcsa.dot.gov/qc/services/carriers/dot/{USDOT}?webKey=YOUR_KEY
+        response = await self._get_client().get(
+            f"{self.api_url}/dot/{dot_number}",
+            params={"webKey": self.api_key}
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            
+            # Parse FMCSA QCMobile API response structure
+            if "content" in data and "carrier" in data["content"]:
+                carrier = data["content"]["carrier"]
+                return {
+                    "dot_number": carrier.get("dotNumber"),
+                    "company_name": carrier.get("legalName"),
+                    "dba_name": carrier.get("dbaName"),
+                    "status": carrier.get("operatingStatus"),
+                    "out_of_service_date": carrier.get("outOfServiceDate"),
+                    "safety_rating": carrier.get("safetyRating"),
+                    "mcs150_mileage": carrier.get("mcs150Mileage"),
+                    "mcs150_year": carrier.get("mcs150MileageYear"),
+                    "total_drivers": carrier.get("totalDrivers"),
+                    "total_power_units": carrier.get("totalPowerUnits"),
+                    "phone": carrier.get("phone"),
+                    "entity_type": carrier.get("entityType"),  # BROKER, CARRIER, etc.
+                    "physical_address": {
+                        "street": carrier.get("phyStreet"),
+                        "city": carrier.get("phyCity"),
+                        "state": carrier.get("phyState"),
+                        "zip": carrier.get("phyZip")
+                    },
+                    # Read by the broker "insurance" section - no second request
+                    "insurance": {field: carrier.get(source) for field, source in INSURANCE_FIELDS.items()},
+                    "verified": True,
+                    "mock": False
+                }
+            else:
+                return None
+        elif response.status_code == 404:
+            print(f"DOT number {dot_number} not found in FMCSA database")
+            return None
+        else:
+            raise FMCSAError(f"FMCSA API error: {response.status_code}")
+    
+    async def verify_broker_by_mc(self, mc_number: str, latency_budget: Optional[float] = None) -> Optional[Dict]:
         """
         Verify that an MC number belongs to a BROKER (not a carrier)
         
         This is critical for Carrier Board - truckers should only rate BROKERS
         
+        Once the broker's DOT number is known, its authority, insurance
+        and BASIC safety scores are fetched concurrently, each with its own
+        timeout and all within the latency budget. A section that is slow
+        or fails is left out (None) and marked in "sections" instead of
+        holding up the answer; its fetch keeps running and lands in the
+        cache for the next request.
+        
         Args:
             mc_number: Motor Carrier number to verify
+            latency_budget: Seconds the whole verification may take
+                (default fmcsa.latency_budget)
         
         Returns:
-            Broker data if found and is a broker, None otherwise
+            Broker data if found and is a broker, None otherwise. Includes
+            "authority", "insurance" and "basics", and "sections" with each
+            one's status: ok, not_found, timeout, error or unavailable
+        
+        Raises:
+            asyncio.TimeoutError: If the MC lookup itself does not finish within the budget
         """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (latency_budget or self.latency_budget)
+        
         # First get the basic carrier data
-        result = await self.verify_mc_number(mc_number)
+        result = await asyncio.wait_for(self.verify_mc_number(mc_number), deadline - loop.time())
+        
+        # Census layouts without an entity type can't tell brokers apart - ask the API
+        if result and result.get("source") == "census" and not result.get("entity_type") and not self.mock_mode:
+            try:
+                result = await asyncio.wait_for(self._cached("mc", mc_number, self._fetch_mc), deadline - loop.time())
+            except asyncio.TimeoutError:
+                raise
+            except Exception as e:
+                print(f"Error calling FMCSA API: {e}")
+                return None
         
         if not result:
             return None
@@ -200,14 +487,84 @@ class FMCSAService:
             print(f"MC#{mc_number} is not a BROKER (type: {result.get('entity_type')})")
             return None
         
-        # Get authority/insurance data if we have real API access
-        if not self.mock_mode and result.get("dot_number"):
-            authority_data = await self.get_authority_info(result["dot_number"])
-            if authority_data:
-                result["authority"] = authority_data
+        # Authority, insurance and basics at the same time - one round trip, not three
+        sections = await self._enrich(result.get("dot_number"), deadline)
         
+        # Copy - the verify_mc_number result may be a shared cache entry
+        result = {**result, **{section: data for section, (_, data) in sections.items()}}
+        result["sections"] = {section: status for section, (status, _) in sections.items()}
         return result
     
+    async def _enrich(self, dot_number: Optional[str], deadline: float) -> Dict[str, Tuple[str, Optional[Dict]]]:
+        """
+        Fetch every enrichment section concurrently
+        
+        Returns:
+            {section: (status, data)} for each of ENRICHMENT_SECTIONS
+        """
+        if not dot_number and not self.mock_mode:
+            return {section: ("unavailable", None) for section in ENRICHMENT_SECTIONS}
+        
+        loop = asyncio.get_running_loop()
+        
+        async def fetch(section: str) -> Tuple[str, Optional[Dict]]:
+            timeout = min(self.section_timeout, deadline - loop.time())
+            try:
+                data = await asyncio.wait_for(self._section(section, dot_number), max(timeout, 0))
+            except asyncio.TimeoutError:
+                return "timeout", None
+            except Exception as e:
+                print(f"Error fetching FMCSA {section} for DOT#{dot_number}: {e}")
+                return "error", None
+            return ("ok" if data is not None else "not_found"), data
+        
+        results = await asyncio.gather(*(fetch(section) for section in ENRICHMENT_SECTIONS))
+        return dict(zip(ENRICHMENT_SECTIONS, results))
+    
+    async def _section(self, section: str, dot_number: str) -> Optional[Dict]:
+        """
+        One enrichment section for a DOT number (cached, coalesced, rate limited)
+        
+        Raises:
+            FMCSAError: On an unexpected API response
+            httpx.HTTPError: If the request fails
+        """
+        if self.mock_mode:
+            # A copy - callers may add to what they get back
+            return copy.deepcopy(MOCK_SECTIONS[section])
+        if section == "insurance":
+            # Part of the carrier record, so shares the cached DOT lookup (the
+            # census has no insurance columns, so this always asks the API)
+            carrier = await self._cached("dot", dot_number, self._fetch_dot)
+            return carrier.get("insurance") if carrier else None
+        return await self._cached(section, dot_number, self._fetchers[section])
+    
+    async def _get_content(self, path: str) -> Optional[Any]:
+        """
+        The "content" of a QCMobile response
+        
+        Returns:
+            Content, or None on 404
+        
+        Raises:
+            FMCSAError: On any other non-200 response
+        """
+        response = await self._get_client().get(f"{self.api_url}/{path}", params={"webKey": self.api_key})
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise FMCSAError(f"FMCSA API error: {response.status_code}")
+        return response.json().get("content")
+    
+    async def _fetch_authority(self, dot_number: str) -> Optional[Dict]:
+        """Operating authority (common, contract and broker authority status)"""
+        return await self._get_content(f"{dot_number}/authority")
+    
+    async def _fetch_basics(self, dot_number: str) -> Optional[Dict]:
+        """BASIC safety measurement scores"""
+        content = await self._get_content(f"{dot_number}/basics")
+        return {"basics": content} if content is not None else None
+    
     async def get_authority_info(self, dot_number: str) -> Optional[Dict]:
         """
         Get operating authority and insurance information
@@ -218,28 +575,8 @@ class FMCSAService:
         Returns:
             Authority and insurance data
         """
-        if self.mock_mode:
-            return {
-                "broker_authority": "Active",
-                "insurance_required": "Yes",
-                "boc3_filed": True,
-                "mock": True
-            }
-        
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.api_url}/{dot_number}/authority",
-                    params={"webKey": self.api_key}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("content", {})
-                else:
-                    print(f"Authority API error: {response.status_code}")
-                    return None
-                    
+            return await self._section("authority", dot_number)
         except Exception as e:
             print(f"Error calling Authority API: {e}")
             return None
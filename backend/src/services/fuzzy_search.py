@@ -0,0 +1,134 @@
+"""
+Fuzzy Company Search
+Typo-tolerant company name matching with a trigram index
+
+Name tokens are indexed by their character trigrams. A misspelled query
+word ("swfit") shares enough trigrams with the intended word ("swift")
+to surface it as a candidate, and only those candidate words are scored
+with an edit distance. Companies are never compared one by one.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+from src.utils.text import edit_distance, tokenize, trigrams
+
+# Minimum word similarity (1 - edits / length) for a query word to match
+MIN_WORD_SIMILARITY = 0.7
+
+# Minimum company score (average best word similarity) to be returned
+MIN_SCORE = 0.5
+
+
+def word_similarity(query_word: str, word: str) -> float:
+    """Similarity in [0, 1] based on edit distance relative to word length"""
+    return 1 - edit_distance(query_word, word) / max(len(query_word), len(word))
+
+
+class TrigramIndex:
+    """
+    Trigram inverted index over company name words
+
+    Usage:
+        index = TrigramIndex()
+        index.add(company)
+        index.search("swfit transport")  # [(company_id, score), ...]
+    """
+
+    def __init__(self):
+        self._word_trigrams: Dict[str, Set[str]] = {}     # trigram -> words
+        self._word_companies: Dict[str, Set[str]] = {}    # word -> company IDs
+        self._company_words: Dict[str, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._company_words)
+
+    def add(self, company: Dict):
+        """Index a company's legal and DBA names"""
+        company_id = company["id"]
+        if company_id in self._company_words:
+            self.remove(company_id)
+
+        words = set(tokenize(company.get("legal_name", "")))
+        words.update(tokenize(company.get("dba_name") or ""))
+
+        for word in words:
+            companies = self._word_companies.get(word)
+            if companies is None:
+                # First company using this word - add it to the vocabulary
+                companies = self._word_companies[word] = set()
+                for trigram in trigrams(word):
+                    self._word_trigrams.setdefault(trigram, set()).add(word)
+            companies.add(company_id)
+
+        self._company_words[company_id] = tuple(words)
+
+    def remove(self, company_id: str):
+        """Remove a company from the index"""
+        for word in self._company_words.pop(company_id, ()):
+            companies = self._word_companies[word]
+            companies.discard(company_id)
+            if not companies:
+                del self._word_companies[word]
+                for trigram in trigrams(word):
+                    self._word_trigrams[trigram].discard(word)
+                    if not self._word_trigrams[trigram]:
+                        del self._word_trigrams[trigram]
+
+    def similar_words(self, query_word: str) -> Dict[str, float]:
+        """
+        Indexed words similar to a query word
+
+        Candidates must share a third of the query's trigrams; only those
+        are scored with the (more expensive) edit distance.
+        """
+        query_trigrams = trigrams(query_word)
+        shared = Counter()
+        for trigram in query_trigrams:
+            shared.update(self._word_trigrams.get(trigram, ()))
+
+        min_shared = max(1, len(query_trigrams) // 3)
+        max_edits = math.floor(len(query_word) * (1 - MIN_WORD_SIMILARITY))
+
+        matches = {}
+        for word, count in shared.items():
+            if count < min_shared or abs(len(word) - len(query_word)) > max_edits:
+                continue
+            similarity = word_similarity(query_word, word)
+            if similarity >= MIN_WORD_SIMILARITY:
+                matches[word] = similarity
+        return matches
+
+    def search(self, query: str, min_score: float = MIN_SCORE) -> List[Tuple[str, float]]:
+        """
+        Score companies against a possibly misspelled query
+
+        A company's score is the average, over query words, of the best
+        similarity between that query word and any of its name words.
+
+        Args:
+            query: Company name as typed
+            min_score: Drop companies scoring below this
+
+        Returns:
+            (company_id, score) pairs, unordered
+        """
+        query_words = tokenize(query)
+        if not query_words:
+            return []
+
+        totals: Dict[str, float] = {}
+        for query_word in query_words:
+            best: Dict[str, float] = {}
+            for word, similarity in self.similar_words(query_word).items():
+                for company_id in self._word_companies[word]:
+                    if similarity > best.get(company_id, 0):
+                        best[company_id] = similarity
+            for company_id, similarity in best.items():
+                totals[company_id] = totals.get(company_id, 0) + similarity
+
+        return [
+            (company_id, round(total / len(query_words), 3))
+            for company_id, total in totals.items()
+            if total / len(query_words) >= min_score
+        ]
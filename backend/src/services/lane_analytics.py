@@ -0,0 +1,313 @@
+"""
+Lane Analytics
+Payment and rating stats per origin -> destination lane, from a columnar
+NumPy projection of reviews
+
+Each review's load details are appended to typed arrays (states, freight
+type and company as small integer codes; days-to-pay, rating and late
+payment as floats with a flag column marking which are known). Lane stats
+are a vectorized group-by over those arrays - np.bincount over the lane
+keys that actually occur (np.unique) - so a full national lane matrix is
+computed without looping over reviews in Python.
+
+States and freight types are free text from reviews, so each dictionary
+is capped: values past the cap share one OTHER_VALUE code, and junk input
+can neither overflow the int16 code columns nor blow up the group-by.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from src.services.company_stats import counts_toward_stats
+
+# payment_speed values that count as paid late
+LATE_PAYMENT_SPEEDS = ("late", "never_paid")
+
+_INITIAL_CAPACITY = 1024
+
+# Most distinct values per dictionary before new values map to OTHER_VALUE
+MAX_STATE_CODES = 128
+MAX_FREIGHT_TYPE_CODES = 1024
+OTHER_VALUE = "OTHER"
+
+# Gather matching rows when fewer than 1 in this many match a filter;
+# otherwise bin every row and discard the non-matching ones
+SELECTIVE_FILTER_RATIO = 4
+
+
+class _Codes:
+    """Dictionary encoding - value <-> small int code (0 = missing)"""
+
+    def __init__(self, max_codes: Optional[int] = None):
+        """
+        Args:
+            max_codes: Most codes handed out; further new values all get the
+                OTHER_VALUE code (None = unbounded)
+        """
+        self.values: List[Optional[str]] = [None]
+        self._codes: Dict[str, int] = {}
+        self.max_codes = max_codes
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: Optional[str]) -> int:
+        """Code for a value, assigning a new one on first sight"""
+        if not value:
+            return 0
+        code = self._codes.get(value)
+        if code is None:
+            if self.max_codes is not None and len(self.values) >= self.max_codes - 1:
+                value = OTHER_VALUE
+                code = self._codes.get(value)
+                if code is not None:
+                    return code
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: Optional[str]) -> int:
+        """Code for a known value, or -1 if it has never been seen"""
+        return self._codes.get(value, -1) if value else 0
+
+
+class LaneAnalytics:
+    """
+    Columnar review projection with vectorized lane group-bys
+
+    Usage:
+        lanes = LaneAnalytics()
+        lanes.add(review)
+        lanes.lane_matrix(freight_type="Dry Van")
+        lanes.brokers_on_lane("TX", "CA")
+    """
+
+    _COLUMNS = (
+        "_origin", "_destination", "_freight", "_company",
+        "_days", "_days_known", "_rating", "_rating_known", "_late", "_late_known", "_active",
+    )
+
+    def __init__(self):
+        self._size = 0
+        self._rows: Dict[str, int] = {}  # review ID -> row
+        self._states = _Codes(MAX_STATE_CODES)
+        self._freight_types = _Codes(MAX_FREIGHT_TYPE_CODES)
+        self._companies = _Codes()
+
+        capacity = _INITIAL_CAPACITY
+        self._origin = np.zeros(capacity, dtype=np.int16)
+        self._destination = np.zeros(capacity, dtype=np.int16)
+        self._freight = np.zeros(capacity, dtype=np.int16)
+        self._company = np.zeros(capacity, dtype=np.int32)
+        # Measures are 0 where unknown, so they can be summed without filtering
+        self._days = np.zeros(capacity, dtype=np.float32)
+        self._days_known = np.zeros(capacity, dtype=bool)
+        self._rating = np.zeros(capacity, dtype=np.float32)
+        self._rating_known = np.zeros(capacity, dtype=bool)
+        self._late = np.zeros(capacity, dtype=np.float32)    # 1 late, 0 on time
+        self._late_known = np.zeros(capacity, dtype=bool)
+        self._active = np.zeros(capacity, dtype=bool)        # published and not removed
+
+    def __len__(self) -> int:
+        return int(self._active[:self._size].sum())
+
+    def _grow(self):
+        """Double the capacity of every column"""
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.empty(len(column) * 2, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+    def add(self, review: Dict):
+        """Project a review into the columns (re-projects it if already present)"""
+        row = self._rows.get(review["id"])
+        if row is None:
+            if self._size == len(self._active):
+                self._grow()
+            row = self._rows[review["id"]] = self._size
+            self._size += 1
+
+        self._origin[row] = self._states.encode((review.get("origin_state") or "").upper())
+        self._destination[row] = self._states.encode((review.get("destination_state") or "").upper())
+        self._freight[row] = self._freight_types.encode(review.get("freight_type"))
+        self._company[row] = self._companies.encode(review["company_id"])
+
+        days = review.get("days_to_payment")
+        rating = review.get("overall_rating")
+        speed = review.get("payment_speed")
+        self._days[row], self._days_known[row] = days or 0, days is not None
+        self._rating[row], self._rating_known[row] = rating or 0, rating is not None
+        self._late[row], self._late_known[row] = speed in LATE_PAYMENT_SPEEDS, bool(speed)
+        self._active[row] = counts_toward_stats(review)
+
+    def remove(self, review_id: str):
+        """Exclude a review from all stats"""
+        row = self._rows.get(review_id)
+        if row is not None:
+            self._active[row] = False
+
+    def _mask(
+        self,
+        origin: Optional[str] = None,
+        destination: Optional[str] = None,
+        freight_type: Optional[str] = None,
+        company_id: Optional[str] = None
+    ) -> np.ndarray:
+        """Rows that are active, on a known lane and match the filters"""
+        size = self._size
+        origin_column, destination_column = self._origin[:size], self._destination[:size]
+        mask = self._active[:size] & (origin_column > 0) & (destination_column > 0)
+
+        for column, codes, value in (
+            (origin_column, self._states, origin and origin.upper()),
+            (destination_column, self._states, destination and destination.upper()),
+            (self._freight[:size], self._freight_types, freight_type),
+            (self._company[:size], self._companies, company_id),
+        ):
+            if value:
+                mask &= column == codes.lookup(value)
+        return mask
+
+    def _group_stats(self, groups: np.ndarray, mask: np.ndarray, group_count: int) -> Dict[str, np.ndarray]:
+        """
+        Per-group sums and counts with np.bincount
+
+        Args:
+            groups: Group index (0..group_count-1) for every row
+            mask: Rows to include
+            group_count: Number of groups
+        """
+        size = self._size
+        if np.count_nonzero(mask) * SELECTIVE_FILTER_RATIO < size:
+            # Selective filter - gather the few matching rows
+            rows = np.flatnonzero(mask)
+            groups = groups[rows]
+        else:
+            # Most rows match - send the rest to an extra trailing group that
+            # is dropped, so columns are binned as views with no gather
+            rows = slice(0, size)
+            groups = np.where(mask, groups, group_count)
+
+        def bincount(weights: Optional[np.ndarray] = None) -> np.ndarray:
+            return np.bincount(groups, weights=weights, minlength=group_count + 1)[:group_count]
+
+        def sum_and_count(values: np.ndarray, known: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            return bincount(values[rows]), bincount(known[rows])
+
+        days_sum, days_count = sum_and_count(self._days, self._days_known)
+        rating_sum, rating_count = sum_and_count(self._rating, self._rating_known)
+        late_sum, late_count = sum_and_count(self._late, self._late_known)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return {
+                "review_count": bincount(),
+                "average_days_to_payment": days_sum / days_count,
+                "late_payment_rate": late_sum / late_count,
+                "average_rating": rating_sum / rating_count,
+            }
+
+    @staticmethod
+    def _rows_out(stats: Dict[str, np.ndarray], min_reviews: int) -> Tuple[np.ndarray, List[Dict]]:
+        """
+        Groups with enough reviews and their stats as plain dicts
+
+        Returns:
+            (group indexes, [stats dict per group]) - NaN averages become None
+        """
+        groups = np.flatnonzero(stats["review_count"] >= min_reviews)
+        columns = []
+        for values in stats.values():
+            values = values[groups]
+            if values.dtype.kind == "f":
+                values = np.round(values, 4).tolist()
+                values = [None if value != value else value for value in values]  # NaN != NaN
+            else:
+                values = values.tolist()
+            columns.append(values)
+
+        names = tuple(stats)
+        return groups, [dict(zip(names, row)) for row in zip(*columns)]
+
+    def lane_matrix(
+        self,
+        freight_type: Optional[str] = None,
+        company_id: Optional[str] = None,
+        by_freight_type: bool = False,
+        min_reviews: int = 1
+    ) -> List[Dict]:
+        """
+        Stats for every origin -> destination lane with reviews
+
+        Args:
+            freight_type: Only loads of this freight type
+            company_id: Only this company's reviews
+            by_freight_type: Split each lane by freight type
+            min_reviews: Leave out lanes with fewer reviews
+
+        Returns:
+            [{"origin", "destination", ["freight_type"], "review_count",
+              "average_days_to_payment", "late_payment_rate", "average_rating"}]
+        """
+        size = self._size
+        states = len(self._states)
+        freights = len(self._freight_types) if by_freight_type else 1
+
+        # Lane key: (origin, destination[, freight type]) as one int
+        keys = self._origin[:size].astype(np.int64) * states + self._destination[:size]
+        if by_freight_type:
+            keys = keys * freights + self._freight[:size]
+
+        # Group over the keys that occur, not every possible combination
+        mask = self._mask(freight_type=freight_type, company_id=company_id)
+        lane_keys, groups = np.unique(keys[mask], return_inverse=True)
+        row_groups = np.zeros(size, dtype=np.int64)
+        row_groups[mask] = groups
+        stats = self._group_stats(row_groups, mask, len(lane_keys))
+
+        groups, rows = self._rows_out(stats, max(min_reviews, 1))
+        lanes, freight_codes = np.divmod(lane_keys[groups], freights)
+        origins, destinations = np.divmod(lanes, states)
+        state_names, freight_names = self._states.values, self._freight_types.values
+
+        matrix = []
+        for origin, destination, freight, values in zip(
+            origins.tolist(), destinations.tolist(), freight_codes.tolist(), rows
+        ):
+            entry = {"origin": state_names[origin], "destination": state_names[destination]}
+            if by_freight_type:
+                entry["freight_type"] = freight_names[freight]
+            entry.update(values)
+            matrix.append(entry)
+        return matrix
+
+    def brokers_on_lane(
+        self,
+        origin: str,
+        destination: str,
+        freight_type: Optional[str] = None,
+        min_reviews: int = 1
+    ) -> List[Dict]:
+        """
+        Stats per company on one lane, most reviewed first
+
+        Returns:
+            [{"company_id", "review_count", "average_days_to_payment",
+              "late_payment_rate", "average_rating"}]
+        """
+        mask = self._mask(origin=origin, destination=destination, freight_type=freight_type)
+        stats = self._group_stats(self._company[:self._size], mask, len(self._companies))
+
+        companies, rows = self._rows_out(stats, max(min_reviews, 1))
+        brokers = [
+            {"company_id": self._companies.values[company], **values}
+            for company, values in zip(companies.tolist(), rows)
+        ]
+        brokers.sort(key=lambda b: (-b["review_count"], b["company_id"]))
+        return brokers
+
+    def lane_summary(self, origin: str, destination: str, freight_type: Optional[str] = None) -> Dict:
+        """Totals for one lane across all companies"""
+        mask = self._mask(origin=origin, destination=destination, freight_type=freight_type)
+        stats = self._group_stats(np.zeros(self._size, dtype=np.int64), mask, 1)
+        _, rows = self._rows_out(stats, 0)
+        return rows[0]
@@ -0,0 +1,101 @@
+"""
+Ranking Rescore Job
+Recompute every company's ranking score as of the current month
+
+Stored ranking scores are decayed to the month they were computed in, and
+shrunk toward the entity type priors of that moment. A score cannot be
+stored in a form that stays comparable as time passes - the prior's
+pseudo-reviews do not decay, so two companies' order can flip with age
+alone - so instead every company is rescored on a schedule (and by
+scripts/rebuild_rollups.py). Between runs, all scores share the same
+"now" and the same priors.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from src.services.company_rankings import (
+    DEFAULT_PRIOR_RATING,
+    RANKING_HORIZON_MONTHS,
+    ranking_score,
+    seed_ranking_score,
+)
+from src.services.company_store import CompanyStore
+from src.services.company_trends import month_range
+from src.services.review_store import ReviewStore
+
+# Companies read per page while walking the company table
+RESCORE_PAGE_SIZE = 500
+
+
+async def entity_type_priors(company_store: CompanyStore) -> Dict[str, float]:
+    """Review-weighted average rating per entity type, read fresh from every company"""
+    sums: Dict[str, list] = {}
+    after_id = None
+    while True:
+        page = await company_store.page_by_id(after_id, limit=RESCORE_PAGE_SIZE)
+        for company in page:
+            review_count = company.get("review_count") or 0
+            totals = sums.setdefault(company["entity_type"], [0.0, 0])
+            totals[0] += (company.get("overall_rating") or 0) * review_count
+            totals[1] += review_count
+        if len(page) < RESCORE_PAGE_SIZE:
+            break
+        after_id = page[-1]["id"]
+    return {
+        entity_type: rating_sum / review_count if review_count else DEFAULT_PRIOR_RATING
+        for entity_type, (rating_sum, review_count) in sums.items()
+    }
+
+
+async def rescore_companies(
+    company_store: CompanyStore,
+    review_store: ReviewStore,
+    as_of_month: Optional[str] = None,
+    on_update: Optional[Callable[[Dict], None]] = None
+) -> int:
+    """
+    Rescore every company against current priors and the current month
+
+    Companies with dated reviews inside RANKING_HORIZON_MONTHS are scored
+    from their monthly buckets, exactly as a new review would score them;
+    companies without any use their stored rating and review count
+    (seed_ranking_score). Buckets are read one page of companies at a
+    time, and only changed scores are written.
+
+    Args:
+        company_store: Companies to rescore
+        review_store: Source of the monthly trend buckets
+        as_of_month: "YYYY-MM" review ages count from (default: this month)
+        on_update: Called with each company whose score changed (e.g. to
+            refresh in-process indexes)
+
+    Returns:
+        Number of companies whose score changed
+    """
+    as_of_month = as_of_month or datetime.now().strftime("%Y-%m")
+    since_month = month_range(as_of_month, RANKING_HORIZON_MONTHS + 1)[0]
+    priors = await entity_type_priors(company_store)
+    changed = 0
+
+    after_id = None
+    while True:
+        page = await company_store.page_by_id(after_id, limit=RESCORE_PAGE_SIZE)
+        trends = await review_store.company_trends_many([c["id"] for c in page], since_month)
+        for company in page:
+            prior = priors.get(company["entity_type"], DEFAULT_PRIOR_RATING)
+            buckets = trends[company["id"]]
+            if buckets:
+                score = ranking_score(buckets, prior, as_of_month)
+            else:
+                score = seed_ranking_score(company, prior)
+
+            if score != company.get("ranking_score"):
+                updated = await company_store.update(company["id"], {"ranking_score": score})
+                changed += 1
+                if on_update is not None:
+                    on_update(updated)
+        if len(page) < RESCORE_PAGE_SIZE:
+            break
+        after_id = page[-1]["id"]
+
+    return changed
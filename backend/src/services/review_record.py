@@ -0,0 +1,131 @@
+"""
+Review Record
+Compact in-memory representation of a stored review
+
+A review dict carries a hash table with ~25 keys per review; a
+ReviewRecord keeps the same values in __slots__ (one pointer per field).
+Low-cardinality strings - status, payment speed, states, cities, freight
+type, company and trucker IDs - are interned so every review shares one
+copy, and issues_reported is held as a tuple (the empty tuple is a
+shared singleton). Records are turned back into the API dict shape with
+to_dict() only at the response boundary.
+"""
+
+import sys
+from typing import Any, Dict, Optional
+
+# Every field of a stored review, in API response order
+REVIEW_FIELDS = (
+    "id",
+    "trucker_id",
+    "trucker_name",
+    "company_id",
+    "overall_rating",
+    "title",
+    "content",
+    "payment_rating",
+    "communication_rating",
+    "professionalism_rating",
+    "honesty_rating",
+    "payment_speed",
+    "days_to_payment",
+    "load_date",
+    "origin_city",
+    "origin_state",
+    "destination_city",
+    "destination_state",
+    "freight_type",
+    "would_work_again",
+    "issues_reported",
+    "status",
+    "helpful_count",
+    "not_helpful_count",
+    "created_at",
+    "company_response",
+)
+
+# Fields with few distinct values across reviews - stored interned
+INTERNED_FIELDS = frozenset({
+    "trucker_id",
+    "trucker_name",
+    "company_id",
+    "payment_speed",
+    "load_date",
+    "origin_city",
+    "origin_state",
+    "destination_city",
+    "destination_state",
+    "freight_type",
+    "status",
+})
+
+_FIELD_SET = frozenset(REVIEW_FIELDS)
+_MISSING = object()
+
+
+class ReviewRecord:
+    """
+    Slotted review with a read-only mapping interface
+
+    Fields that were never set stay unset (and are left out of to_dict),
+    so the record round-trips to exactly the dict it was built from. Keys
+    outside REVIEW_FIELDS are kept in a small overflow dict. Aggregates
+    read records through get() / [] just like review dicts.
+
+    Usage:
+        record = ReviewRecord(review)
+        record["company_id"], record.get("days_to_payment")
+        record.update({"status": "removed"})
+        record.to_dict()   # API shape
+    """
+
+    __slots__ = REVIEW_FIELDS + ("_extra",)
+
+    def __init__(self, review: Dict):
+        self._extra: Optional[Dict] = None
+        self.update(review)
+
+    def update(self, fields: Dict):
+        """Set fields, interning and packing values as stored"""
+        for field, value in fields.items():
+            if type(value) is str and field in INTERNED_FIELDS:
+                value = sys.intern(value)
+            elif field == "issues_reported" and value is not None:
+                value = tuple(value)
+
+            if field in _FIELD_SET:
+                setattr(self, field, value)
+            else:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[field] = value
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """Field value, or default if the field is not set"""
+        if field in _FIELD_SET:
+            return getattr(self, field, default)
+        return self._extra.get(field, default) if self._extra else default
+
+    def __getitem__(self, field: str) -> Any:
+        value = self.get(field, _MISSING)
+        if value is _MISSING:
+            raise KeyError(field)
+        return value
+
+    def __contains__(self, field: str) -> bool:
+        return self.get(field, _MISSING) is not _MISSING
+
+    def to_dict(self) -> Dict:
+        """Review in the API response shape"""
+        review = {}
+        for field in REVIEW_FIELDS:
+            value = getattr(self, field, _MISSING)
+            if value is not _MISSING:
+                review[field] = value
+
+        issues = review.get("issues_reported")
+        if issues is not None:
+            review["issues_reported"] = list(issues)
+        if self._extra:
+            review.update(self._extra)
+        return review
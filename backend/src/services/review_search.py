@@ -0,0 +1,243 @@
+"""
+Review Search
+Full-text search over review titles and content
+
+An inverted index maps each stemmed term to the reviews containing it
+(with term frequencies) and results are ranked with BM25. Company and
+state filters are posting sets too, so a filtered search only scores
+reviews in the intersection. The index is updated per review and can be
+saved to / loaded from a snapshot file so startup does not re-tokenize
+every review.
+"""
+
+import gzip
+import heapq
+import json
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+from src.services.company_stats import counts_toward_stats
+from src.utils.text import STOPWORDS, stem, tokenize
+
+# BM25 parameters: term frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SNAPSHOT_VERSION = 1
+
+# Newest (created_at, id) covered by an index
+Watermark = Tuple[str, str]
+
+
+def analyze(text: str) -> List[str]:
+    """Text to index terms - tokenized, stopwords dropped, stemmed"""
+    return [stem(token) for token in tokenize(text) if token not in STOPWORDS]
+
+
+def review_terms(review: Dict) -> Counter:
+    """Term frequencies of a review's title and content"""
+    return Counter(analyze(f"{review.get('title') or ''} {review.get('content') or ''}"))
+
+
+def filter_keys(review: Dict) -> Tuple[str, ...]:
+    """Filter postings a review belongs to"""
+    keys = {f"company:{review['company_id']}"}
+    for field in ("origin_state", "destination_state"):
+        if review.get(field):
+            keys.add(f"state:{review[field].upper()}")
+    return tuple(sorted(keys))
+
+
+class ReviewSearchIndex:
+    """
+    Inverted index with BM25 ranking over review text
+
+    Reviews are numbered internally so postings hold small ints. Every
+    review is indexed (so the index size can be checked against the
+    store), but only published reviews are returned.
+
+    Usage:
+        index = ReviewSearchIndex()
+        index.add(review)
+        index.search("double brokered", state="TX")  # ([(review_id, score)], total)
+        index.save("search.json.gz")
+    """
+
+    def __init__(self):
+        self._review_ids: List[Optional[str]] = []      # doc number -> review ID (None once removed)
+        self._doc_numbers: Dict[str, int] = {}           # review ID -> doc number
+        self._lengths: List[int] = []                    # doc number -> term count
+        self._doc_filters: List[Tuple[str, ...]] = []    # doc number -> filter keys
+        self._postings: Dict[str, Dict[int, int]] = {}   # term -> {doc number: term frequency}
+        self._filters: Dict[str, Set[int]] = {}          # "company:<id>" / "state:<XX>" -> doc numbers
+        self._searchable: Set[int] = set()               # published reviews
+        self._total_length = 0
+        self.watermark: Optional[Watermark] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_numbers)
+
+    def __contains__(self, review_id: str) -> bool:
+        return review_id in self._doc_numbers
+
+    def add(self, review: Dict):
+        """Index a review (re-indexes it if already present)"""
+        if review["id"] in self._doc_numbers:
+            self.remove(review)
+
+        doc = len(self._review_ids)
+        terms = review_terms(review)
+        keys = filter_keys(review)
+        length = sum(terms.values())
+        self._review_ids.append(review["id"])
+        self._doc_numbers[review["id"]] = doc
+        self._lengths.append(length)
+        self._doc_filters.append(keys)
+        self._total_length += length
+
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[doc] = frequency
+        for key in keys:
+            self._filters.setdefault(key, set()).add(doc)
+        if counts_toward_stats(review):
+            self._searchable.add(doc)
+
+        key = (review["created_at"], review["id"])
+        if self.watermark is None or key > self.watermark:
+            self.watermark = key
+
+    def remove(self, review: Dict):
+        """Remove a review (pass it as indexed - its text is re-analyzed to find its postings)"""
+        doc = self._doc_numbers.pop(review["id"], None)
+        if doc is None:
+            return
+
+        for term in review_terms(review):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc, None)
+                if not postings:
+                    del self._postings[term]
+        for key in self._doc_filters[doc]:
+            self._filters[key].discard(doc)
+            if not self._filters[key]:
+                del self._filters[key]
+
+        self._searchable.discard(doc)
+        self._total_length -= self._lengths[doc]
+        self._review_ids[doc] = None
+        self._doc_filters[doc] = ()
+
+    def search(
+        self,
+        query: str,
+        company_id: Optional[str] = None,
+        state: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0
+    ) -> Tuple[List[Tuple[str, float]], int]:
+        """
+        BM25-ranked reviews matching any query term
+
+        Args:
+            query: Free text
+            company_id: Only this company's reviews
+            state: Only loads picked up or delivered in this state
+            limit: Page size
+            offset: Results to skip
+
+        Returns:
+            (page of (review_id, score) best first, total number of matches)
+        """
+        terms = set(analyze(query))
+        if not terms or not self._doc_numbers:
+            return [], 0
+
+        # Filters are posting sets - intersect them smallest first
+        allowed = [self._searchable]
+        for key in (company_id and f"company:{company_id}", state and f"state:{state.upper()}"):
+            if key:
+                allowed.append(self._filters.get(key, set()))
+        allowed.sort(key=len)
+        candidates = allowed[0].intersection(*allowed[1:]) if len(allowed) > 1 else allowed[0]
+        if not candidates:
+            return [], 0
+
+        doc_count = len(self._doc_numbers)
+        average_length = self._total_length / doc_count or 1
+        lengths = self._lengths
+        # BM25 denominator is tf + k1 * (1 - b + b * length / average_length)
+        norm_base = BM25_K1 * (1 - BM25_B)
+        norm_per_term = BM25_K1 * BM25_B / average_length
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+
+            # Walk whichever side is shorter: the term's postings or the filtered docs
+            if len(postings) <= len(candidates):
+                matches = ((doc, tf) for doc, tf in postings.items() if doc in candidates)
+            else:
+                matches = ((doc, postings[doc]) for doc in candidates if doc in postings)
+
+            weight = idf * (BM25_K1 + 1)
+            for doc, tf in matches:
+                scores[doc] = scores.get(doc, 0.0) + weight * tf / (tf + norm_base + norm_per_term * lengths[doc])
+
+        top = heapq.nlargest(offset + limit, scores.items(), key=lambda item: item[1])[offset:]
+        return [(self._review_ids[doc], score) for doc, score in top], len(scores)
+
+    def save(self, path: str):
+        """Write a snapshot (live documents only, renumbered densely)"""
+        live = [doc for doc, review_id in enumerate(self._review_ids) if review_id is not None]
+        renumber = {doc: i for i, doc in enumerate(live)}
+
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "watermark": self.watermark,
+            "docs": [
+                [self._review_ids[doc], self._lengths[doc], self._doc_filters[doc], doc in self._searchable]
+                for doc in live
+            ],
+            "postings": {
+                term: [[renumber[doc], tf] for doc, tf in postings.items()]
+                for term, postings in self._postings.items()
+            },
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "ReviewSearchIndex":
+        """
+        Read a snapshot written by save()
+
+        Raises:
+            ValueError: If the snapshot format is not supported
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported search snapshot version: {snapshot.get('version')}")
+
+        index = cls()
+        for doc, (review_id, length, keys, searchable) in enumerate(snapshot["docs"]):
+            index._review_ids.append(review_id)
+            index._doc_numbers[review_id] = doc
+            index._lengths.append(length)
+            index._doc_filters.append(tuple(keys))
+            index._total_length += length
+            for key in keys:
+                index._filters.setdefault(key, set()).add(doc)
+            if searchable:
+                index._searchable.add(doc)
+
+        index._postings = {
+            term: {doc: tf for doc, tf in postings}
+            for term, postings in snapshot["postings"].items()
+        }
+        index.watermark = tuple(snapshot["watermark"]) if snapshot["watermark"] else None
+        return index
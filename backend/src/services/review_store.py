@@ -0,0 +1,365 @@
+"""
+Review Store
+Indexed review storage - replaces linear scans over a bare list of reviews
+
+The routes only talk to the ReviewStore interface. InMemoryReviewStore is
+the default for development; a database-backed store implements the same
+async methods.
+"""
+
+import base64
+import json
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.services.company_stats import AGGREGATED_FIELDS, CompanyAggregate, counts_toward_stats
+from src.services.company_trends import CompanyTrends, TrendBucket
+from src.services.review_record import ReviewRecord
+
+# Keyset position in the (created_at, id) ordering
+Cursor = Tuple[str, str]
+
+
+def encode_cursor(review: Dict) -> str:
+    """Opaque cursor pointing just past a review in newest-first order"""
+    raw = json.dumps([review["created_at"], review["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, review_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(created_at, str) or not isinstance(review_id, str):
+        raise ValueError("Invalid cursor")
+    try:
+        # Checked here so every backend rejects it the same way
+        datetime.fromisoformat(created_at)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    return (created_at, review_id)
+
+
+class ReviewStore:
+    """
+    Interface for review storage
+
+    All methods are async so a database-backed implementation can be
+    dropped in without changing the routes. Reviews are plain dicts in the
+    same shape the API returns.
+    """
+
+    async def add(self, review: Dict) -> Dict:
+        """Store a new review and return it"""
+        raise NotImplementedError
+
+    async def add_many(self, review_list: List[Dict]):
+        """
+        Store a batch of new reviews in one write
+
+        The whole batch is rejected if any review ID already exists.
+        """
+        raise NotImplementedError
+
+    async def get(self, review_id: str) -> Optional[Dict]:
+        """Get a review by ID, or None if it does not exist"""
+        raise NotImplementedError
+
+    async def get_many(self, review_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Get several reviews at once, keyed by ID (missing IDs are left out)"""
+        raise NotImplementedError
+
+    async def update(self, review_id: str, fields: Dict) -> Optional[Dict]:
+        """Apply field updates to a review and return it, or None if missing"""
+        raise NotImplementedError
+
+    async def increment(self, review_id: str, field: str, amount: int = 1) -> Optional[Dict]:
+        """Atomically add amount to a numeric field and return the review"""
+        raise NotImplementedError
+
+    async def apply_counts(self, deltas: Dict[str, Dict[str, int]]):
+        """
+        Add a batch of counter deltas in one write
+
+        Args:
+            deltas: {review_id: {field: amount}} - unknown review IDs are skipped
+        """
+        raise NotImplementedError
+
+    async def delete(self, review_id: str) -> Optional[Dict]:
+        """Remove a review and return it, or None if missing"""
+        raise NotImplementedError
+
+    async def list_reviews(
+        self,
+        company_id: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[Cursor] = None
+    ) -> List[Dict]:
+        """
+        List reviews newest first, optionally for a single company
+
+        Args:
+            company_id: Only list this company's reviews
+            limit: Maximum number of reviews
+            offset: Legacy offset pagination (ignored when after is set)
+            after: Keyset cursor - only reviews older than this position
+
+        Returns:
+            Page of reviews
+        """
+        raise NotImplementedError
+
+    async def count(self, company_id: Optional[str] = None) -> int:
+        """Count reviews, optionally for a single company"""
+        raise NotImplementedError
+
+    async def company_aggregate(self, company_id: str) -> CompanyAggregate:
+        """Rating aggregate over a company's published reviews"""
+        raise NotImplementedError
+
+    async def company_aggregates(self, company_ids: Iterable[str]) -> Dict[str, CompanyAggregate]:
+        """Aggregates for several companies at once, keyed by company ID"""
+        raise NotImplementedError
+
+    async def overall_aggregate(self) -> CompanyAggregate:
+        """Platform-wide review count and issue frequencies over every published review"""
+        raise NotImplementedError
+
+    async def company_trends(self, company_id: str, since_month: str) -> Dict[str, TrendBucket]:
+        """A company's monthly buckets from since_month ("YYYY-MM") on, keyed by month"""
+        raise NotImplementedError
+
+    async def company_trends_many(
+        self,
+        company_ids: Iterable[str],
+        since_month: str
+    ) -> Dict[str, Dict[str, TrendBucket]]:
+        """Monthly buckets for several companies at once, keyed by company ID then month"""
+        raise NotImplementedError
+
+
+class InMemoryReviewStore(ReviewStore):
+    """
+    In-memory review store with indexes
+
+    Indexes:
+    - Primary: review ID -> review
+    - Secondary: company ID -> reviews ordered by (created_at, id)
+    - Global (created_at, id) ordering for unfiltered listings
+    - Company ID -> CompanyAggregate, plus one overall aggregate, and
+      monthly trend buckets per company, kept current on every write
+
+    Lookups by ID are O(1) and listings only touch the requested page,
+    no matter how many reviews are stored.
+
+    Reviews are held as compact ReviewRecords and converted to dicts only
+    when returned, so callers get a copy - changes go through update().
+    """
+
+    def __init__(self, reviews: Optional[Iterable[Dict]] = None):
+        self._by_id: Dict[str, ReviewRecord] = {}
+        self._by_company: Dict[str, List[Tuple[str, str]]] = {}
+        self._ordered: List[Tuple[str, str]] = []
+        self._aggregates: Dict[str, CompanyAggregate] = {}
+        self._overall = CompanyAggregate()
+        self._trends = CompanyTrends()
+
+        for review in reviews or []:
+            self._insert(review)
+
+    @staticmethod
+    def _sort_key(review: ReviewRecord) -> Tuple[str, str]:
+        """Ordering key - ISO timestamps sort correctly as strings"""
+        return (review.created_at, review.id)
+
+    def _insert(self, review: Dict):
+        """Add a review to every index"""
+        if review["id"] in self._by_id:
+            raise ValueError(f"Review {review['id']} already exists")
+
+        record = ReviewRecord(review)
+        key = self._sort_key(record)
+        self._by_id[record.id] = record
+        insort(self._by_company.setdefault(record.company_id, []), key)
+        insort(self._ordered, key)
+        self._count(record)
+
+    @staticmethod
+    def _merge_keys(keys: List[Tuple[str, str]], new_keys: List[Tuple[str, str]]):
+        """Merge a batch of keys into an ordered key list in place"""
+        if not new_keys:
+            return
+        new_keys.sort()
+        keys.extend(new_keys)
+        if len(keys) > len(new_keys) and keys[-len(new_keys) - 1] > new_keys[0]:
+            # Batch overlaps existing keys - timsort merges the two sorted runs
+            keys.sort()
+
+    def _count(self, review: ReviewRecord, remove: bool = False):
+        """Add (or remove) a review's contribution to its company, overall and trend aggregates"""
+        if not counts_toward_stats(review):
+            return
+        for aggregate in (self._aggregate(review["company_id"]), self._overall, self._trends):
+            if remove:
+                aggregate.remove(review)
+            else:
+                aggregate.add(review)
+
+    def _aggregate(self, company_id: str) -> CompanyAggregate:
+        """Aggregate for a company, created on first use"""
+        aggregate = self._aggregates.get(company_id)
+        if aggregate is None:
+            aggregate = self._aggregates[company_id] = CompanyAggregate()
+        return aggregate
+
+    def _keys(self, company_id: Optional[str]) -> List[Tuple[str, str]]:
+        """Ordered keys for a company, or for all reviews"""
+        if company_id is None:
+            return self._ordered
+        return self._by_company.get(company_id, [])
+
+    def _page(self, keys: List[Tuple[str, str]], limit: int, end: int) -> List[Dict]:
+        """Newest-first page of keys ending just before position end"""
+        if end <= 0:
+            return []
+        start = max(end - limit, 0)
+        return [self._by_id[review_id].to_dict() for _, review_id in reversed(keys[start:end])]
+
+    async def add(self, review: Dict) -> Dict:
+        self._insert(review)
+        return self._by_id[review["id"]].to_dict()
+
+    async def add_many(self, review_list: List[Dict]):
+        batch_ids = set()
+        for review in review_list:
+            if review["id"] in self._by_id or review["id"] in batch_ids:
+                raise ValueError(f"Review {review['id']} already exists")
+            batch_ids.add(review["id"])
+
+        # Append to the key lists and merge once, instead of one insort per review
+        by_company: Dict[str, List[Tuple[str, str]]] = {}
+        all_keys = []
+        for review in review_list:
+            record = self._by_id[review["id"]] = ReviewRecord(review)
+            key = self._sort_key(record)
+            by_company.setdefault(record.company_id, []).append(key)
+            all_keys.append(key)
+            self._count(record)
+
+        for company_id, keys in by_company.items():
+            self._merge_keys(self._by_company.setdefault(company_id, []), keys)
+        self._merge_keys(self._ordered, all_keys)
+
+    async def get(self, review_id: str) -> Optional[Dict]:
+        review = self._by_id.get(review_id)
+        return review.to_dict() if review is not None else None
+
+    async def get_many(self, review_ids: Iterable[str]) -> Dict[str, Dict]:
+        return {
+            review_id: self._by_id[review_id].to_dict()
+            for review_id in review_ids
+            if review_id in self._by_id
+        }
+
+    async def update(self, review_id: str, fields: Dict) -> Optional[Dict]:
+        review = self._by_id.get(review_id)
+        if review is None:
+            return None
+
+        # Indexed fields cannot change in place
+        for field in ("id", "company_id", "created_at"):
+            if field in fields and fields[field] != review[field]:
+                raise ValueError(f"Cannot update indexed field '{field}'")
+
+        # Swap the review's old contribution for the new one
+        affects_stats = any(field in AGGREGATED_FIELDS for field in fields)
+        if affects_stats:
+            self._count(review, remove=True)
+
+        review.update(fields)
+
+        if affects_stats:
+            self._count(review)
+        return review.to_dict()
+
+    async def increment(self, review_id: str, field: str, amount: int = 1) -> Optional[Dict]:
+        review = self._by_id.get(review_id)
+        if review is None:
+            return None
+
+        review.update({field: (review.get(field) or 0) + amount})
+        return review.to_dict()
+
+    async def apply_counts(self, deltas: Dict[str, Dict[str, int]]):
+        for review_id, counts in deltas.items():
+            review = self._by_id.get(review_id)
+            if review is None:
+                continue
+            review.update({
+                field: (review.get(field) or 0) + amount
+                for field, amount in counts.items()
+            })
+
+    async def delete(self, review_id: str) -> Optional[Dict]:
+        review = self._by_id.pop(review_id, None)
+        if review is None:
+            return None
+
+        key = self._sort_key(review)
+        for keys in (self._by_company[review.company_id], self._ordered):
+            del keys[bisect_left(keys, key)]
+
+        self._count(review, remove=True)
+        return review.to_dict()
+
+    async def list_reviews(
+        self,
+        company_id: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[Cursor] = None
+    ) -> List[Dict]:
+        keys = self._keys(company_id)
+        if after is not None:
+            # Seek straight to the cursor position
+            end = bisect_left(keys, after)
+        else:
+            end = len(keys) - offset
+        return self._page(keys, limit, end)
+
+    async def count(self, company_id: Optional[str] = None) -> int:
+        return len(self._keys(company_id))
+
+    async def company_aggregate(self, company_id: str) -> CompanyAggregate:
+        return self._aggregate(company_id)
+
+    async def company_aggregates(self, company_ids: Iterable[str]) -> Dict[str, CompanyAggregate]:
+        return {company_id: self._aggregate(company_id) for company_id in company_ids}
+
+    async def overall_aggregate(self) -> CompanyAggregate:
+        return self._overall
+
+    async def company_trends(self, company_id: str, since_month: str) -> Dict[str, TrendBucket]:
+        return {
+            month: bucket
+            for month, bucket in self._trends.buckets(company_id).items()
+            if month >= since_month
+        }
+
+    async def company_trends_many(
+        self,
+        company_ids: Iterable[str],
+        since_month: str
+    ) -> Dict[str, Dict[str, TrendBucket]]:
+        return {company_id: await self.company_trends(company_id, since_month) for company_id in company_ids}
@@ -0,0 +1,640 @@
+"""
+SQL Stores
+Database-backed ReviewStore and CompanyStore on an async SQLAlchemy engine
+
+Used when database.backend is 'sql'. Reviews and companies cross this
+boundary as the same dicts the in-memory stores return, so the routes
+do not know which backend they are talking to.
+"""
+
+import time
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import bindparam, case, delete, func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from src.models.tables import (
+    companies,
+    company_issues,
+    company_monthly_stats,
+    company_versions,
+    review_totals,
+    reviews,
+)
+from src.services.company_stats import (
+    AGGREGATED_FIELDS,
+    RATING_FIELDS,
+    CompanyAggregate,
+    counts_toward_stats,
+    review_issues,
+)
+from src.services.company_trends import CompanyTrends, TrendBucket, month_of
+from src.services.company_rankings import DEFAULT_PRIOR_RATING
+from src.services.company_store import CompanyStore
+from src.services.review_store import Cursor, ReviewStore
+from src.services.versioning import VersionRegistry
+from src.utils.database import VERSION_EPOCH_ROW, create_version_epoch
+
+# company_versions row that versions listings across all companies
+ALL_COMPANIES = "*"
+
+
+def _to_row(table, record: Dict, complete: bool = False) -> Dict:
+    """
+    Keep only table columns and convert ISO strings to date/datetime
+
+    Args:
+        table: Target table
+        record: Review or company dict
+        complete: Fill every missing column with its default (batch inserts
+            need the same keys in every row)
+    """
+    row = {key: value for key, value in record.items() if key in table.c}
+    if complete:
+        for column in table.c:
+            if column.name not in row:
+                row[column.name] = column.default.arg if column.default is not None else None
+    if isinstance(row.get("created_at"), str):
+        row["created_at"] = datetime.fromisoformat(row["created_at"])
+    if isinstance(row.get("load_date"), str):
+        row["load_date"] = date.fromisoformat(row["load_date"])
+    return row
+
+
+def _bucket_row(company_id: str, month: str, bucket: TrendBucket) -> Dict:
+    """Trend bucket as a company_monthly_stats row"""
+    row = {
+        "company_id": company_id,
+        "month": month,
+        "review_count": bucket.review_count,
+        "days_to_payment_sum": bucket.days_to_payment_sum,
+        "days_to_payment_count": bucket.days_to_payment_count,
+    }
+    for field in RATING_FIELDS:
+        row[f"{field}_sum"] = bucket.rating_sums[field]
+        row[f"{field}_count"] = bucket.rating_counts[field]
+    return row
+
+
+def _bucket_from_row(row) -> TrendBucket:
+    """company_monthly_stats row as a trend bucket"""
+    bucket = TrendBucket()
+    bucket.review_count = row.review_count
+    bucket.days_to_payment_sum = row.days_to_payment_sum
+    bucket.days_to_payment_count = row.days_to_payment_count
+    for field in RATING_FIELDS:
+        bucket.rating_sums[field] = row._mapping[f"{field}_sum"]
+        bucket.rating_counts[field] = row._mapping[f"{field}_count"]
+    return bucket
+
+
+async def _upsert_add(conn: AsyncConnection, table, rows: List[Dict]):
+    """Insert counter rows, adding to the counters of rows that already exist"""
+    if not rows:
+        return
+    upsert = (postgresql_insert if conn.dialect.name == "postgresql" else sqlite_insert)(table)
+    keys = [column.name for column in table.primary_key.columns]
+    await conn.execute(
+        upsert.on_conflict_do_update(
+            index_elements=keys,
+            set_={
+                column.name: column + upsert.excluded[column.name]
+                for column in table.c if column.name not in keys
+            }
+        ),
+        rows
+    )
+
+
+async def _bump_versions(conn: AsyncConnection, company_ids: Iterable[str]):
+    """Bump the ETag versions of some companies (and of all-company listings) in the caller's transaction"""
+    await _upsert_add(conn, company_versions, [
+        {"company_id": company_id, "version": 1}
+        for company_id in sorted({*company_ids, ALL_COMPANIES})
+    ])
+
+
+def _from_row(row) -> Dict:
+    """Row mapping to an API-shaped dict (dates back to ISO strings)"""
+    record = dict(row._mapping)
+    for field in ("created_at", "load_date"):
+        if isinstance(record.get(field), (date, datetime)):
+            record[field] = record[field].isoformat()
+    return record
+
+
+class SQLReviewStore(ReviewStore):
+    """
+    Review store backed by the reviews table
+
+    Listings use the (company_id, created_at, id) index; company stats are
+    one set-based aggregate query over the published reviews, grouped by
+    company. Issue frequencies come from the company_issues counters,
+    updated in the same transaction as each review write.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine
+
+    @staticmethod
+    async def _count_rollups(conn: AsyncConnection, review_list: Iterable[Dict], sign: int = 1):
+        """
+        Add (sign=1) or remove (sign=-1) reviews from the maintained rollups
+
+        Updates the company_issues counters, company_monthly_stats
+        buckets and the review_totals row in the caller's transaction.
+        """
+        issue_deltas: Dict[Tuple[str, str], int] = {}
+        bucket_deltas: Dict[Tuple[str, str], TrendBucket] = {}
+        total_delta = 0
+        for review in review_list:
+            if not counts_toward_stats(review):
+                continue
+            total_delta += sign
+            for issue in review_issues(review):
+                key = (review["company_id"], issue)
+                issue_deltas[key] = issue_deltas.get(key, 0) + sign
+
+            key = (review["company_id"], month_of(review))
+            bucket = bucket_deltas.get(key)
+            if bucket is None:
+                bucket = bucket_deltas[key] = TrendBucket()
+            if sign > 0:
+                bucket.add(review)
+            else:
+                bucket.remove(review)
+
+        await _upsert_add(conn, company_issues, [
+            {"company_id": company_id, "issue": issue, "review_count": delta}
+            for (company_id, issue), delta in issue_deltas.items() if delta
+        ])
+        await _upsert_add(conn, company_monthly_stats, [
+            _bucket_row(company_id, month, bucket)
+            for (company_id, month), bucket in bucket_deltas.items()
+        ])
+        if total_delta:
+            await _upsert_add(conn, review_totals, [{"scope": ALL_COMPANIES, "review_count": total_delta}])
+
+    async def add(self, review: Dict) -> Dict:
+        async with self._engine.begin() as conn:
+            await conn.execute(insert(reviews).values(**_to_row(reviews, review)))
+            await self._count_rollups(conn, [review])
+            await _bump_versions(conn, [review["company_id"]])
+        return review
+
+    async def add_many(self, review_list: List[Dict]):
+        if not review_list:
+            return
+        async with self._engine.begin() as conn:
+            await conn.execute(insert(reviews), [_to_row(reviews, r, complete=True) for r in review_list])
+            await self._count_rollups(conn, review_list)
+            await _bump_versions(conn, (review["company_id"] for review in review_list))
+
+    async def get(self, review_id: str) -> Optional[Dict]:
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(reviews).where(reviews.c.id == review_id))
+            row = result.first()
+        return _from_row(row) if row else None
+
+    async def get_many(self, review_ids: Iterable[str]) -> Dict[str, Dict]:
+        review_ids = list(review_ids)
+        if not review_ids:
+            return {}
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(reviews).where(reviews.c.id.in_(review_ids)))
+            return {row.id: _from_row(row) for row in result}
+
+    @staticmethod
+    async def _lock_review(conn: AsyncConnection, review_id: str) -> Optional[Dict]:
+        """
+        Read a review with its row locked until the caller's transaction ends
+
+        Edits and deletes take their rollup deltas from this copy, so two
+        concurrent writes to one review cannot both remove the same old
+        contribution. (SQLite has no row locks; its writes are serialized.)
+        """
+        result = await conn.execute(select(reviews).where(reviews.c.id == review_id).with_for_update())
+        row = result.first()
+        return _from_row(row) if row else None
+
+    async def update(self, review_id: str, fields: Dict) -> Optional[Dict]:
+        async with self._engine.begin() as conn:
+            review = await self._lock_review(conn, review_id)
+            if review is None:
+                return None
+
+            for field in ("id", "company_id", "created_at"):
+                if field in fields and fields[field] != review[field]:
+                    raise ValueError(f"Cannot update indexed field '{field}'")
+
+            await conn.execute(
+                update(reviews).where(reviews.c.id == review_id).values(**_to_row(reviews, fields))
+            )
+            if any(field in AGGREGATED_FIELDS for field in fields):
+                await self._count_rollups(conn, [review], sign=-1)
+                await self._count_rollups(conn, [{**review, **fields}])
+            await _bump_versions(conn, [review["company_id"]])
+        return await self.get(review_id)
+
+    async def increment(self, review_id: str, field: str, amount: int = 1) -> Optional[Dict]:
+        column = reviews.c[field]
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                update(reviews)
+                .where(reviews.c.id == review_id)
+                .values({field: func.coalesce(column, 0) + amount})
+            )
+            company_id = (await conn.execute(
+                select(reviews.c.company_id).where(reviews.c.id == review_id)
+            )).scalar()
+            if company_id is not None:
+                await _bump_versions(conn, [company_id])
+        return await self.get(review_id)
+
+    async def apply_counts(self, deltas: Dict[str, Dict[str, int]]):
+        if not deltas:
+            return
+
+        # One executemany UPDATE per counter field
+        fields = {field for counts in deltas.values() for field in counts}
+        async with self._engine.begin() as conn:
+            for field in sorted(fields):
+                column = reviews.c[field]
+                params = [
+                    {"review_id": review_id, "amount": counts[field]}
+                    for review_id, counts in deltas.items()
+                    if counts.get(field)
+                ]
+                await conn.execute(
+                    update(reviews)
+                    .where(reviews.c.id == bindparam("review_id"))
+                    .values({field: func.coalesce(column, 0) + bindparam("amount")}),
+                    params
+                )
+            result = await conn.execute(
+                select(reviews.c.company_id).distinct().where(reviews.c.id.in_(list(deltas)))
+            )
+            await _bump_versions(conn, result.scalars())
+
+    async def delete(self, review_id: str) -> Optional[Dict]:
+        async with self._engine.begin() as conn:
+            review = await self._lock_review(conn, review_id)
+            if review is None:
+                return None
+            await conn.execute(delete(reviews).where(reviews.c.id == review_id))
+            await self._count_rollups(conn, [review], sign=-1)
+            await _bump_versions(conn, [review["company_id"]])
+        return review
+
+    async def list_reviews(
+        self,
+        company_id: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[Cursor] = None
+    ) -> List[Dict]:
+        query = select(reviews).order_by(reviews.c.created_at.desc(), reviews.c.id.desc()).limit(limit)
+        if company_id is not None:
+            query = query.where(reviews.c.company_id == company_id)
+
+        if after is not None:
+            created_at, review_id = after
+            query = query.where(
+                tuple_(reviews.c.created_at, reviews.c.id)
+                < tuple_(datetime.fromisoformat(created_at), review_id)
+            )
+        elif offset:
+            query = query.offset(offset)
+
+        async with self._engine.connect() as conn:
+            result = await conn.execute(query)
+            return [_from_row(row) for row in result]
+
+    async def count(self, company_id: Optional[str] = None) -> int:
+        query = select(func.count()).select_from(reviews)
+        if company_id is not None:
+            query = query.where(reviews.c.company_id == company_id)
+        async with self._engine.connect() as conn:
+            return (await conn.execute(query)).scalar_one()
+
+    async def company_aggregate(self, company_id: str) -> CompanyAggregate:
+        return (await self.company_aggregates([company_id]))[company_id]
+
+    @staticmethod
+    def _aggregate_columns() -> List:
+        """SUM/COUNT columns that make up a CompanyAggregate"""
+        columns = [func.count().label("review_count")]
+        for field in RATING_FIELDS:
+            columns.append(func.coalesce(func.sum(reviews.c[field]), 0).label(f"{field}_sum"))
+            columns.append(func.count(reviews.c[field]).label(f"{field}_count"))
+        for stars in range(1, 6):
+            columns.append(
+                func.coalesce(func.sum(case((reviews.c.overall_rating == stars, 1), else_=0)), 0)
+                .label(f"star_{stars}")
+            )
+        columns.append(
+            func.coalesce(func.sum(case((reviews.c.would_work_again.is_(True), 1), else_=0)), 0)
+            .label("would_work_again_count")
+        )
+        return columns
+
+    @staticmethod
+    def _fill(aggregate: CompanyAggregate, totals):
+        """Copy one row of _aggregate_columns into an aggregate"""
+        aggregate.review_count = totals["review_count"]
+        for field in RATING_FIELDS:
+            aggregate.rating_sums[field] = totals[f"{field}_sum"]
+            aggregate.rating_counts[field] = totals[f"{field}_count"]
+        aggregate.histogram = [totals[f"star_{stars}"] for stars in range(1, 6)]
+        aggregate.would_work_again_count = totals["would_work_again_count"]
+
+    async def company_aggregates(self, company_ids: Iterable[str]) -> Dict[str, CompanyAggregate]:
+        company_ids = list(company_ids)
+        aggregates = {company_id: CompanyAggregate() for company_id in company_ids}
+        if not company_ids:
+            return aggregates
+
+        # One grouped query for the whole batch, plus its issue counters
+        query = select(reviews.c.company_id, *self._aggregate_columns()).where(
+            reviews.c.company_id.in_(company_ids),
+            reviews.c.status == "published"
+        ).group_by(reviews.c.company_id)
+        issues = select(company_issues).where(
+            company_issues.c.company_id.in_(company_ids),
+            company_issues.c.review_count > 0
+        )
+        async with self._engine.connect() as conn:
+            rows = (await conn.execute(query)).all()
+            issue_rows = (await conn.execute(issues)).all()
+
+        for row in rows:
+            self._fill(aggregates[row.company_id], row._mapping)
+        for row in issue_rows:
+            aggregates[row.company_id].issue_counts[row.issue] = row.review_count
+        return aggregates
+
+    async def overall_aggregate(self) -> CompanyAggregate:
+        """Review total and issue frequencies only - both read from maintained counters"""
+        total = select(review_totals.c.review_count).where(review_totals.c.scope == ALL_COMPANIES)
+        issues = (
+            select(company_issues.c.issue, func.sum(company_issues.c.review_count).label("review_count"))
+            .group_by(company_issues.c.issue)
+            .having(func.sum(company_issues.c.review_count) > 0)
+        )
+        async with self._engine.connect() as conn:
+            review_count = (await conn.execute(total)).scalar()
+            issue_rows = (await conn.execute(issues)).all()
+
+        aggregate = CompanyAggregate()
+        aggregate.review_count = review_count or 0
+        for row in issue_rows:
+            aggregate.issue_counts[row.issue] = row.review_count
+        return aggregate
+
+    async def company_trends(self, company_id: str, since_month: str) -> Dict[str, TrendBucket]:
+        query = select(company_monthly_stats).where(
+            company_monthly_stats.c.company_id == company_id,
+            company_monthly_stats.c.month >= since_month,
+            company_monthly_stats.c.review_count > 0
+        )
+        async with self._engine.connect() as conn:
+            result = await conn.execute(query)
+            return {row.month: _bucket_from_row(row) for row in result}
+
+    async def company_trends_many(
+        self,
+        company_ids: Iterable[str],
+        since_month: str
+    ) -> Dict[str, Dict[str, TrendBucket]]:
+        company_ids = list(company_ids)
+        trends: Dict[str, Dict[str, TrendBucket]] = {company_id: {} for company_id in company_ids}
+        if not company_ids:
+            return trends
+
+        query = select(company_monthly_stats).where(
+            company_monthly_stats.c.company_id.in_(company_ids),
+            company_monthly_stats.c.month >= since_month,
+            company_monthly_stats.c.review_count > 0
+        )
+        async with self._engine.connect() as conn:
+            for row in await conn.execute(query):
+                trends[row.company_id][row.month] = _bucket_from_row(row)
+        return trends
+
+    async def rebuild_rollups(self, batch_size: int = 1000) -> Dict[str, int]:
+        """
+        Recompute company_issues, company_monthly_stats and review_totals from the reviews table
+
+        For backfills and repairs - the rollups are otherwise maintained by
+        every write. Reviews are streamed, so memory grows with the number
+        of company-months, not reviews.
+
+        Returns:
+            Number of issue counters and monthly buckets written
+        """
+        trends = CompanyTrends()
+        issue_counts: Dict[Tuple[str, str], int] = {}
+        review_count = 0
+        columns = [
+            reviews.c.company_id, reviews.c.created_at, reviews.c.status,
+            reviews.c.issues_reported, reviews.c.days_to_payment,
+            *(reviews.c[field] for field in RATING_FIELDS),
+        ]
+
+        async with self._engine.begin() as conn:
+            result = await conn.stream(select(*columns).where(reviews.c.status == "published"))
+            async for row in result:
+                review = _from_row(row)
+                trends.add(review)
+                review_count += 1
+                for issue in review_issues(review):
+                    key = (review["company_id"], issue)
+                    issue_counts[key] = issue_counts.get(key, 0) + 1
+
+            issue_rows = [
+                {"company_id": company_id, "issue": issue, "review_count": count}
+                for (company_id, issue), count in issue_counts.items()
+            ]
+            bucket_rows = [_bucket_row(*item) for item in trends.items()]
+
+            await conn.execute(delete(company_issues))
+            await conn.execute(delete(company_monthly_stats))
+            await conn.execute(delete(review_totals))
+            await conn.execute(insert(review_totals).values(scope=ALL_COMPANIES, review_count=review_count))
+            for table, rows in ((company_issues, issue_rows), (company_monthly_stats, bucket_rows)):
+                for start in range(0, len(rows), batch_size):
+                    await conn.execute(insert(table), rows[start:start + batch_size])
+            await _bump_versions(conn, (await conn.execute(select(companies.c.id))).scalars().all())
+
+        return {"issue_counters": len(issue_rows), "monthly_buckets": len(bucket_rows)}
+
+
+class SQLCompanyStore(CompanyStore):
+    """
+    Company store backed by the companies table
+
+    Top-ranked listings use the (entity_type, ranking_score) index.
+    Entity type priors are an aggregate over the table, so they are cached
+    for PRIOR_CACHE_SECONDS - a prior moves slowly.
+    """
+
+    PRIOR_CACHE_SECONDS = 300
+
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine
+        self._priors: Dict[str, Tuple[float, float]] = {}  # entity type -> (prior, fetched at)
+
+    @staticmethod
+    def _of_type(query, entity_type: Optional[str]):
+        """Restrict a query to one entity type (if given)"""
+        if entity_type:
+            query = query.where(companies.c.entity_type == entity_type)
+        return query
+
+    async def add(self, company: Dict) -> Dict:
+        async with self._engine.begin() as conn:
+            await conn.execute(insert(companies).values(**_to_row(companies, company)))
+        return company
+
+    async def add_many(self, company_list: List[Dict]):
+        """Insert a batch of companies in one statement"""
+        if not company_list:
+            return
+        async with self._engine.begin() as conn:
+            await conn.execute(insert(companies), [_to_row(companies, c, complete=True) for c in company_list])
+
+    async def get(self, company_id: str) -> Optional[Dict]:
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(companies).where(companies.c.id == company_id))
+            row = result.first()
+        return _from_row(row) if row else None
+
+    async def get_many(self, company_ids: Iterable[str]) -> Dict[str, Dict]:
+        company_ids = list(company_ids)
+        if not company_ids:
+            return {}
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(companies).where(companies.c.id.in_(company_ids)))
+            return {row.id: _from_row(row) for row in result}
+
+    async def update(self, company_id: str, fields: Dict) -> Optional[Dict]:
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                update(companies).where(companies.c.id == company_id).values(**_to_row(companies, fields))
+            )
+            await _bump_versions(conn, [company_id])
+        return await self.get(company_id)
+
+    async def list_companies(self) -> List[Dict]:
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(companies))
+            return [_from_row(row) for row in result]
+
+    async def page_by_id(
+        self,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+        entity_type: Optional[str] = None
+    ) -> List[Dict]:
+        query = self._of_type(select(companies).order_by(companies.c.id), entity_type).limit(limit)
+        if after_id is not None:
+            query = query.where(companies.c.id > after_id)
+        async with self._engine.connect() as conn:
+            result = await conn.execute(query)
+            return [_from_row(row) for row in result]
+
+    async def top_rated(
+        self,
+        entity_type: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0
+    ) -> List[Dict]:
+        query = self._of_type(
+            select(companies).order_by(companies.c.ranking_score.desc(), companies.c.id),
+            entity_type
+        ).limit(limit).offset(offset)
+        async with self._engine.connect() as conn:
+            result = await conn.execute(query)
+            return [_from_row(row) for row in result]
+
+    async def rating_prior(self, entity_type: str) -> float:
+        cached = self._priors.get(entity_type)
+        if cached is not None and time.monotonic() - cached[1] < self.PRIOR_CACHE_SECONDS:
+            return cached[0]
+
+        query = self._of_type(
+            select(
+                func.sum(companies.c.overall_rating * companies.c.review_count),
+                func.sum(companies.c.review_count),
+            ),
+            entity_type
+        )
+        async with self._engine.connect() as conn:
+            rating_sum, review_count = (await conn.execute(query)).one()
+
+        prior = rating_sum / review_count if review_count else DEFAULT_PRIOR_RATING
+        self._priors[entity_type] = (prior, time.monotonic())
+        return prior
+
+    async def count(self, entity_type: Optional[str] = None) -> int:
+        query = self._of_type(select(func.count()).select_from(companies), entity_type)
+        async with self._engine.connect() as conn:
+            return (await conn.execute(query)).scalar_one()
+
+    @staticmethod
+    def _matches(query: str):
+        """Substring match over legal name, DBA name and MC number"""
+        query_lower = query.lower()
+        return or_(
+            func.lower(companies.c.legal_name).contains(query_lower, autoescape=True),
+            func.lower(companies.c.dba_name).contains(query_lower, autoescape=True),
+            companies.c.mc_number.contains(query_lower, autoescape=True),
+        )
+
+    async def search_ids(self, query: str) -> List[str]:
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(companies.c.id).where(self._matches(query)))
+            return list(result.scalars())
+
+
+class SQLVersionRegistry(VersionRegistry):
+    """
+    ETag versions read from the company_versions table
+
+    The SQL stores bump versions in the same transaction as each write,
+    so every worker sharing the database answers a conditional GET the
+    same way. bump() is a no-op here. The epoch is the database's own
+    (VERSION_EPOCH_ROW, written when the schema is created), read in the
+    same query as the version, so a recreated database never matches old
+    tags. Votes still in a worker's buffer are not part of the version;
+    review listings add the buffer's pending-vote generation instead.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        super().__init__()
+        self._engine = engine
+
+    def bump(self, company_id: str):
+        pass
+
+    async def version(self, company_id: Optional[str] = None) -> int:
+        query = select(company_versions.c.version).where(
+            company_versions.c.company_id == (ALL_COMPANIES if company_id is None else company_id)
+        )
+        async with self._engine.connect() as conn:
+            return (await conn.execute(query)).scalar() or 0
+
+    async def _stamp(self, company_id: Optional[str]) -> Tuple[str, int]:
+        key = ALL_COMPANIES if company_id is None else company_id
+        query = select(company_versions.c.company_id, company_versions.c.version).where(
+            company_versions.c.company_id.in_([key, VERSION_EPOCH_ROW])
+        )
+        async with self._engine.connect() as conn:
+            rows = dict((await conn.execute(query)).all())
+        if VERSION_EPOCH_ROW not in rows:
+            # Tables created without create_tables()
+            async with self._engine.begin() as conn:
+                await create_version_epoch(conn)
+            return await self._stamp(company_id)
+        return f"{rows[VERSION_EPOCH_ROW]:08x}", rows.get(key, 0)
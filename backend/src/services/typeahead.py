@@ -0,0 +1,158 @@
+"""
+Company Typeahead
+Prefix index for company name / MC / DOT autocomplete
+
+Every normalized name token plus the MC and DOT numbers of a company is
+kept in one sorted array of (key, company_id) entries. A prefix maps to a
+contiguous slice found with two bisects, so a lookup only ever touches
+companies that actually match. Results for very short prefixes (the
+first keystrokes) are cached and invalidated per prefix on writes.
+Matches are ordered by ranking score, the same order search and browse use.
+"""
+
+import heapq
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+from src.utils.text import tokenize
+
+# Prefixes up to this length match large slices - cache their top results
+CACHED_PREFIX_LENGTH = 3
+
+
+def company_keys(company: Dict) -> Set[str]:
+    """Index keys for a company: name tokens plus MC/DOT numbers"""
+    keys = set(tokenize(company.get("legal_name", "")))
+    keys.update(tokenize(company.get("dba_name") or ""))
+    for field in ("mc_number", "dot_number"):
+        if company.get(field):
+            keys.add(str(company[field]))
+    return keys
+
+
+class PrefixIndex:
+    """
+    Sorted-array prefix index over company keys
+
+    Usage:
+        index = PrefixIndex()
+        index.add(company)
+        index.update_score(company_id, 4.5)
+        index.suggest("swi", limit=5)  # company IDs, best ranked first
+    """
+
+    def __init__(self, max_cached: int = 20):
+        self._entries: List[Tuple[str, str]] = []
+        self._keys: Dict[str, Tuple[str, ...]] = {}
+        self._scores: Dict[str, float] = {}
+        self._cache: Dict[str, List[str]] = {}
+        self._max_cached = max_cached
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, company_id: str) -> bool:
+        return company_id in self._keys
+
+    def _invalidate(self, keys):
+        """Drop cached results for every short prefix of the given keys"""
+        for key in keys:
+            for length in range(1, CACHED_PREFIX_LENGTH + 1):
+                self._cache.pop(key[:length], None)
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        """Slice of entries whose key starts with prefix"""
+        lo = bisect_left(self._entries, (prefix,))
+        hi = bisect_left(self._entries, (prefix + "\uffff",))
+        return lo, hi
+
+    def _matches(self, prefix: str) -> Set[str]:
+        """Company IDs with a key starting with prefix"""
+        lo, hi = self._range(prefix)
+        return {company_id for _, company_id in self._entries[lo:hi]}
+
+    def _top(self, company_ids, limit: int) -> List[str]:
+        """Best ranked company IDs (ties broken by ID for stable results)"""
+        return heapq.nlargest(
+            limit, company_ids, key=lambda cid: (self._scores[cid], cid)
+        )
+
+    def add(self, company: Dict):
+        """Index a new company, or re-index a company whose names changed"""
+        company_id = company["id"]
+        if company_id in self._keys:
+            self.remove(company_id)
+
+        keys = tuple(sorted(company_keys(company)))
+        for key in keys:
+            insort(self._entries, (key, company_id))
+        self._keys[company_id] = keys
+        self._scores[company_id] = company.get("ranking_score") or 0
+        self._invalidate(keys)
+
+    def add_many(self, companies):
+        """Bulk-load companies with a single sort (for startup and rebuilds)"""
+        for company in companies:
+            if company["id"] in self._keys:
+                self.remove(company["id"])
+            keys = tuple(sorted(company_keys(company)))
+            self._entries.extend((key, company["id"]) for key in keys)
+            self._keys[company["id"]] = keys
+            self._scores[company["id"]] = company.get("ranking_score") or 0
+        self._entries.sort()
+        self._cache.clear()
+
+    def remove(self, company_id: str):
+        """Remove a company from the index"""
+        keys = self._keys.pop(company_id, None)
+        if keys is None:
+            return
+
+        for key in keys:
+            del self._entries[bisect_left(self._entries, (key, company_id))]
+        del self._scores[company_id]
+        self._invalidate(keys)
+
+    def update_score(self, company_id: str, score: Optional[float]):
+        """Re-rank a company after its ranking score changes"""
+        if company_id not in self._keys:
+            return
+        self._scores[company_id] = score or 0
+        self._invalidate(self._keys[company_id])
+
+    def suggest(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Company IDs matching every query token as a prefix, best ranked first
+
+        Args:
+            query: Partial name, MC or DOT number as typed
+            limit: Maximum number of suggestions
+
+        Returns:
+            Matching company IDs
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        if len(tokens) == 1:
+            prefix = tokens[0]
+            if len(prefix) <= CACHED_PREFIX_LENGTH and limit <= self._max_cached:
+                cached = self._cache.get(prefix)
+                if cached is None:
+                    cached = self._cache[prefix] = self._top(self._matches(prefix), self._max_cached)
+                return cached[:limit]
+            return self._top(self._matches(prefix), limit)
+
+        # Multi-word query: start from the most selective token's slice and
+        # check the remaining tokens against each candidate's own keys
+        spans = [self._range(token) for token in tokens]
+        lo, hi = min(spans, key=lambda span: span[1] - span[0])
+        candidates = {company_id for _, company_id in self._entries[lo:hi]}
+        matching = [
+            company_id for company_id in candidates
+            if all(
+                any(key.startswith(token) for key in self._keys[company_id])
+                for token in tokens
+            )
+        ]
+        return self._top(matching, limit)
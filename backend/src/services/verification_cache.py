@@ -0,0 +1,141 @@
+"""
+Verification Cache
+Bounded TTL + LRU cache for FMCSA lookups
+
+Carrier authority data changes maybe once a day, while a QCMobile round
+trip takes hundreds of milliseconds and counts against the API quota.
+Found carriers are kept for CACHE_TTL, and numbers FMCSA does not know
+(negative results, stored as None) for the shorter CACHE_NEGATIVE_TTL so a
+newly granted authority shows up soon.
+
+After its TTL an entry is stale but still served for CACHE_STALE_TTL more
+seconds while the caller refreshes it in the background
+(stale-while-revalidate) - a repeat broker never waits on the network.
+When full, the least recently used entry is evicted.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+# Default lifetimes, in seconds
+CACHE_TTL = 24 * 60 * 60
+CACHE_NEGATIVE_TTL = 60 * 60
+CACHE_STALE_TTL = 24 * 60 * 60
+
+# Lookup states
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+class _Entry:
+    """A cached lookup result and when it goes stale / expires"""
+
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: Optional[Dict], fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class VerificationCache:
+    """
+    TTL + LRU cache with negative caching and stale entries
+
+    Usage:
+        cache = VerificationCache(max_size=10000)
+        state, value = cache.lookup(("mc", "123456"))
+        if state == MISS:
+            value = await fetch()
+            cache.store(("mc", "123456"), value)     # None = not found
+        elif state == STALE:
+            ...                                      # serve value, refresh in the background
+        cache.stats()                                # hits, misses, evictions, ...
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: float = CACHE_TTL,
+        negative_ttl: float = CACHE_NEGATIVE_TTL,
+        stale_ttl: float = CACHE_STALE_TTL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_size: Most entries kept before evicting the least recently used
+            ttl: Seconds a found result stays fresh
+            negative_ttl: Seconds a not-found result stays fresh
+            stale_ttl: Seconds an entry is still served after going stale
+            clock: Time source (monotonic seconds)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Tuple[str, Optional[Dict]]:
+        """
+        Cached value for a key
+
+        Returns:
+            (FRESH | STALE | MISS, value) - value is None on a miss or for a
+            cached not-found result
+        """
+        entry = self._entries.get(key)
+        now = self._clock()
+        if entry is None or now >= entry.stale_until:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return MISS, None
+
+        self._entries.move_to_end(key)
+        if now < entry.fresh_until:
+            self.hits += 1
+            return FRESH, entry.value
+        self.stale_hits += 1
+        return STALE, entry.value
+
+    def store(self, key: Hashable, value: Optional[Dict]):
+        """Cache a lookup result (None = not found, kept for negative_ttl)"""
+        now = self._clock()
+        fresh_until = now + (self.ttl if value is not None else self.negative_ttl)
+        self._entries[key] = _Entry(value, fresh_until, fresh_until + self.stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        """Drop one entry"""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Counters since startup, plus current size"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0
+        }
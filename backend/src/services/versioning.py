@@ -0,0 +1,72 @@
+"""
+Versioning
+Per-company version counters used to derive ETags
+
+Every write that changes what a company's profile or review listing
+returns bumps that company's version. An ETag is built from the version
+alone, so a conditional GET is answered without loading any data.
+
+VersionRegistry keeps the counters in process memory, which is only
+correct for the in-memory backend (one process owns all the data). The
+SQL backend uses SQLVersionRegistry (src/services/sql_store.py), whose
+versions live in the database and are bumped by the store writes
+themselves, so every worker derives the same ETags, under an epoch
+stored in the database itself. Votes still buffered in a worker are not
+in any version; review listings pass the vote buffer's pending-vote
+generation as part of the variant.
+"""
+
+import hashlib
+import uuid
+from typing import Dict, Optional, Tuple
+
+
+class VersionRegistry:
+    """
+    Version counters per company plus one global counter
+
+    ETags include a per-process epoch, so tags issued before a restart (or
+    by another worker with its own counters) never match by accident - they
+    just miss once and are replaced.
+
+    Usage:
+        versions = VersionRegistry()
+        versions.bump("company-1")
+        await versions.etag("company-1", "profile")
+    """
+
+    def __init__(self):
+        self._epoch = uuid.uuid4().hex[:8]
+        self._versions: Dict[str, int] = {}
+        self._global_version = 0
+
+    def bump(self, company_id: str):
+        """Record a change to a company's reviews or stats (called after the write)"""
+        self._versions[company_id] = self._versions.get(company_id, 0) + 1
+        self._global_version += 1
+
+    async def version(self, company_id: Optional[str] = None) -> int:
+        """Current version of a company, or the global version for None"""
+        if company_id is None:
+            return self._global_version
+        return self._versions.get(company_id, 0)
+
+    async def _stamp(self, company_id: Optional[str]) -> Tuple[str, int]:
+        """(epoch, version) an ETag is built from"""
+        return self._epoch, await self.version(company_id)
+
+    async def etag(self, company_id: Optional[str], *variant) -> str:
+        """
+        Strong ETag for one representation of a company's data
+
+        Args:
+            company_id: Company the representation depends on (None = all)
+            variant: Anything else that changes the body (endpoint, page params)
+
+        Returns:
+            Quoted ETag header value
+        """
+        key = "|".join(str(part) for part in (company_id, *variant))
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        epoch, version = await self._stamp(company_id)
+        return f'"{epoch}-{version}-{digest}"'
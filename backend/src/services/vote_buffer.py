@@ -0,0 +1,193 @@
+"""
+Vote Buffer
+Write-coalescing buffer for helpful / not-helpful review votes
+
+Votes are counted in memory per review and written to the store in one
+batch when enough have piled up or the flush interval passes. A viral
+review takes one UPDATE per flush instead of one per click. Reads add
+the not-yet-written deltas so counts still look instant, and ETags of
+review listings include the company's pending-vote generation, so a
+conditional GET never answers 304 for a page whose counts moved.
+"""
+
+import asyncio
+import uuid
+from typing import Awaitable, Callable, Dict, Optional
+
+# Review field each vote type counts toward
+VOTE_FIELDS = {
+    "helpful": "helpful_count",
+    "not_helpful": "not_helpful_count",
+}
+
+# Per-review pending deltas: {review_id: {"helpful_count": 3, ...}}
+Deltas = Dict[str, Dict[str, int]]
+
+
+class VoteBuffer:
+    """
+    In-memory vote counter with batched flushes
+
+    Every caller runs on the app's event loop, so the pending deltas are a
+    plain dict - nothing awaits between reading and updating it.
+
+    Usage:
+        buffer = VoteBuffer(flush_to=review_store.apply_counts)
+        buffer.record("review-1", "helpful", "company-1")
+        buffer.overlay(review)      # review with pending votes added
+        buffer.generation("company-1")  # part of the listing's ETag
+        await buffer.flush()        # write pending votes in one batch
+        buffer.flush_soon()         # or start it in the background
+    """
+
+    def __init__(
+        self,
+        flush_to: Callable[[Deltas], Awaitable[None]],
+        max_pending: int = 1000,
+        flush_interval: float = 2.0
+    ):
+        """
+        Args:
+            flush_to: Async callable that persists a batch of deltas
+            max_pending: Flush once this many votes are buffered
+            flush_interval: Seconds between background flushes
+        """
+        self._flush_to = flush_to
+        self._deltas: Deltas = {}
+        self._inflight: Deltas = {}
+        self._pending_votes = 0
+        # Votes not yet persisted per company, buffered and in-flight
+        self._company_votes: Dict[str, int] = {}
+        self._inflight_company_votes: Dict[str, int] = {}
+        self._token = uuid.uuid4().hex[:8]
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+
+    @property
+    def is_full(self) -> bool:
+        """True once enough votes are buffered to warrant a flush (in-flight ones not counted)"""
+        return self._pending_votes >= self.max_pending
+
+    def record(self, review_id: str, vote_type: str, company_id: str):
+        """Buffer one vote on a review of company_id"""
+        field = VOTE_FIELDS[vote_type]
+        counts = self._deltas.setdefault(review_id, {})
+        counts[field] = counts.get(field, 0) + 1
+        self._pending_votes += 1
+        self._company_votes[company_id] = self._company_votes.get(company_id, 0) + 1
+
+    def pending_votes(self, company_id: Optional[str] = None) -> int:
+        """Votes not yet persisted for a company's reviews, or for all reviews for None"""
+        if company_id is None:
+            return sum(self._company_votes.values()) + sum(self._inflight_company_votes.values())
+        return self._company_votes.get(company_id, 0) + self._inflight_company_votes.get(company_id, 0)
+
+    def generation(self, company_id: Optional[str] = None) -> str:
+        """
+        Pending-vote generation of a company's listings, for their ETags
+
+        Empty when nothing is pending. Otherwise the pending count, tagged
+        with this buffer's own token so another worker's pending votes
+        never produce the same value. The count only falls once a flush
+        has persisted the votes, and recording or persisting votes moves
+        the company's version, so a value is never reused for a different
+        body.
+        """
+        votes = self.pending_votes(company_id)
+        return f"{self._token}:{votes}" if votes else ""
+
+    def pending(self, review_id: str) -> Dict[str, int]:
+        """Votes not yet persisted for a review (buffered plus in-flight)"""
+        buffered = dict(self._deltas.get(review_id, {}))
+        for field, delta in self._inflight.get(review_id, {}).items():
+            buffered[field] = buffered.get(field, 0) + delta
+        return buffered
+
+    def overlay(self, review: Dict) -> Dict:
+        """
+        Review with pending votes added to its counts
+
+        Returns the review itself when nothing is pending, otherwise a copy
+        (the stored review is never modified).
+        """
+        pending = self.pending(review["id"])
+        if not pending:
+            return review
+
+        review = dict(review)
+        for field in VOTE_FIELDS.values():
+            review[field] = (review.get(field) or 0) + pending.get(field, 0)
+        return review
+
+    async def flush(self):
+        """Write every buffered vote to the store in one batch"""
+        async with self._flush_lock:
+            batch, self._deltas = self._deltas, {}
+            if not batch:
+                return
+
+            self._pending_votes = 0
+            self._inflight = batch
+            company_votes, self._company_votes = self._company_votes, {}
+            self._inflight_company_votes = company_votes
+            try:
+                await self._flush_to(batch)
+            except Exception:
+                # Put the votes back so the next flush retries them
+                for review_id, counts in batch.items():
+                    pending = self._deltas.setdefault(review_id, {})
+                    for field, delta in counts.items():
+                        pending[field] = pending.get(field, 0) + delta
+                        self._pending_votes += delta
+                for company_id, votes in company_votes.items():
+                    self._company_votes[company_id] = self._company_votes.get(company_id, 0) + votes
+                raise
+            finally:
+                self._inflight = {}
+                self._inflight_company_votes = {}
+
+    async def _flush_logged(self):
+        """Flush, logging a failure - the votes stay buffered for the next try"""
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"✗ Error flushing votes: {e}")
+
+    def flush_soon(self):
+        """
+        Start a background flush unless one is already running
+
+        For callers that must not wait on the write (or fail with it), e.g.
+        a request that filled the buffer.
+        """
+        if self._flush_lock.locked() or (self._flush_task is not None and not self._flush_task.done()):
+            return
+        self._flush_task = asyncio.create_task(self._flush_logged())
+
+    async def _run(self):
+        """Background loop - flush every flush_interval seconds"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_logged()
+
+    def start(self):
+        """Start background flushing (call from a running event loop)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop background flushing and write whatever is still buffered"""
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
@@ -74,6 +74,15 @@ class Config:
                 "name": os.getenv("DB_NAME", "carrier_board"),
                 "user": os.getenv("DB_USER", "postgres"),
                 "password": os.getenv("DB_PASSWORD", "postgres"),
+                "backend": os.getenv("DATABASE_BACKEND", "memory"),  # 'memory' or 'sql'
+                "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+                "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+                "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+                "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+                "echo": os.getenv("DB_ECHO", "False").lower() == "true",
+            },
+            "search": {
+                "snapshot_path": os.getenv("SEARCH_SNAPSHOT_PATH", ""),  # empty = rebuild at startup
             },
             "jwt": {
                 "secret": os.getenv("JWT_SECRET", "change-this-secret-key"),
@@ -85,6 +94,20 @@ class Config:
                 "api_key": os.getenv("FMCSA_API_KEY", ""),
                 "api_url": os.getenv("FMCSA_API_URL", "https://mobile.fmcsa.dot.gov/qc/services/carriers"),
                 "timeout": int(os.getenv("FMCSA_TIMEOUT", "10")),
+                "max_connections": int(os.getenv("FMCSA_MAX_CONNECTIONS", "20")),
+                "max_keepalive_connections": int(os.getenv("FMCSA_MAX_KEEPALIVE", "10")),
+                "keepalive_expiry": float(os.getenv("FMCSA_KEEPALIVE_EXPIRY", "30")),
+                "http2": os.getenv("FMCSA_HTTP2", "True").lower() == "true",
+                "cache_size": int(os.getenv("FMCSA_CACHE_SIZE", "10000")),
+                "cache_ttl": int(os.getenv("FMCSA_CACHE_TTL", "86400")),
+                "cache_negative_ttl": int(os.getenv("FMCSA_CACHE_NEGATIVE_TTL", "3600")),
+                "cache_stale_ttl": int(os.getenv("FMCSA_CACHE_STALE_TTL", "86400")),
+                "rate_limit_per_second": float(os.getenv("FMCSA_RATE_LIMIT_PER_SECOND", "10")),
+                "rate_limit_burst": int(os.getenv("FMCSA_RATE_LIMIT_BURST", "10")),
+                "batch_concurrency": int(os.getenv("FMCSA_BATCH_CONCURRENCY", "10")),
+                "census_path": os.getenv("FMCSA_CENSUS_PATH", ""),  # empty = API only
+                "latency_budget": float(os.getenv("FMCSA_LATENCY_BUDGET", "5")),
+                "section_timeout": float(os.getenv("FMCSA_SECTION_TIMEOUT", "3")),
             },
             "email": {
                 "smtp_host": os.getenv("SMTP_HOST", "smtp.gmail.com"),
@@ -193,12 +216,46 @@ def get_jwt_secret() -> str:
     return config.get_jwt_secret()
 
 
+def get_database_config() -> Dict[str, Any]:
+    """Get database connection and pool configuration"""
+    return {
+        "url": config.get("database.url"),
+        "backend": config.get("database.backend", "memory"),
+        "pool_size": config.get("database.pool_size", 10),
+        "max_overflow": config.get("database.max_overflow", 20),
+        "pool_timeout": config.get("database.pool_timeout", 30),
+        "pool_recycle": config.get("database.pool_recycle", 1800),
+        "echo": config.get("database.echo", False),
+    }
+
+
+def get_search_config() -> Dict[str, Any]:
+    """Get review search index configuration"""
+    return {
+        "snapshot_path": config.get("search.snapshot_path", ""),
+    }
+
+
 def get_fmcsa_config() -> Dict[str, Any]:
-    """Get FMCSA API configuration"""
+    """Get FMCSA API, connection pool, cache, rate limit and census snapshot configuration"""
     return {
         "api_key": config.get("fmcsa.api_key"),
         "api_url": config.get("fmcsa.api_url"),
         "timeout": config.get("fmcsa.timeout", 10),
+        "max_connections": config.get("fmcsa.max_connections", 20),
+        "max_keepalive_connections": config.get("fmcsa.max_keepalive_connections", 10),
+        "keepalive_expiry": config.get("fmcsa.keepalive_expiry", 30),
+        "http2": config.get("fmcsa.http2", True),
+        "cache_size": config.get("fmcsa.cache_size", 10000),
+        "cache_ttl": config.get("fmcsa.cache_ttl", 86400),
+        "cache_negative_ttl": config.get("fmcsa.cache_negative_ttl", 3600),
+        "cache_stale_ttl": config.get("fmcsa.cache_stale_ttl", 86400),
+        "rate_limit_per_second": config.get("fmcsa.rate_limit_per_second", 10),
+        "rate_limit_burst": config.get("fmcsa.rate_limit_burst", 10),
+        "batch_concurrency": config.get("fmcsa.batch_concurrency", 10),
+        "census_path": config.get("fmcsa.census_path", ""),
+        "latency_budget": config.get("fmcsa.latency_budget", 5),
+        "section_timeout": config.get("fmcsa.section_timeout", 3),
     }
 
 
@@ -0,0 +1,94 @@
+"""
+Database Engine
+Async SQLAlchemy engine with a tuned connection pool
+
+Usage:
+    from src.utils.database import create_engine, create_tables
+
+    engine = create_engine()             # uses database.url from config
+    await create_tables(engine)
+"""
+
+import secrets
+from typing import Any, Dict, Optional
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+from src.models.tables import company_versions, metadata
+from src.utils.config import get_database_config
+
+# Sync driver URLs from config mapped to their async drivers
+_ASYNC_DRIVERS = {
+    "postgresql://": "postgresql+asyncpg://",
+    "postgresql+psycopg2://": "postgresql+asyncpg://",
+    "postgres://": "postgresql+asyncpg://",
+    "sqlite://": "sqlite+aiosqlite://",
+}
+
+# company_versions row whose version is the database's random ETag epoch
+VERSION_EPOCH_ROW = "#epoch"
+
+
+def to_async_url(url: str) -> str:
+    """Rewrite a database URL to use an async driver"""
+    for prefix, async_prefix in _ASYNC_DRIVERS.items():
+        if url.startswith(prefix):
+            return async_prefix + url[len(prefix):]
+    return url
+
+
+def create_engine(url: Optional[str] = None, **overrides: Any) -> AsyncEngine:
+    """
+    Create the async engine
+
+    Postgres gets a sized QueuePool with pre-ping and recycling so stale
+    connections are replaced instead of failing requests. SQLite (used by
+    tests and local development) shares a single connection.
+
+    Args:
+        url: Database URL (defaults to database.url from config)
+        overrides: Extra create_async_engine keyword arguments
+
+    Returns:
+        AsyncEngine
+    """
+    settings = get_database_config()
+    url = to_async_url(url or settings["url"])
+
+    options: Dict[str, Any] = {"echo": settings["echo"]}
+    if url.startswith("sqlite"):
+        options["poolclass"] = StaticPool
+        options["connect_args"] = {"check_same_thread": False}
+    else:
+        options.update(
+            pool_size=settings["pool_size"],
+            max_overflow=settings["max_overflow"],
+            pool_timeout=settings["pool_timeout"],
+            pool_recycle=settings["pool_recycle"],
+            pool_pre_ping=True,
+        )
+    options.update(overrides)
+
+    return create_async_engine(url, **options)
+
+
+async def create_version_epoch(conn: AsyncConnection):
+    """
+    Give the database a random ETag epoch unless it already has one
+
+    A recreated database gets a new epoch, so ETags issued against the old
+    one never match its restarted version counters.
+    """
+    upsert = (postgresql_insert if conn.dialect.name == "postgresql" else sqlite_insert)(company_versions)
+    await conn.execute(
+        upsert.values(company_id=VERSION_EPOCH_ROW, version=secrets.randbelow(2 ** 31))
+        .on_conflict_do_nothing(index_elements=["company_id"])
+    )
+
+
+async def create_tables(engine: AsyncEngine):
+    """Create tables and indexes that do not exist yet, and the ETag epoch"""
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        await create_version_epoch(conn)
@@ -0,0 +1,40 @@
+"""
+HTTP Caching Helpers
+Conditional GET (If-None-Match / 304) and Cache-Control headers
+"""
+
+from typing import Optional
+from fastapi import Response
+
+# Short shared-cache lifetime for polled endpoints; CDNs may serve a stale
+# copy while they revalidate with If-None-Match
+POLLED_CACHE_CONTROL = "public, max-age=5, s-maxage=15, stale-while-revalidate=30"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches an ETag
+
+    Uses the weak comparison RFC 7232 specifies for If-None-Match, so a
+    "W/" prefix added by a proxy still matches.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str = POLLED_CACHE_CONTROL):
+    """Attach ETag and Cache-Control to a response"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified(etag: str, cache_control: str = POLLED_CACHE_CONTROL) -> Response:
+    """Empty 304 response carrying the validators"""
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, cache_control)
+    return response
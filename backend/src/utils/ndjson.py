@@ -0,0 +1,39 @@
+"""
+NDJSON Helpers
+Newline-delimited JSON for streaming imports and exports
+"""
+
+import json
+from typing import AsyncIterable, AsyncIterator, Dict, Tuple
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[Tuple[int, bytes]]:
+    """
+    Split a byte stream into lines as it arrives
+
+    Only the current partial line is buffered, so memory stays flat no
+    matter how large the body is. Blank lines are skipped but still counted.
+
+    Args:
+        chunks: Async iterable of byte chunks (e.g. request.stream())
+
+    Yields:
+        (1-based line number, line without its newline)
+    """
+    pending = b""
+    line_number = 0
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, line
+
+    if pending.strip():
+        yield line_number + 1, pending
+
+
+def encode_line(record: Dict) -> bytes:
+    """One record as an NDJSON line"""
+    return json.dumps(record, separators=(",", ":"), default=str).encode() + b"\n"
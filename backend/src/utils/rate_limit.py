@@ -0,0 +1,52 @@
+"""
+Rate Limiting
+Token bucket for keeping outbound API calls under a provider's quota
+"""
+
+import asyncio
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    Async token bucket - `rate` calls per second on average, bursts up to `capacity`
+
+    Waiters are served in arrival order. Sleeps use the event loop, so a
+    caller waiting for a token never blocks other requests.
+
+    Usage:
+        bucket = TokenBucket(rate=10, capacity=10)
+        await bucket.acquire()      # returns at once, or when a token is free
+        await call_upstream()
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Most tokens held at once (the largest burst)
+            clock: Time source (monotonic seconds)
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("TokenBucket needs rate > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Take one token, waiting until one is available"""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
@@ -0,0 +1,109 @@
+"""
+Text Normalization Helpers
+Shared by the company and review search indexes
+"""
+
+import re
+from typing import List, Set
+
+# Punctuation dropped inside words so "J.B." matches "JB" and "O'Neil" matches "ONeil"
+_JOINERS = re.compile(r"[.'`]")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """
+    Lowercase text and collapse punctuation/whitespace to single spaces
+
+    Examples:
+        normalize("J.B. Hunt Transport")  # "jb hunt transport"
+        normalize("  Swift-Freight ")     # "swift freight"
+    """
+    text = _JOINERS.sub("", (text or "").lower())
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into normalized tokens"""
+    normalized = normalize(text)
+    return normalized.split() if normalized else []
+
+
+# Words too common to be worth indexing in review text
+STOPWORDS = frozenset("""
+a an and are as at be but by for from had has have he i in is it its me my
+no not of on or our so that the their them they this to was we were with you
+""".split())
+
+_VOWELS = frozenset("aeiouy")
+
+
+def stem(token: str) -> str:
+    """
+    Light suffix-stripping stemmer (plurals, -ed, -ing, final -e/-y)
+
+    Maps inflections of a word to one form so "brokered", "brokers" and
+    "brokering" all match "broker". Stems are index keys, not words:
+        stem("changed")  # "chang"
+        stem("change")   # "chang"
+    """
+    if len(token) <= 3 or not token.isalpha():
+        return token
+
+    # Plurals
+    if token.endswith("sses") or token.endswith("ies"):
+        token = token[:-2]
+    elif token.endswith("s") and not token.endswith(("ss", "us")):
+        token = token[:-1]
+
+    # Past tense and progressive ("rated" -> "rat", the same stem as "rate")
+    for suffix in ("ing", "ed"):
+        base = token[:-len(suffix)]
+        if token.endswith(suffix) and len(base) >= 3 and any(c in _VOWELS for c in base):
+            if base[-1] == base[-2] and base[-1] not in "lsz":
+                base = base[:-1]  # stopped -> stop
+            return base[:-1] + "i" if base.endswith("y") and len(base) > 3 else base
+
+    if len(token) > 3 and token[-1] in "ye":
+        return token[:-1] + ("i" if token[-1] == "y" else "")
+    return token
+
+
+def trigrams(token: str) -> Set[str]:
+    """Padded character trigrams of a token ("  s", " sw", "swi", ...)"""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Optimal string alignment distance
+
+    Counts insertions, deletions, substitutions and transpositions of
+    adjacent characters, so "swfit" -> "swift" is a single edit.
+    """
+    if a == b:
+        return 0
+    if not a or not b:
+        return len(a) or len(b)
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(
+                previous[j] + 1,         # deletion
+                current[j - 1] + 1,      # insertion
+                previous[j - 1] + cost,  # substitution
+            )
+            if (
+                previous2 is not None
+                and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+            ):
+                current[j] = min(current[j], previous2[j - 2] + 1)  # transposition
+        previous2, previous = previous, current
+    return previous[-1]
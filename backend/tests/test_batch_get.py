@@ -0,0 +1,50 @@
+"""
+Test Batch Get Endpoints
+"""
+
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.routes.reviews import MAX_BATCH_GET_IDS
+
+client = TestClient(app)
+
+
+def test_batch_get_companies():
+    """Found companies match their profile; unknown IDs are marked, not fatal"""
+    response = client.post("/api/companies:batchGet", json={
+        "ids": ["company-2", "missing-company", "company-1", "company-2"]
+    })
+    assert response.status_code == 200
+    data = response.json()
+
+    assert list(data["companies"]) == ["company-2", "missing-company", "company-1"]
+    assert data["companies"]["missing-company"] == {"error": "not_found"}
+    assert data["found"] == 2
+    assert data["missing"] == ["missing-company"]
+
+    profile = client.get("/api/companies/company-1").json()
+    assert data["companies"]["company-1"] == profile
+
+
+def test_batch_get_reviews():
+    """Reviews come back keyed by ID with buffered votes included"""
+    review_id = client.get("/api/reviews", params={"limit": 1}).json()["reviews"][0]["id"]
+    client.post(f"/api/reviews/{review_id}/vote", params={"vote_type": "helpful"})
+
+    data = client.post("/api/reviews:batchGet", json={"ids": [review_id, "nope"]}).json()
+    assert data["reviews"][review_id] == client.get(f"/api/reviews/{review_id}").json()
+    assert data["reviews"]["nope"] == {"error": "not_found"}
+    assert data["missing"] == ["nope"]
+
+
+def test_batch_get_limits():
+    """Empty and oversized batches are rejected"""
+    assert client.post("/api/reviews:batchGet", json={"ids": []}).status_code == 422
+    too_many = [f"company-{i}" for i in range(MAX_BATCH_GET_IDS + 1)]
+    assert client.post("/api/companies:batchGet", json={"ids": too_many}).status_code == 422
@@ -0,0 +1,133 @@
+"""
+Test Broker Verification Enrichment
+"""
+
+import asyncio
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.routes import verification
+from src.services.fmcsa_service import FMCSAService
+
+client = TestClient(app)
+
+
+class SectionAPI:
+    """QCMobile stand-in with a delay (seconds) or status code per endpoint"""
+
+    def __init__(self, **behaviour):
+        self.behaviour = {"docket": 0, "authority": 0, "dot": 0, "basics": 0, **behaviour}
+        self.calls = []
+
+    async def __call__(self, request):
+        parts = request.url.path.split("/")
+        endpoint = {"docket-number": "docket", "dot": "dot"}.get(parts[-2], parts[-1])
+        self.calls.append(endpoint)
+        behaviour = self.behaviour[endpoint]
+        if isinstance(behaviour, int) and behaviour >= 400:
+            return httpx.Response(behaviour)
+        await asyncio.sleep(behaviour)
+        carrier = {
+            "mcNumber": "123456", "dotNumber": "3000001", "legalName": "Lone Star Logistics",
+            "entityType": "BROKER", "bipdInsuranceRequired": "Y", "bipdInsuranceOnFile": "750",
+        }
+        content = {
+            "docket": {"carrier": carrier},
+            "dot": {"carrier": carrier},
+            "authority": [{"carrierAuthority": {"brokerAuthorityStatus": "A"}}],
+            "basics": [{"basic": {"basicsShortDesc": "Unsafe Driving"}, "percentile": "12"}],
+        }[endpoint]
+        return httpx.Response(200, json={"content": content})
+
+
+def make_service(api=None, **behaviour):
+    return FMCSAService(
+        api_key="test-key",
+        api_url="https://fmcsa.test/carriers",
+        transport=httpx.MockTransport(api or SectionAPI(**behaviour))
+    )
+
+
+@pytest.mark.asyncio
+async def test_sections_fetched_concurrently():
+    """Three 0.2 s sections take about 0.2 s, not 0.6 s"""
+    service = make_service(authority=0.2, dot=0.2, basics=0.2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await service.verify_broker_by_mc("123456", latency_budget=2)
+    assert loop.time() - start < 0.45
+
+    assert result["sections"] == {"authority": "ok", "insurance": "ok", "basics": "ok"}
+    assert result["authority"][0]["carrierAuthority"]["brokerAuthorityStatus"] == "A"
+    assert result["insurance"]["bipd_on_file"] == "750"
+    assert result["basics"]["basics"][0]["percentile"] == "12"
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_or_failing_sections_are_partial():
+    """The budget caps the wait; a slow section times out and a failing one is marked"""
+    service = make_service(basics=5, authority=503)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await service.verify_broker_by_mc("123456", latency_budget=0.3)
+    assert loop.time() - start < 0.6
+
+    assert result["company_name"] == "Lone Star Logistics"
+    assert result["sections"] == {"authority": "error", "insurance": "ok", "basics": "timeout"}
+    assert result["basics"] is None and result["authority"] is None
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_insurance_shares_the_dot_lookup():
+    """Insurance comes from the cached DOT record - one carrier request for both"""
+    api = SectionAPI()
+    service = make_service(api)
+    result = await service.verify_broker_by_mc("123456")
+    assert result["insurance"]["bipd_required"] == "Y"
+    assert (await service.verify_dot_number("3000001"))["insurance"]["bipd_on_file"] == "750"
+    assert sorted(api.calls) == ["authority", "basics", "docket", "dot"]
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_mock_sections_are_copies():
+    service = FMCSAService(api_key="")
+    first = await service.verify_broker_by_mc("123456")
+    first["insurance"]["bipd_on_file"] = "0"
+    first["basics"]["basics"].append("changed")
+    second = await service.verify_broker_by_mc("123456")
+    assert second["insurance"]["bipd_on_file"] == "750"
+    assert second["basics"]["basics"] == []
+
+
+@pytest.mark.asyncio
+async def test_mc_lookup_over_budget_times_out():
+    service = make_service(docket=1)
+    with pytest.raises(asyncio.TimeoutError):
+        await service.verify_broker_by_mc("123456", latency_budget=0.1)
+    await service.close()
+
+
+def test_broker_route_surfaces_enrichment():
+    """Mock mode: authority, insurance and basics come back with their status"""
+    data = client.get("/api/verify/broker/123456").json()
+    assert data["verified"] is True and data["is_broker"] is True
+    assert data["authority"]["boc3_filed"] is True
+    assert data["insurance"]["bipd_on_file"] == "750"
+    assert data["sections"] == {"authority": "ok", "insurance": "ok", "basics": "ok"}
+
+
+def test_broker_route_budget(monkeypatch):
+    """An MC lookup that can't finish in the budget is a 504"""
+    monkeypatch.setattr(verification, "fmcsa_service", make_service(docket=1))
+    assert client.get("/api/verify/broker/123456", params={"budget": 0.1}).status_code == 504
+    assert client.get("/api/verify/broker/12x").status_code == 400
@@ -0,0 +1,97 @@
+"""
+Test Bulk Review Import
+"""
+
+import json
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.services.review_store import InMemoryReviewStore
+from src.utils.ndjson import iter_lines
+
+client = TestClient(app)
+
+
+def review_line(**fields) -> str:
+    review = {
+        "company_id": "company-30",
+        "overall_rating": 5,
+        "title": "Fast unload",
+        "content": "In and out of the DC in under two hours."
+    }
+    review.update(fields)
+    return json.dumps(review)
+
+
+def test_import_reports_bad_lines():
+    """Valid lines are imported, bad ones reported by line number"""
+    before = client.get("/api/companies/company-30").json()["stats"]["total_reviews"]
+
+    body = "\n".join([
+        review_line(created_at="2023-03-01T08:00:00"),
+        review_line(overall_rating=9),
+        "{not json",
+        "",
+        review_line(company_id="company-8"),
+        review_line(company_id="company-missing"),
+        review_line(overall_rating=1, created_at="2023-04-01T08:00:00"),
+    ])
+    response = client.post("/api/reviews/import?batch_size=1", content=body)
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["imported"] == 2
+    assert data["failed"] == 4
+    assert data["companies_updated"] == 1
+    assert [error["line"] for error in data["errors"]] == [2, 3, 5, 6]
+    assert "overall_rating" in data["errors"][0]["error"]
+    assert "Cannot review FREIGHT_FORWARDER" in data["errors"][2]["error"]
+    assert data["errors"][3]["error"] == "Company not found"
+
+    # Ratings refreshed once at the end
+    stats = client.get("/api/companies/company-30").json()["stats"]
+    assert stats["total_reviews"] == before + 2
+
+    # Historical dates are kept, so imports sort behind newer reviews
+    reviews = client.get("/api/reviews", params={"company_id": "company-30", "limit": 100}).json()["reviews"]
+    assert reviews[-1]["created_at"] == "2023-03-01T08:00:00"
+
+
+def test_import_error_report_is_capped():
+    body = "\n".join(["{}"] * 5)
+    data = client.post("/api/reviews/import?max_errors=2", content=body).json()
+    assert data["failed"] == 5
+    assert len(data["errors"]) == 2
+    assert data["errors_truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_add_many_merges_into_order():
+    """Batch inserts keep listings newest first"""
+    store = InMemoryReviewStore([
+        {"id": "r2", "company_id": "c1", "created_at": "2024-02-01T00:00:00", "status": "published", "overall_rating": 4}
+    ])
+    await store.add_many([
+        {"id": "r3", "company_id": "c1", "created_at": "2024-03-01T00:00:00", "status": "published", "overall_rating": 2},
+        {"id": "r1", "company_id": "c1", "created_at": "2024-01-01T00:00:00", "status": "published", "overall_rating": 3},
+    ])
+    assert [r["id"] for r in await store.list_reviews("c1")] == ["r3", "r2", "r1"]
+    assert (await store.company_aggregate("c1")).review_count == 3
+
+    with pytest.raises(ValueError):
+        await store.add_many([{"id": "r1", "company_id": "c1", "created_at": "2024-05-01T00:00:00"}])
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_across_chunks():
+    async def chunks():
+        for chunk in (b'{"a":', b'1}\n\n{"b"', b':2}'):
+            yield chunk
+
+    assert [line async for line in iter_lines(chunks())] == [(1, b'{"a":1}'), (3, b'{"b":2}')]
@@ -0,0 +1,95 @@
+"""
+Test FMCSA Census Snapshot
+"""
+
+import csv
+import httpx
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.census_snapshot import CensusSnapshot, build_snapshot, number_key, read_census_csv
+from src.services.fmcsa_service import FMCSAService
+
+CENSUS_ROWS = [
+    {"DOT_NUMBER": "3000001", "DOCKET1PREFIX": "MC", "DOCKET1": "123456", "LEGAL_NAME": "Lone Star Logistics",
+     "ENTITY_TYPE": "Broker", "PHY_STATE": "TX", "DRIVER_TOTAL": "0"},
+    {"DOT_NUMBER": "42", "DOCKET1PREFIX": "MC", "DOCKET1": "777", "LEGAL_NAME": "Tiny Trucking",
+     "ENTITY_TYPE": "CARRIER", "PHY_STATE": "OK", "DRIVER_TOTAL": "3"},
+    {"DOT_NUMBER": "55", "DOCKET1PREFIX": "FF", "DOCKET1": "999", "LEGAL_NAME": "Forwarder Inc",
+     "ENTITY_TYPE": "", "PHY_STATE": "", "DRIVER_TOTAL": ""},
+]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    csv_path = tmp_path / "census.csv"
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(CENSUS_ROWS[0]))
+        writer.writeheader()
+        writer.writerows(CENSUS_ROWS)
+
+    path = str(tmp_path / "census.snapshot")
+    counts = build_snapshot(read_census_csv(str(csv_path)), path)
+    assert counts == {"records": 3, "dot_numbers": 3, "mc_numbers": 2}
+    return path
+
+
+def test_snapshot_lookups(snapshot_path):
+    """Both indexes find their records; formatting of the number doesn't matter"""
+    census = CensusSnapshot.open(snapshot_path)
+
+    broker = census.get("mc", "MC-0123456")
+    assert broker["company_name"] == "Lone Star Logistics"
+    assert broker["dot_number"] == "3000001"
+    assert broker["entity_type"] == "BROKER"
+    assert broker["physical_address"]["state"] == "TX"
+    assert census.get("dot", "42")["total_drivers"] == 3
+
+    # FF dockets are not MC numbers; unknown and empty numbers miss
+    assert census.get("mc", "999") is None
+    assert census.get("dot", "55")["mc_number"] is None
+    assert census.get("dot", "43") is None
+    assert census.get("mc", "") is None
+    assert number_key("MC-000777") == 777
+    census.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-snapshot"
+    path.write_bytes(b"x" * 128)
+    with pytest.raises(ValueError):
+        CensusSnapshot.open(str(path))
+
+
+@pytest.mark.asyncio
+async def test_service_checks_snapshot_before_api(snapshot_path):
+    """Census numbers never reach the API; misses still do"""
+    calls = []
+
+    def api(request):
+        calls.append(request.url.path)
+        return httpx.Response(404)
+
+    service = FMCSAService(
+        api_key="test-key",
+        api_url="https://fmcsa.test/carriers",
+        transport=httpx.MockTransport(api),
+        census=CensusSnapshot.open(snapshot_path)
+    )
+
+    result = await service.verify_mc_number("123456")
+    assert result["company_name"] == "Lone Star Logistics"
+    assert result["source"] == "census" and result["verified"] is True
+    assert (await service.verify_broker_by_mc("123456"))["dot_number"] == "3000001"
+    assert await service.verify_broker_by_mc("777") is None    # a carrier
+    # Enrichment sections are not in the census
+    assert sorted(calls) == ["/carriers/3000001/authority", "/carriers/3000001/basics", "/carriers/dot/3000001"]
+
+    assert await service.verify_dot_number("8888") is None
+    assert calls[-1] == "/carriers/dot/8888"
+    await service.close()
+    assert service.census is None
@@ -0,0 +1,116 @@
+"""
+Test Faceted Company Browsing
+"""
+
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.routes import reviews as reviews_routes
+from src.routes.reviews import mock_companies
+from src.services.company_store import InMemoryCompanyStore
+from src.services.company_facets import FacetIndex, rating_bucket
+
+client = TestClient(app)
+
+
+def make_company(company_id, entity_type="BROKER", state="TX", rating=4.0, score=4.0, payment_issues=False):
+    return {
+        "id": company_id,
+        "entity_type": entity_type,
+        "physical_state": state,
+        "overall_rating": rating,
+        "ranking_score": score,
+        "has_payment_issues": payment_issues,
+    }
+
+
+def test_rating_bucket():
+    assert rating_bucket(None) == "unrated"
+    assert rating_bucket(5.0) == "4-5"
+    assert rating_bucket(3.99) == "3-4"
+    assert rating_bucket(1.0) == "1-2"
+
+
+def test_select_counts_and_top():
+    """OR within a facet, AND across facets; counts ignore the facet's own filter"""
+    facets = FacetIndex()
+    facets.add(make_company("a", state="TX", score=4.5))
+    facets.add(make_company("b", state="CA", rating=2.5, score=2.5, payment_issues=True))
+    facets.add(make_company("c", state="TX", rating=3.2, score=3.2, payment_issues=True))
+    facets.add(make_company("d", entity_type="SHIPPER", state="CA", score=4.9))
+
+    bits = facets.select({"physical_state": ["TX", "CA"], "entity_type": ["BROKER"]})
+    assert bits.bit_count() == 3
+    assert facets.top(bits, limit=2) == ["a", "c"]
+    assert facets.top(bits, limit=2, offset=2) == ["b"]
+
+    filters = {"physical_state": ["TX"], "has_payment_issues": ["true"]}
+    assert facets.top(facets.select(filters)) == ["c"]
+    counts = facets.counts(filters)
+    assert counts["physical_state"] == {"CA": 1, "TX": 1}          # payment issues only
+    assert counts["has_payment_issues"] == {"false": 1, "true": 1}  # TX only
+    assert counts["rating_bucket"] == {"3-4": 1}
+
+    # Re-indexing moves the company between bitsets
+    facets.add(make_company("c", state="CA", rating=3.2, score=3.2, payment_issues=True))
+    assert facets.counts(filters)["physical_state"] == {"CA": 2, "TX": 0}
+    facets.remove("b")
+    assert facets.select({}).bit_count() == 3
+    assert facets.filter_ids(["d", "b", "a"], facets.select({"entity_type": ["BROKER"]})) == ["a"]
+
+
+def test_companies_facets_block():
+    """Browse returns filtered companies plus facet counts"""
+    data = client.get("/api/companies", params={"limit": 100}).json()
+    facets = data["facets"]
+    assert sum(facets["entity_type"].values()) == len(mock_companies)
+    assert facets["has_payment_issues"]["true"] >= 1
+
+    params = [("physical_state", "ca"), ("physical_state", "wa"), ("entity_type", "broker"), ("limit", 100)]
+    data = client.get("/api/companies", params=params).json()
+    expected = [
+        c for c in mock_companies.values()
+        if c["entity_type"] == "BROKER" and c["physical_state"] in ("CA", "WA")
+    ]
+    assert data["total"] == len(expected)
+    assert {c["id"] for c in data["companies"]} == {c["id"] for c in expected}
+    scores = [c["ranking_score"] for c in data["companies"]]
+    assert scores == sorted(scores, reverse=True)
+    assert data["facets"]["entity_type"]["SHIPPER"] == 2   # Amazon and Costco are in WA
+
+    data = client.get("/api/companies", params={"has_payment_issues": True, "limit": 100}).json()
+    assert all(c["has_payment_issues"] for c in data["companies"])
+
+    data = client.get("/api/companies", params={"query": "freight", "rating_bucket": "4-5"}).json()
+    assert all(c["overall_rating"] >= 4 and "freight" in c["legal_name"].lower() + (c.get("dba_name") or "").lower()
+               for c in data["companies"])
+    assert data["facets"]["rating_bucket"]["4-5"] == data["total"]
+
+    assert client.get("/api/companies", params={"rating_bucket": "5-6"}).status_code == 422
+
+
+def test_text_search_filters_every_match(monkeypatch):
+    """Facet filters and totals cover all name matches, not just the best ranked ones"""
+    companies = {
+        f"b{i}": {**make_company(f"b{i}", score=4.0), "legal_name": f"Swift Freight {i}"}
+        for i in range(1500)
+    }
+    companies["s1"] = {**make_company("s1", entity_type="SHIPPER", score=1.0), "legal_name": "Swift Foods"}
+    facets = FacetIndex()
+    facets.add_many(companies.values())
+    monkeypatch.setattr(reviews_routes, "company_store", InMemoryCompanyStore(companies))
+    monkeypatch.setattr(reviews_routes, "company_facets", facets)
+
+    data = client.get("/api/companies", params={"query": "sw", "entity_type": "shipper"}).json()
+    assert data["total"] == 1
+    assert [c["id"] for c in data["companies"]] == ["s1"]
+    assert data["facets"]["entity_type"] == {"BROKER": 1500, "SHIPPER": 1}
+
+    data = client.get("/api/companies", params={"query": "swift", "limit": 2}).json()
+    assert data["total"] == 1501
+    assert [c["ranking_score"] for c in data["companies"]] == [4.0, 4.0]
@@ -0,0 +1,161 @@
+"""
+Test Company Rating Views and Search Ordering
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.routes.reviews import mock_companies
+from src.services.company_rankings import RatingViews, ranking_score, seed_ranking_score
+from src.services.company_store import InMemoryCompanyStore
+from src.services.company_trends import TrendBucket
+from src.services.ranking_job import rescore_companies
+from src.services.review_store import InMemoryReviewStore
+
+client = TestClient(app)
+
+
+def make_company(company_id, entity_type, score, rating=None, review_count=0):
+    return {
+        "id": company_id,
+        "entity_type": entity_type,
+        "ranking_score": score,
+        "overall_rating": rating if rating is not None else score,
+        "review_count": review_count,
+    }
+
+
+def make_bucket(ratings):
+    bucket = TrendBucket()
+    for rating in ratings:
+        bucket.add({"overall_rating": rating})
+    return bucket
+
+
+def test_rating_views_follow_rating_changes():
+    """Views stay sorted and counted as companies are added and re-scored"""
+    views = RatingViews()
+    views.add(make_company("b1", "BROKER", 3.0))
+    views.add(make_company("b2", "BROKER", 4.0))
+    views.add(make_company("s1", "SHIPPER", 5.0))
+
+    assert views.top("BROKER") == ["b2", "b1"]
+    assert views.top() == ["s1", "b2", "b1"]
+    assert views.count("BROKER") == 2
+    assert views.count("CARRIER") == 0
+
+    views.update(make_company("b1", "BROKER", 4.5))
+    assert views.top("BROKER", limit=1) == ["b1"]
+
+    views.remove("s1")
+    assert views.count() == 2
+
+
+def test_rating_priors():
+    """Each entity type's prior is its review-weighted average rating"""
+    views = RatingViews()
+    views.add(make_company("b1", "BROKER", 0, rating=4.0, review_count=30))
+    views.add(make_company("b2", "BROKER", 0, rating=2.0, review_count=10))
+    assert views.prior("BROKER") == 3.5
+    assert views.prior("SHIPPER") == 3.0  # no data - default
+
+    views.update(make_company("b2", "BROKER", 0, rating=2.0, review_count=30))
+    assert views.prior("BROKER") == 3.0
+    views.remove("b1")
+    assert views.prior("BROKER") == 2.0
+
+
+def test_bayesian_score_needs_volume():
+    """One 5-star review does not outrank a 4.8 over hundreds of reviews"""
+    one_review = seed_ranking_score({"overall_rating": 5.0, "review_count": 1}, prior=3.5)
+    many_reviews = seed_ranking_score({"overall_rating": 4.8, "review_count": 300}, prior=3.5)
+    assert one_review < many_reviews
+    assert seed_ranking_score({"review_count": 0}, prior=3.5) == 3.5
+
+
+def test_ranking_score_decays_old_reviews():
+    """Recent reviews outweigh old ones; empty history scores the prior"""
+    recent_good = {"2024-01": make_bucket([5] * 30), "2019-01": make_bucket([1] * 30)}
+    recent_bad = {"2024-01": make_bucket([1] * 30), "2019-01": make_bucket([5] * 30)}
+    assert ranking_score(recent_good, 3.0, "2024-01") > 4
+    assert ranking_score(recent_bad, 3.0, "2024-01") < 2
+    assert ranking_score({}, 3.7, "2024-01") == 3.7
+
+    # A year later every review counts half as much, so the score moves toward the prior
+    assert ranking_score(recent_good, 3.0, "2025-01") < ranking_score(recent_good, 3.0, "2024-01")
+
+
+def test_search_matches_full_sort():
+    """Pre-sorted views return what a full sort by ranking score would"""
+    expected = sorted(
+        (c for c in mock_companies.values() if c["entity_type"] == "BROKER"),
+        key=lambda c: c["ranking_score"],
+        reverse=True
+    )
+
+    data = client.get("/api/companies", params={"entity_type": "broker", "limit": 5}).json()
+    assert [c["id"] for c in data["companies"]] == [c["id"] for c in expected[:5]]
+    assert data["total"] == len(expected)
+
+    data = client.get("/api/companies", params={"query": "freight", "limit": 3}).json()
+    scores = [c["ranking_score"] for c in data["companies"]]
+    assert scores == sorted(scores, reverse=True)
+    assert data["total"] > 3
+
+
+def test_new_review_updates_ranking_score():
+    """A review lands -> the company's stored score and position are refreshed"""
+    before = client.get("/api/companies/company-2").json()["company"]["ranking_score"]
+    response = client.post("/api/reviews", json={
+        "company_id": "company-2",
+        "overall_rating": 1,
+        "title": "Never paid",
+        "content": "Still waiting on payment.",
+    })
+    assert response.status_code == 201
+
+    company = client.get("/api/companies/company-2").json()["company"]
+    assert company["ranking_score"] < before
+    data = client.get("/api/companies", params={"entity_type": "broker", "limit": 100}).json()
+    scores = [c["ranking_score"] for c in data["companies"]]
+    assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_rescore_puts_every_company_on_the_same_month():
+    """Scores computed at different times are recomputed as of one month with fresh priors"""
+    old_reviews = [
+        {"id": f"r{i}", "company_id": "b1", "created_at": "2020-01-15T00:00:00",
+         "overall_rating": 5, "status": "published", "helpful_count": 0}
+        for i in range(20)
+    ]
+    review_store = InMemoryReviewStore(old_reviews)
+    companies = {
+        # Scored back when its reviews were fresh
+        "b1": make_company("b1", "BROKER", 4.6, rating=5.0, review_count=20),
+        # No dated reviews, never scored
+        "b2": make_company("b2", "BROKER", 0, rating=4.0, review_count=20),
+    }
+    company_store = InMemoryCompanyStore(companies)
+
+    updated = []
+    changed = await rescore_companies(company_store, review_store, "2024-01", on_update=updated.append)
+    assert changed == 2
+    assert {c["id"] for c in updated} == {"b1", "b2"}
+
+    prior = 4.5  # (5.0 * 20 + 4.0 * 20) / 40
+    buckets = await review_store.company_trends("b1", "")
+    assert companies["b1"]["ranking_score"] == ranking_score(buckets, prior, "2024-01")
+    assert companies["b2"]["ranking_score"] == seed_ranking_score(companies["b2"], prior)
+    # Four years on, b1's reviews count for 1/16 - its score falls toward the prior
+    assert prior < companies["b1"]["ranking_score"] < 4.6
+    top = await company_store.top_rated("BROKER")
+    assert [c["ranking_score"] for c in top] == sorted((c["ranking_score"] for c in top), reverse=True)
+
+    assert await rescore_companies(company_store, review_store, "2024-01") == 0
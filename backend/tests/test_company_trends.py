@@ -0,0 +1,95 @@
+"""
+Test Monthly Company Trends
+"""
+
+import json
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.services.company_trends import month_range, trend_series
+from src.services.review_store import InMemoryReviewStore
+
+client = TestClient(app)
+
+
+def make_review(review_id, created_at, rating, days=None, status="published"):
+    return {
+        "id": review_id,
+        "company_id": "c1",
+        "created_at": created_at,
+        "overall_rating": rating,
+        "payment_rating": rating,
+        "days_to_payment": days,
+        "status": status,
+    }
+
+
+def test_month_range_crosses_years():
+    assert month_range("2024-02", 3) == ["2023-12", "2024-01", "2024-02"]
+    assert month_range("2024-12", 1) == ["2024-12"]
+
+
+@pytest.mark.asyncio
+async def test_buckets_follow_writes():
+    """Buckets are updated by inserts, edits and deletes"""
+    store = InMemoryReviewStore([
+        make_review("r1", "2024-01-05T00:00:00", 4, days=30),
+        make_review("r2", "2024-01-20T00:00:00", 2, days=60),
+        make_review("r3", "2024-03-01T00:00:00", 5),
+        make_review("r4", "2024-03-02T00:00:00", 1, status="pending"),
+    ])
+
+    series = trend_series(await store.company_trends("c1", "2024-01"), "2024-03", 3)
+    assert [m["month"] for m in series] == ["2024-01", "2024-02", "2024-03"]
+    assert [m["review_count"] for m in series] == [2, 0, 1]
+    assert series[0]["averages"]["overall_rating"] == 3
+    assert series[0]["rating_sums"]["payment_rating"] == 6
+    assert series[0]["average_days_to_payment"] == 45
+    assert series[1]["averages"]["overall_rating"] is None
+    assert series[2]["average_days_to_payment"] is None
+
+    await store.update("r2", {"days_to_payment": 20})
+    await store.delete("r3")
+    buckets = await store.company_trends("c1", "2024-01")
+    assert list(buckets) == ["2024-01"]
+    assert buckets["2024-01"].days_to_payment_sum == 50
+
+
+def test_trends_endpoint():
+    body = "\n".join(
+        json.dumps({
+            "company_id": "company-34",
+            "overall_rating": rating,
+            "title": "Dock appointment",
+            "content": "Unloaded at the DC.",
+            "days_to_payment": 15,
+            "created_at": created_at
+        })
+        for created_at, rating in [("2020-05-03T10:00:00", 5), ("2020-05-20T10:00:00", 3), ("2020-07-01T10:00:00", 4)]
+    )
+    assert client.post("/api/reviews/import", content=body).json()["imported"] == 3
+
+    response = client.get("/api/companies/company-34/trends", params={"end": "2020-07", "months": 4})
+    assert response.status_code == 200
+    months = response.json()["months"]
+    assert [m["month"] for m in months] == ["2020-04", "2020-05", "2020-06", "2020-07"]
+    assert [m["review_count"] for m in months] == [0, 2, 0, 1]
+    assert months[1]["averages"]["overall_rating"] == 4
+    assert months[1]["average_days_to_payment"] == 15
+
+    response = client.get(
+        "/api/companies/company-34/trends",
+        params={"end": "2020-07", "months": 4},
+        headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+
+    assert len(client.get("/api/companies/company-34/trends").json()["months"]) == 24
+    assert client.get("/api/companies/missing/trends").status_code == 404
+    assert client.get("/api/companies/company-34/trends", params={"end": "2020-13"}).status_code == 422
@@ -0,0 +1,78 @@
+"""
+Test Conditional GET (ETag / If-None-Match)
+"""
+
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.utils.http_cache import etag_matches
+
+client = TestClient(app)
+
+
+def test_company_profile_not_modified():
+    """Unchanged profile is answered with an empty 304"""
+    response = client.get("/api/companies/company-1")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    response = client.get("/api/companies/company-1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_writes_change_company_etag():
+    """New reviews, responses and votes each invalidate the ETag"""
+    etag = client.get("/api/companies/company-1").headers["etag"]
+
+    created = client.post("/api/reviews", json={
+        "company_id": "company-1",
+        "overall_rating": 4,
+        "title": "Paid on time",
+        "content": "Smooth load, broker paid within two weeks."
+    })
+    review_id = created.json()["review"]["id"]
+    response = client.get("/api/companies/company-1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    client.post(f"/api/reviews/{review_id}/vote?vote_type=helpful")
+    response = client.get("/api/companies/company-1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    client.post(f"/api/reviews/{review_id}/respond", json={
+        "content": "Thanks for hauling with us.",
+        "responder_name": "Dispatch"
+    })
+    response = client.get("/api/companies/company-1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_review_listing_etag_per_page():
+    """Each page has its own ETag and revalidates independently"""
+    first = client.get("/api/reviews?company_id=company-1&limit=1")
+    second = client.get("/api/reviews?company_id=company-1&limit=2")
+    assert first.headers["etag"] != second.headers["etag"]
+
+    response = client.get(
+        "/api/reviews?company_id=company-1&limit=1",
+        headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert response.status_code == 304
+
+
+def test_etag_matching():
+    """If-None-Match lists, weak tags and * all match"""
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches(None, '"b"')
+    assert not etag_matches('"a"', '"b"')
@@ -0,0 +1,92 @@
+"""
+Test Streaming Exports
+"""
+
+import csv
+import io
+import json
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.routes import export
+
+client = TestClient(app)
+
+
+def ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def import_reviews(company_id, dates):
+    body = "\n".join(
+        json.dumps({
+            "company_id": company_id,
+            "overall_rating": 3,
+            "title": f"Load on {created_at}",
+            "content": "Average experience.",
+            "issues_reported": ["detention"],
+            "created_at": created_at
+        })
+        for created_at in dates
+    )
+    assert client.post("/api/reviews/import", content=body).json()["failed"] == 0
+
+
+def test_export_reviews_in_pages_and_resume(monkeypatch):
+    """Export walks every page and resumes after the last ID received"""
+    monkeypatch.setattr(export, "PAGE_SIZE", 2)
+    import_reviews("company-31", [f"2022-01-0{day}T09:00:00" for day in range(1, 6)])
+
+    response = client.get("/api/export/reviews", params={"company_id": "company-31"})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = ndjson(response)
+    assert [r["created_at"][:10] for r in rows] == [f"2022-01-0{day}" for day in range(5, 0, -1)]
+
+    resumed = ndjson(client.get(
+        "/api/export/reviews",
+        params={"company_id": "company-31", "after_id": rows[1]["id"]}
+    ))
+    assert [r["id"] for r in resumed] == [r["id"] for r in rows[2:]]
+
+
+def test_export_reviews_filters():
+    import_reviews("company-32", ["2021-06-01T00:00:00", "2021-06-15T00:00:00", "2021-07-01T00:00:00"])
+
+    rows = ndjson(client.get("/api/export/reviews", params={
+        "company_id": "company-32",
+        "created_after": "2021-06-01T00:00:00",
+        "created_before": "2021-07-01T00:00:00"
+    }))
+    assert [r["created_at"] for r in rows] == ["2021-06-15T00:00:00", "2021-06-01T00:00:00"]
+
+    rows = ndjson(client.get("/api/export/reviews", params={"entity_type": "shipper"}))
+    assert rows and all(r["company_id"] in {"company-30", "company-31", "company-32", "company-33", "company-34"} for r in rows)
+
+    assert client.get("/api/export/reviews", params={"after_id": "nope"}).status_code == 400
+
+
+def test_export_reviews_csv():
+    response = client.get("/api/export/reviews", params={"company_id": "company-1", "format": "csv"})
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows
+    assert rows[0].keys() == set(export.REVIEW_CSV_FIELDS)
+
+
+def test_export_companies_with_stats():
+    rows = ndjson(client.get("/api/export/companies", params={"entity_type": "broker"}))
+    assert rows == sorted(rows, key=lambda c: c["id"])
+    assert all(r["entity_type"] == "BROKER" for r in rows)
+    assert "rating_distribution" in rows[0]["stats"]
+
+    resumed = ndjson(client.get("/api/export/companies", params={"after_id": rows[0]["id"], "entity_type": "broker"}))
+    assert [r["id"] for r in resumed] == [r["id"] for r in rows[1:]]
+
+    response = client.get("/api/export/companies", params={"format": "csv"})
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert "5_star" in rows[0] and "would_work_again_percent" in rows[0]
@@ -0,0 +1,144 @@
+"""
+Test FMCSA Service Client Pooling and Request Coalescing
+"""
+
+import asyncio
+import httpx
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.fmcsa_service import FMCSAService
+
+API_URL = "https://fmcsa.test/qc/services/carriers"
+
+
+def carrier_response(request: httpx.Request) -> httpx.Response:
+    """Stand-in for the QCMobile API: MC 404404 is unknown, everything else is a broker"""
+    number = request.url.path.rsplit("/", 1)[-1]
+    if number == "404404":
+        return httpx.Response(404)
+    return httpx.Response(200, json={"content": {"carrier": {
+        "mcNumber": number,
+        "dotNumber": "3000001",
+        "legalName": f"Broker {number}",
+        "entityType": "BROKER",
+    }}})
+
+
+def make_service(handler):
+    return FMCSAService(api_key="test-key", api_url=API_URL, transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_lookups_share_one_client():
+    """Every lookup goes through the same pooled client"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return carrier_response(request)
+
+    service = make_service(handler)
+    await service.start()
+    client = service._get_client()
+
+    result = await service.verify_mc_number("123456")
+    assert result["company_name"] == "Broker 123456"
+    assert result["mock"] is False
+    assert await service.verify_mc_number("404404") is None
+    assert await service.verify_dot_number("3000001") is not None
+
+    assert service._get_client() is client
+    assert [r.url.params["webKey"] for r in requests] == ["test-key"] * 3
+    assert requests[0].url.path.endswith("/docket-number/123456")
+
+    await service.close()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_client_reopens_after_close():
+    """A lookup after close() opens a fresh client instead of failing"""
+    service = make_service(carrier_response)
+    await service.verify_mc_number("1")
+    await service.close()
+    assert (await service.verify_mc_number("2"))["mc_number"] == "2"
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_mock_mode_opens_no_client():
+    """Without an API key no connections are opened"""
+    service = FMCSAService(api_key="")
+    await service.start()
+    assert service.mock_mode
+    assert service._client is None
+    assert (await service.verify_mc_number("42"))["mock"] is True
+
+
+class SlowAPI:
+    """Stand-in that takes a while to answer and counts upstream calls"""
+
+    def __init__(self, delay=0.05, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def __call__(self, request):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise httpx.ConnectError("upstream down", request=request)
+        return carrier_response(request)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_request():
+    """N concurrent callers for one number cause exactly one upstream call"""
+    api = SlowAPI()
+    service = make_service(api)
+
+    results = await asyncio.gather(*(service.verify_mc_number("123456") for _ in range(50)))
+    assert api.calls == 1
+    assert all(result == results[0] for result in results)
+    assert results[0]["company_name"] == "Broker 123456"
+
+    # Different numbers and lookup types are separate flights
+    await asyncio.gather(service.verify_mc_number("777"), service.verify_dot_number("777"))
+    assert api.calls == 3
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_a_failure():
+    """Every waiter sees the one failure, and the next lookup tries again"""
+    api = SlowAPI(fail=True)
+    service = make_service(api)
+
+    results = await asyncio.gather(*(service.verify_mc_number("123456") for _ in range(20)))
+    assert results == [None] * 20
+    assert api.calls == 1
+
+    api.fail = False
+    assert await service.verify_mc_number("123456") is not None
+    assert api.calls == 2
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_flight():
+    """One caller timing out leaves the shared request running for the rest"""
+    api = SlowAPI(delay=0.1)
+    service = make_service(api)
+
+    impatient = asyncio.create_task(asyncio.wait_for(service.verify_mc_number("123456"), 0.01))
+    patient = asyncio.create_task(service.verify_mc_number("123456"))
+    with pytest.raises(asyncio.TimeoutError):
+        await impatient
+    assert (await patient)["mc_number"] == "123456"
+    assert api.calls == 1
+    await service.close()
@@ -0,0 +1,54 @@
+"""
+Test Fuzzy Company Search
+"""
+
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.services.fuzzy_search import TrigramIndex
+from src.utils.text import edit_distance
+
+client = TestClient(app)
+
+
+def test_edit_distance_counts_transpositions():
+    """Swapped adjacent letters are one edit"""
+    assert edit_distance("swfit", "swift") == 1
+    assert edit_distance("hunt", "hant") == 1
+    assert edit_distance("", "abc") == 3
+    assert edit_distance("same", "same") == 0
+
+
+def test_trigram_index_matches_typos():
+    """Misspelled and punctuation-variant names still match"""
+    index = TrigramIndex()
+    index.add({"id": "c1", "legal_name": "Swift Transportation"})
+    index.add({"id": "c2", "legal_name": "J.B. Hunt Transport"})
+    index.add({"id": "c3", "legal_name": "Sweet Freight"})
+
+    assert [cid for cid, _ in index.search("swfit")] == ["c1"]
+    assert dict(index.search("JB Hunt"))["c2"] == 1.0
+    assert index.search("zzzz") == []
+
+    index.remove("c1")
+    assert index.search("swfit") == []
+
+
+def test_fuzzy_search_endpoint():
+    """fuzzy=true ranks by similarity, then rating"""
+    response = client.get("/api/companies", params={"query": "swfit", "fuzzy": True})
+    companies = response.json()["companies"]
+    assert [c["legal_name"] for c in companies] == ["Swift Load Brokers", "Swift Transportation"]
+    assert companies[0]["match_score"] == companies[1]["match_score"]
+
+    response = client.get("/api/companies", params={"query": "JB Hunt", "fuzzy": True})
+    assert response.json()["companies"][0]["legal_name"] == "J.B. Hunt Transport"
+
+    # Plain substring search cannot find the typo
+    response = client.get("/api/companies", params={"query": "swfit"})
+    assert response.json()["total"] == 0
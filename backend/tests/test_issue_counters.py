@@ -0,0 +1,76 @@
+"""
+Test Issue Frequency Counters
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.services.review_store import InMemoryReviewStore
+
+client = TestClient(app)
+
+
+def make_review(review_id, company_id, issues, status="published"):
+    return {
+        "id": review_id,
+        "company_id": company_id,
+        "created_at": f"2024-01-01T00:00:0{review_id[-1]}",
+        "overall_rating": 3,
+        "status": status,
+        "issues_reported": issues,
+    }
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_writes():
+    """Counts change with inserts, edits, status changes and deletes"""
+    store = InMemoryReviewStore([
+        make_review("r1", "c1", ["late_payment", "rate_changed"]),
+        make_review("r2", "c1", ["late_payment", "late_payment"]),
+        make_review("r3", "c2", ["detention"]),
+        make_review("r4", "c1", ["double_brokered"], status="pending"),
+    ])
+
+    aggregate = await store.company_aggregate("c1")
+    assert aggregate.issue_counts == {"late_payment": 2, "rate_changed": 1}
+    assert aggregate.top_issues(1) == [{"issue": "late_payment", "count": 2, "percent": 100}]
+
+    await store.update("r2", {"status": "removed"})
+    await store.update("r1", {"issues_reported": ["rate_changed"]})
+    assert aggregate.issue_counts == {"rate_changed": 1}
+
+    await store.delete("r3")
+    overall = await store.overall_aggregate()
+    assert overall.review_count == 1
+    assert overall.top_issues() == [{"issue": "rate_changed", "count": 1, "percent": 100}]
+
+
+def test_common_issues_and_leaderboard():
+    """Profile stats and the leaderboard are served from the counters"""
+    before = client.get("/api/issues/leaderboard").json()
+    before_counts = {i["issue"]: i["count"] for i in before["issues"]}
+
+    response = client.post("/api/reviews", json={
+        "company_id": "company-33",
+        "overall_rating": 2,
+        "title": "Held for hours",
+        "content": "Six hours of detention and no pay for it.",
+        "issues_reported": ["detention", "late_payment"]
+    })
+    assert response.status_code == 201
+
+    common = client.get("/api/companies/company-33").json()["stats"]["common_issues"]
+    assert {i["issue"] for i in common} >= {"detention", "late_payment"}
+    assert all(0 < i["percent"] <= 100 for i in common)
+
+    after = client.get("/api/issues/leaderboard").json()
+    after_counts = {i["issue"]: i["count"] for i in after["issues"]}
+    assert after["total_reviews"] == before["total_reviews"] + 1
+    assert after_counts["detention"] == before_counts.get("detention", 0) + 1
+    assert [i["count"] for i in after["issues"]] == sorted(after_counts.values(), reverse=True)
@@ -0,0 +1,128 @@
+"""
+Test Lane Analytics
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.services.lane_analytics import MAX_STATE_CODES, OTHER_VALUE, LaneAnalytics
+
+client = TestClient(app)
+
+
+def make_review(review_id, company_id, origin, destination, rating=None, days=None, speed=None,
+                freight_type="Dry Van", status="published"):
+    return {
+        "id": review_id,
+        "company_id": company_id,
+        "origin_state": origin,
+        "destination_state": destination,
+        "freight_type": freight_type,
+        "overall_rating": rating,
+        "days_to_payment": days,
+        "payment_speed": speed,
+        "status": status,
+    }
+
+
+@pytest.fixture
+def lanes():
+    lanes = LaneAnalytics()
+    for review in [
+        make_review("r1", "c1", "TX", "CA", rating=4, days=20, speed="on_time"),
+        make_review("r2", "c1", "tx", "CA", rating=2, days=40, speed="late"),
+        make_review("r3", "c2", "TX", "CA", rating=5, freight_type="Reefer"),
+        make_review("r4", "c2", "IL", "GA", rating=3, days=90, speed="never_paid"),
+        make_review("r5", "c2", "TX", "CA", rating=1, status="pending"),
+        make_review("r6", "c3", None, "CA", rating=1),
+    ]:
+        lanes.add(review)
+    return lanes
+
+
+def test_lane_matrix(lanes):
+    """Published reviews with both states are grouped per lane"""
+    matrix = {(lane["origin"], lane["destination"]): lane for lane in lanes.lane_matrix()}
+    assert list(matrix) == [("TX", "CA"), ("IL", "GA")]
+
+    tx_ca = matrix[("TX", "CA")]
+    assert tx_ca["review_count"] == 3
+    assert tx_ca["average_days_to_payment"] == 30
+    assert tx_ca["late_payment_rate"] == 0.5
+    assert tx_ca["average_rating"] == pytest.approx(11 / 3, abs=1e-4)
+    assert matrix[("IL", "GA")]["late_payment_rate"] == 1
+
+    assert [lane["review_count"] for lane in lanes.lane_matrix(min_reviews=2)] == [3]
+    assert lanes.lane_matrix(freight_type="Flatbed") == []
+    split = lanes.lane_matrix(by_freight_type=True, company_id="c2")
+    assert [(lane["origin"], lane["freight_type"]) for lane in split] == [("TX", "Reefer"), ("IL", "Dry Van")]
+
+
+def test_junk_states_share_one_code():
+    """Distinct junk values past the cap collapse into OTHER instead of growing the codes"""
+    lanes = LaneAnalytics()
+    for i in range(5000):
+        lanes.add(make_review(f"r{i}", "c1", f"S{i}", "CA", rating=3, freight_type=f"junk-{i}"))
+
+    assert len(lanes._states) == MAX_STATE_CODES
+    matrix = lanes.lane_matrix(by_freight_type=True)
+    assert sum(lane["review_count"] for lane in matrix) == 5000
+    assert {lane["origin"] for lane in matrix} >= {"S0", OTHER_VALUE}
+    other = [lane for lane in lanes.lane_matrix() if lane["origin"] == OTHER_VALUE]
+    assert other[0]["review_count"] == 5000 - (MAX_STATE_CODES - 3)
+
+
+def test_brokers_on_lane_and_remove(lanes):
+    """Per-broker stats follow edits and removals"""
+    brokers = lanes.brokers_on_lane("tx", "ca")
+    assert [(b["company_id"], b["review_count"]) for b in brokers] == [("c1", 2), ("c2", 1)]
+    assert brokers[1]["average_days_to_payment"] is None
+
+    lanes.remove("r1")
+    lanes.add(make_review("r3", "c2", "TX", "CA", rating=5, days=10, freight_type="Reefer"))
+    summary = lanes.lane_summary("TX", "CA")
+    assert summary["review_count"] == 2
+    assert summary["average_days_to_payment"] == 25
+
+    empty = lanes.lane_summary("WA", "OR")
+    assert empty["review_count"] == 0
+    assert empty["average_rating"] is None
+
+
+def test_lane_routes():
+    """New reviews show up in the lane matrix and lane detail"""
+    response = client.post("/api/reviews", json={
+        "company_id": "company-4",
+        "overall_rating": 2,
+        "title": "Lane test",
+        "content": "Paid late on this lane.",
+        "origin_state": "NV",
+        "destination_state": "WY",
+        "payment_speed": "late",
+        "days_to_payment": 45,
+    })
+    assert response.status_code == 201
+
+    lanes = client.get("/api/lanes", params={"company_id": "company-4"}).json()["lanes"]
+    assert {"origin": "NV", "destination": "WY"}.items() <= lanes[0].items()
+
+    data = client.get("/api/lanes/nv/wy").json()
+    assert data["summary"]["late_payment_rate"] == 1
+    assert data["brokers"][0]["company_id"] == "company-4"
+    assert data["brokers"][0]["legal_name"]
+
+    assert client.get("/api/lanes/NEV/WY").status_code == 422
+    response = client.post("/api/reviews", json={
+        "company_id": "company-4",
+        "overall_rating": 2,
+        "title": "Lane test",
+        "content": "Free-text state.",
+        "origin_state": "N1",
+    })
+    assert response.status_code == 422
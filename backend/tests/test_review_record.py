@@ -0,0 +1,64 @@
+"""
+Test Compact Review Records
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.review_record import ReviewRecord
+from src.services.review_store import InMemoryReviewStore
+
+
+def make_review(review_id, **fields):
+    review = {
+        "id": review_id,
+        "company_id": "".join(["company", "-1"]),  # built at runtime, not a shared constant
+        "overall_rating": 4,
+        "status": "".join(["publ", "ished"]),
+        "issues_reported": ["late_payment"],
+        "created_at": "2024-01-01T00:00:00",
+    }
+    review.update(fields)
+    return review
+
+
+def test_record_round_trips_dict_shape():
+    """Unset fields stay out, lists come back as lists, extra keys survive"""
+    review = make_review("r1", origin_state="TX", custom_note="kept")
+    record = ReviewRecord(review)
+    assert record.to_dict() == review
+    assert "payment_speed" not in record.to_dict()
+    assert "payment_speed" not in record and "custom_note" in record
+    assert record.get("payment_speed") is None
+    with pytest.raises(KeyError):
+        record["payment_speed"]
+
+
+def test_low_cardinality_fields_are_interned():
+    """Equal enum-like values share one string object"""
+    first, second = ReviewRecord(make_review("r1")), ReviewRecord(make_review("r2"))
+    assert first.status is second.status
+    assert first.company_id is second.company_id
+    assert isinstance(first.issues_reported, tuple)
+
+
+@pytest.mark.asyncio
+async def test_store_returns_copies():
+    """Callers get dicts; changing them does not touch the stored review"""
+    store = InMemoryReviewStore([make_review("r1")])
+    review = await store.get("r1")
+    review["overall_rating"] = 1
+    review["issues_reported"].append("detention")
+
+    stored = await store.get("r1")
+    assert stored["overall_rating"] == 4
+    assert stored["issues_reported"] == ["late_payment"]
+    assert (await store.company_aggregate("company-1")).issue_counts == {"late_payment": 1}
+
+    updated = await store.update("r1", {"status": "removed"})
+    assert updated["status"] == "removed"
+    assert (await store.company_aggregate("company-1")).review_count == 0
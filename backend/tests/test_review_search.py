@@ -0,0 +1,106 @@
+"""
+Test Review Full-Text Search
+"""
+
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.services.review_search import ReviewSearchIndex
+from src.utils.text import stem
+
+client = TestClient(app)
+
+
+def make_review(review_id, title, content, company_id="c1", state=None, status="published"):
+    return {
+        "id": review_id,
+        "company_id": company_id,
+        "created_at": f"2024-01-01T00:00:{review_id[-1]}0",
+        "title": title,
+        "content": content,
+        "origin_state": state,
+        "status": status,
+    }
+
+
+def make_index():
+    index = ReviewSearchIndex()
+    index.add(make_review("r1", "Double brokered load", "They double brokered my load to another carrier.", state="TX"))
+    index.add(make_review("r2", "Quick pay worked", "Quick pay came through in two days.", company_id="c2", state="CA"))
+    index.add(make_review("r3", "Detention not paid", "Four hours detention, never paid.", state="tx"))
+    index.add(make_review("r4", "Brokering scam", "Brokers changed the rate.", status="pending"))
+    return index
+
+
+def test_stemming():
+    assert stem("brokered") == stem("brokers") == stem("brokering") == "broker"
+    assert stem("changed") == stem("change")
+    assert stem("stopped") == "stop"
+
+
+def test_bm25_ranking_and_filters():
+    """Stemmed matches ranked by relevance, filtered by posting intersection"""
+    index = make_index()
+
+    results, total = index.search("broker")
+    assert [review_id for review_id, _ in results] == ["r1"]  # r4 is not published
+    assert total == 1
+
+    results, _ = index.search("paid detention")
+    assert results[0][0] == "r3"
+
+    results, total = index.search("paid quick pay", state="TX")
+    assert [review_id for review_id, _ in results] == ["r3"]
+    results, total = index.search("quick pay", company_id="c1")
+    assert total == 0
+    assert index.search("the and of") == ([], 0)
+
+
+def test_remove_and_reindex():
+    index = make_index()
+    review = make_review("r1", "Double brokered load", "They double brokered my load to another carrier.", state="TX")
+    index.remove(review)
+    assert index.search("double")[1] == 0
+    assert "r1" not in index
+
+    index.add({**make_review("r4", "Brokering scam", "Brokers changed the rate.")})
+    assert [review_id for review_id, _ in index.search("broker")[0]] == ["r4"]
+
+
+def test_snapshot_round_trip(tmp_path):
+    """A loaded snapshot answers queries like the original index"""
+    index = make_index()
+    index.remove(make_review("r2", "Quick pay worked", "Quick pay came through in two days.", company_id="c2", state="CA"))
+    path = tmp_path / "search.json.gz"
+    index.save(str(path))
+
+    loaded = ReviewSearchIndex.load(str(path))
+    assert len(loaded) == len(index) == 3
+    assert loaded.watermark == index.watermark
+    for query in ("double brokered", "detention", "quick pay"):
+        assert loaded.search(query, state="TX") == index.search(query, state="TX")
+
+
+def test_search_endpoint_finds_new_reviews():
+    """create_review updates the index immediately"""
+    response = client.post("/api/reviews", json={
+        "company_id": "company-4",
+        "overall_rating": 1,
+        "title": "Lumper fees never reimbursed",
+        "content": "Paid the lumper out of pocket, still waiting months later.",
+        "origin_state": "GA"
+    })
+    review_id = response.json()["review"]["id"]
+
+    data = client.get("/api/reviews/search", params={"q": "lumper fee"}).json()
+    assert data["reviews"][0]["id"] == review_id
+    assert data["reviews"][0]["score"] > 0
+
+    data = client.get("/api/reviews/search", params={"q": "lumper", "state": "ga", "company_id": "company-4"}).json()
+    assert [r["id"] for r in data["reviews"]] == [review_id]
+    assert client.get("/api/reviews/search", params={"q": "lumper", "state": "WA"}).json()["total"] == 0
@@ -0,0 +1,194 @@
+"""
+Test Review Routes and Review Store
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.services.review_store import InMemoryReviewStore, decode_cursor, encode_cursor
+
+client = TestClient(app)
+
+
+def make_review(review_id, company_id, created_at, rating=4):
+    """Build a minimal review dict"""
+    return {
+        "id": review_id,
+        "company_id": company_id,
+        "created_at": created_at,
+        "overall_rating": rating,
+        "status": "published",
+        "helpful_count": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_store_lists_newest_first_per_company():
+    """Store keeps per-company reviews ordered by created_at"""
+    store = InMemoryReviewStore([
+        make_review("r1", "c1", "2024-01-01T00:00:00"),
+        make_review("r2", "c2", "2024-01-02T00:00:00"),
+        make_review("r3", "c1", "2024-01-03T00:00:00"),
+        make_review("r4", "c1", "2024-01-02T00:00:00"),
+    ])
+
+    page = await store.list_reviews("c1", limit=2)
+    assert [r["id"] for r in page] == ["r3", "r4"]
+
+    page = await store.list_reviews("c1", limit=2, offset=2)
+    assert [r["id"] for r in page] == ["r1"]
+
+    assert await store.count("c1") == 3
+    assert await store.count() == 4
+    assert await store.list_reviews("missing") == []
+
+
+@pytest.mark.asyncio
+async def test_store_get_update_increment():
+    """Primary index supports lookups and updates"""
+    store = InMemoryReviewStore([make_review("r1", "c1", "2024-01-01T00:00:00")])
+
+    assert (await store.get("r1"))["id"] == "r1"
+    assert await store.get("missing") is None
+
+    await store.update("r1", {"title": "Updated"})
+    await store.increment("r1", "helpful_count")
+    review = await store.get("r1")
+    assert review["title"] == "Updated"
+    assert review["helpful_count"] == 1
+
+    with pytest.raises(ValueError):
+        await store.update("r1", {"company_id": "c2"})
+    with pytest.raises(ValueError):
+        await store.add(make_review("r1", "c1", "2024-01-01T00:00:00"))
+
+
+def test_create_and_get_review():
+    """Created reviews are retrievable by ID and listed first"""
+    response = client.post("/api/reviews", json={
+        "company_id": "company-2",
+        "overall_rating": 5,
+        "title": "Paid fast",
+        "content": "Quick pay in 3 days, great communication.",
+    })
+    assert response.status_code == 201
+    review_id = response.json()["review"]["id"]
+
+    response = client.get(f"/api/reviews/{review_id}")
+    assert response.status_code == 200
+    assert response.json()["title"] == "Paid fast"
+
+    response = client.get("/api/reviews", params={"company_id": "company-2", "limit": 1})
+    assert response.json()["reviews"][0]["id"] == review_id
+
+
+def test_vote_and_respond():
+    """Votes and company responses go through the store"""
+    before = client.get("/api/reviews/review-1").json()["helpful_count"]
+    response = client.post("/api/reviews/review-1/vote", params={"vote_type": "helpful"})
+    assert response.json()["helpful_count"] == before + 1
+
+    response = client.post("/api/reviews/review-1/respond", json={
+        "content": "Thanks for hauling with us.",
+        "responder_name": "Jane Smith",
+    })
+    assert response.status_code == 201
+    assert client.get("/api/reviews/review-1").json()["company_response"]["responder_name"] == "Jane Smith"
+
+    response = client.post("/api/reviews/missing/vote", params={"vote_type": "helpful"})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_aggregate_tracks_add_update_delete():
+    """Company aggregate stays in sync without rescanning reviews"""
+    first = make_review("r1", "c1", "2024-01-01T00:00:00", rating=5)
+    first.update({"payment_rating": 4, "would_work_again": True})
+    second = make_review("r2", "c1", "2024-01-02T00:00:00", rating=1)
+    store = InMemoryReviewStore([first, second])
+
+    aggregate = await store.company_aggregate("c1")
+    assert aggregate.review_count == 2
+    assert aggregate.average("overall_rating") == 3
+    assert aggregate.average("payment_rating") == 4
+    assert aggregate.stats()["rating_distribution"]["5_star"] == 1
+    assert aggregate.stats()["would_work_again_percent"] == 50
+
+    await store.update("r2", {"overall_rating": 3})
+    assert aggregate.histogram == [0, 0, 1, 0, 1]
+
+    await store.update("r2", {"status": "removed"})
+    assert aggregate.review_count == 1
+
+    await store.delete("r1")
+    assert aggregate.review_count == 0
+    assert aggregate.average("overall_rating") is None
+    assert await store.count("c1") == 1
+
+
+def test_company_stats_follow_new_reviews():
+    """create_review updates company ratings and profile stats"""
+    before = client.get("/api/companies/company-1").json()["stats"]
+    response = client.post("/api/reviews", json={
+        "company_id": "company-1",
+        "overall_rating": 5,
+        "title": "Fixed their process",
+        "content": "Paid on time this load.",
+        "payment_rating": 5,
+        "would_work_again": True,
+    })
+    assert response.status_code == 201
+
+    data = client.get("/api/companies/company-1").json()
+    stats = data["stats"]
+    assert stats["total_reviews"] == before["total_reviews"] + 1
+    assert stats["rating_distribution"]["5_star"] == before["rating_distribution"]["5_star"] + 1
+    assert data["company"]["review_count"] == stats["total_reviews"]
+    assert data["company"]["payment_rating"] is not None
+
+
+@pytest.mark.asyncio
+async def test_store_cursor_seek():
+    """Keyset cursor resumes right after the last review seen"""
+    store = InMemoryReviewStore([
+        make_review(f"r{i}", "c1", f"2024-01-0{i}T00:00:00") for i in range(1, 6)
+    ])
+
+    page = await store.list_reviews("c1", limit=2)
+    assert [r["id"] for r in page] == ["r5", "r4"]
+
+    cursor = decode_cursor(encode_cursor(page[-1]))
+    await store.add(make_review("r6", "c1", "2024-01-06T00:00:00"))
+    page = await store.list_reviews("c1", limit=2, after=cursor)
+    assert [r["id"] for r in page] == ["r3", "r2"]
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+    with pytest.raises(ValueError):
+        decode_cursor("WyJ4IiwieSJd")   # ["x","y"] - not a timestamp
+
+
+def test_list_reviews_cursor_pagination():
+    """Following next_cursor walks every review exactly once"""
+    total = client.get("/api/reviews").json()["total"]
+
+    seen = []
+    params = {"limit": 1}
+    while True:
+        data = client.get("/api/reviews", params=params).json()
+        seen.extend(r["id"] for r in data["reviews"])
+        if not data["next_cursor"]:
+            break
+        params["after"] = data["next_cursor"]
+
+    assert len(seen) == total
+    assert len(set(seen)) == total
+
+    response = client.get("/api/reviews", params={"after": "garbage"})
+    assert response.status_code == 400
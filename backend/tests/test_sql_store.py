@@ -0,0 +1,334 @@
+"""
+Test SQL Stores (SQLite/aiosqlite stand-in - no Postgres needed)
+"""
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.models.tables import company_issues, company_monthly_stats, company_versions, review_totals
+from src.routes import reviews as reviews_routes
+from src.services.sql_store import SQLCompanyStore, SQLReviewStore, SQLVersionRegistry
+from src.services.review_store import decode_cursor, encode_cursor
+from src.utils.config import config
+from src.utils.database import create_engine, create_tables, to_async_url
+
+
+def make_company(company_id, entity_type="BROKER", rating=3.0):
+    """Build a minimal company dict"""
+    return {
+        "id": company_id,
+        "legal_name": f"{company_id} Freight",
+        "entity_type": entity_type,
+        "overall_rating": rating,
+        "review_count": 0,
+        "ranking_score": rating,
+    }
+
+
+def make_review(review_id, company_id, created_at, rating=4, **fields):
+    """Build a minimal review dict"""
+    review = {
+        "id": review_id,
+        "trucker_id": "trucker-1",
+        "company_id": company_id,
+        "overall_rating": rating,
+        "title": "Title",
+        "content": "Content",
+        "status": "published",
+        "helpful_count": 0,
+        "created_at": created_at,
+    }
+    review.update(fields)
+    return review
+
+
+@pytest_asyncio.fixture
+async def stores():
+    """Fresh SQL stores on an in-memory SQLite database"""
+    engine = create_engine("sqlite://")
+    await create_tables(engine)
+    yield SQLReviewStore(engine), SQLCompanyStore(engine)
+    await engine.dispose()
+
+
+def test_async_url_rewrite():
+    """Config URLs are mapped to async drivers"""
+    assert to_async_url("postgresql://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert to_async_url("sqlite://") == "sqlite+aiosqlite://"
+
+
+@pytest.mark.asyncio
+async def test_sql_review_store_listing_and_cursor(stores):
+    """Listings and keyset cursors match the in-memory store"""
+    review_store, company_store = stores
+    await company_store.add_many([make_company("c1"), make_company("c2")])
+    await review_store.add_many([
+        make_review(f"r{i}", "c1", f"2024-01-0{i}T00:00:00") for i in range(1, 6)
+    ])
+    await review_store.add(make_review("other", "c2", "2024-01-09T00:00:00"))
+
+    page = await review_store.list_reviews("c1", limit=2)
+    assert [r["id"] for r in page] == ["r5", "r4"]
+    assert page[0]["created_at"] == "2024-01-05T00:00:00"
+
+    page = await review_store.list_reviews("c1", limit=2, after=decode_cursor(encode_cursor(page[-1])))
+    assert [r["id"] for r in page] == ["r3", "r2"]
+
+    page = await review_store.list_reviews(limit=1, offset=1)
+    assert [r["id"] for r in page] == ["r5"]
+    assert await review_store.count("c1") == 5
+    assert await review_store.count() == 6
+
+
+@pytest.mark.asyncio
+async def test_sql_review_store_updates_and_aggregate(stores):
+    """Updates, increments and the set-based aggregate query"""
+    review_store, company_store = stores
+    await company_store.add(make_company("c1"))
+    await review_store.add(make_review("r1", "c1", "2024-01-01T00:00:00", rating=5,
+                                       payment_rating=4, would_work_again=True))
+    await review_store.add(make_review("r2", "c1", "2024-01-02T00:00:00", rating=1))
+    await review_store.add(make_review("r3", "c1", "2024-01-03T00:00:00", rating=2, status="pending"))
+
+    await review_store.increment("r1", "helpful_count", 2)
+    await review_store.apply_counts({
+        "r1": {"helpful_count": 3, "not_helpful_count": 1},
+        "r2": {"not_helpful_count": 2},
+        "missing": {"helpful_count": 1},
+    })
+    review = await review_store.update("r1", {"company_response": {"content": "Thanks"}})
+    assert review["helpful_count"] == 5
+    assert review["not_helpful_count"] == 1
+    assert (await review_store.get("r2"))["not_helpful_count"] == 2
+    assert review["company_response"] == {"content": "Thanks"}
+
+    aggregate = await review_store.company_aggregate("c1")
+    assert aggregate.review_count == 2
+    assert aggregate.average("overall_rating") == 3
+    assert aggregate.average("payment_rating") == 4
+    assert aggregate.histogram == [1, 0, 0, 0, 1]
+    assert aggregate.stats()["would_work_again_percent"] == 50
+
+    with pytest.raises(ValueError):
+        await review_store.update("r1", {"company_id": "c2"})
+
+    assert (await review_store.delete("r2"))["id"] == "r2"
+    assert await review_store.get("r2") is None
+
+
+@pytest.mark.asyncio
+async def test_sql_issue_counters(stores):
+    """company_issues counters follow inserts, edits and deletes"""
+    review_store, company_store = stores
+    await company_store.add_many([make_company("c1"), make_company("c2")])
+    await review_store.add_many([
+        make_review("r1", "c1", "2024-01-01T00:00:00", issues_reported=["late_payment", "rate_changed"]),
+        make_review("r2", "c1", "2024-01-02T00:00:00", issues_reported=["late_payment"]),
+    ])
+    await review_store.add(make_review("r3", "c2", "2024-01-03T00:00:00", issues_reported=["late_payment"]))
+
+    aggregate = await review_store.company_aggregate("c1")
+    assert aggregate.issue_counts == {"late_payment": 2, "rate_changed": 1}
+    assert aggregate.stats()["common_issues"][0] == {"issue": "late_payment", "count": 2, "percent": 100}
+
+    await review_store.update("r1", {"issues_reported": ["detention"]})
+    await review_store.delete("r2")
+    aggregate = await review_store.company_aggregate("c1")
+    assert aggregate.issue_counts == {"detention": 1}
+
+    overall = await review_store.overall_aggregate()
+    assert overall.review_count == 2
+    assert overall.issue_counts == {"detention": 1, "late_payment": 1}
+
+
+@pytest.mark.asyncio
+async def test_sql_trend_buckets_and_rebuild(stores):
+    """company_monthly_stats follows writes and can be rebuilt from reviews"""
+    review_store, company_store = stores
+    await company_store.add(make_company("c1"))
+    await review_store.add_many([
+        make_review("r1", "c1", "2024-01-05T00:00:00", rating=4, days_to_payment=30, issues_reported=["late_payment"]),
+        make_review("r2", "c1", "2024-01-20T00:00:00", rating=2, days_to_payment=60),
+        make_review("r3", "c1", "2024-02-01T00:00:00", rating=5),
+    ])
+    await review_store.update("r3", {"status": "removed"})
+
+    buckets = await review_store.company_trends("c1", "2024-01")
+    assert list(buckets) == ["2024-01"]
+    assert buckets["2024-01"].review_count == 2
+    assert buckets["2024-01"].rating_sums["overall_rating"] == 6
+    assert buckets["2024-01"].days_to_payment_sum == 90
+
+    # Wipe the rollups as a direct database backfill would leave them
+    async with review_store._engine.begin() as conn:
+        await conn.execute(company_monthly_stats.delete())
+        await conn.execute(company_issues.delete())
+        await conn.execute(review_totals.delete())
+
+    counts = await review_store.rebuild_rollups()
+    assert counts == {"issue_counters": 1, "monthly_buckets": 1}
+    rebuilt = await review_store.company_trends("c1", "2024-01")
+    assert rebuilt["2024-01"].days_to_payment_count == 2
+    assert (await review_store.company_aggregate("c1")).issue_counts == {"late_payment": 1}
+    assert (await review_store.overall_aggregate()).review_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sql_trends_for_many_companies(stores):
+    """company_trends_many reads a batch of companies' buckets in one query"""
+    review_store, company_store = stores
+    await company_store.add_many([make_company("c1"), make_company("c2"), make_company("c3")])
+    await review_store.add_many([
+        make_review("r1", "c1", "2023-06-01T00:00:00", rating=3),
+        make_review("r2", "c1", "2024-01-05T00:00:00", rating=4),
+        make_review("r3", "c2", "2024-02-01T00:00:00", rating=5),
+    ])
+
+    trends = await review_store.company_trends_many(["c1", "c2", "c3"], "2024-01")
+    assert {company_id: list(buckets) for company_id, buckets in trends.items()} == {
+        "c1": ["2024-01"], "c2": ["2024-02"], "c3": [],
+    }
+    assert trends["c1"]["2024-01"].rating_sums["overall_rating"] == 4
+    assert await review_store.company_trends_many([], "2024-01") == {}
+
+
+@pytest.mark.asyncio
+async def test_sql_company_store_ranking_and_search(stores):
+    """Top-ranked listings, counts, priors and substring search"""
+    _, company_store = stores
+    await company_store.add_many([
+        make_company("alpha", rating=3.0),
+        make_company("bravo", rating=4.5),
+        make_company("charlie", entity_type="SHIPPER", rating=5.0),
+    ])
+
+    top = await company_store.top_rated("BROKER", limit=5)
+    assert [c["id"] for c in top] == ["bravo", "alpha"]
+    assert await company_store.count("BROKER") == 2
+    assert await company_store.count() == 3
+
+    await company_store.update("alpha", {"ranking_score": 4.9})
+    assert [c["id"] for c in await company_store.top_rated(limit=2)] == ["charlie", "alpha"]
+
+    await company_store.update("alpha", {"review_count": 10})
+    await company_store.update("bravo", {"review_count": 30})
+    assert await company_store.rating_prior("BROKER") == (3.0 * 10 + 4.5 * 30) / 40
+    assert await company_store.rating_prior("CARRIER") == 3.0
+
+    assert await company_store.search_ids("RAV") == ["bravo"]
+
+    found = await company_store.get_many(["alpha", "missing"])
+    assert list(found) == ["alpha"]
+
+
+@pytest.mark.asyncio
+async def test_sql_versions_shared_between_workers(stores):
+    """Writes bump versions in the database, so every worker's ETags move together"""
+    review_store, company_store = stores
+    engine = review_store._engine
+    worker_a, worker_b = SQLVersionRegistry(engine), SQLVersionRegistry(engine)
+    await company_store.add_many([make_company("c1"), make_company("c2")])
+
+    etag = await worker_a.etag("c1", "profile")
+    assert await worker_b.etag("c1", "profile") == etag
+    listing = await worker_b.etag(None, "reviews")
+
+    await review_store.add(make_review("r1", "c1", "2024-01-01T00:00:00"))
+    assert await worker_b.etag("c1", "profile") != etag
+    assert await worker_a.etag("c1", "profile") == await worker_b.etag("c1", "profile")
+    assert await worker_a.etag(None, "reviews") != listing
+
+    for write in (
+        lambda: review_store.update("r1", {"title": "Edited"}),
+        lambda: review_store.apply_counts({"r1": {"helpful_count": 2}}),
+        lambda: company_store.update("c1", {"ranking_score": 4.0}),
+        lambda: review_store.delete("r1"),
+    ):
+        before = await worker_b.version("c1")
+        await write()
+        assert await worker_a.version("c1") > before
+    assert await worker_a.version("c2") == 0
+
+
+@pytest.mark.asyncio
+async def test_sql_version_epoch_is_per_database(stores):
+    """A recreated database gets a new epoch, so old ETags never match its counters"""
+    review_store, _ = stores
+    etag = await SQLVersionRegistry(review_store._engine).etag("c1", "profile")
+
+    engine = create_engine("sqlite://")
+    await create_tables(engine)
+    assert await SQLVersionRegistry(engine).etag("c1", "profile") != etag
+
+    # Tables created some other way get an epoch on first use
+    async with engine.begin() as conn:
+        await conn.execute(company_versions.delete())
+    registry = SQLVersionRegistry(engine)
+    assert await registry.etag("c1", "profile") == await registry.etag("c1", "profile")
+    await engine.dispose()
+
+
+def test_routes_on_sql_backend(monkeypatch):
+    """Every review route works unchanged on the SQL backend"""
+    saved = (
+        reviews_routes.review_store, reviews_routes.company_store, reviews_routes.company_versions,
+        reviews_routes.review_search_index, reviews_routes.lane_analytics,
+    )
+    monkeypatch.setitem(config._config.setdefault("database", {}), "backend", "sql")
+    monkeypatch.setitem(config._config["database"], "url", "sqlite://")
+    try:
+        with TestClient(app) as client:
+            assert isinstance(reviews_routes.review_store, SQLReviewStore)
+            etag = client.get("/api/companies/company-3").headers["etag"]
+
+            response = client.post("/api/reviews", json={
+                "company_id": "company-3",
+                "overall_rating": 2,
+                "title": "Slow pay",
+                "content": "Took 60 days.",
+            })
+            assert response.status_code == 201
+            review_id = response.json()["review"]["id"]
+
+            assert client.get(f"/api/reviews/{review_id}").json()["title"] == "Slow pay"
+            assert client.get("/api/reviews", params={"after": "WyJ4IiwieSJd"}).status_code == 400
+            response = client.post("/api/reviews", json={
+                "company_id": "company-3",
+                "overall_rating": 2,
+                "title": "Too long",
+                "content": "State does not fit the column.",
+                "origin_state": "Texas",
+            })
+            assert response.status_code == 422
+            results = client.get("/api/reviews/search", params={"q": "slow pay"}).json()["reviews"]
+            assert results[0]["id"] == review_id
+            listing = client.get("/api/reviews", params={"company_id": "company-3"}).headers["etag"]
+            response = client.post(f"/api/reviews/{review_id}/vote", params={"vote_type": "helpful"})
+            assert response.json()["helpful_count"] == 1
+            # The vote is still buffered, but the listing's tag already moved
+            response = client.get("/api/reviews", params={"company_id": "company-3"}, headers={"If-None-Match": listing})
+            assert response.status_code == 200
+            assert response.json()["reviews"][0]["helpful_count"] == 1
+
+            response = client.get("/api/companies/company-3", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            etag = response.headers["etag"]
+            assert client.get("/api/companies/company-3", headers={"If-None-Match": etag}).status_code == 304
+            data = response.json()
+            assert data["stats"]["total_reviews"] == 1
+            assert data["company"]["overall_rating"] == 2
+
+            data = client.get("/api/companies", params={"entity_type": "shipper", "limit": 1}).json()
+            assert data["companies"][0]["entity_type"] == "SHIPPER"
+            assert data["total"] == 5
+    finally:
+        (reviews_routes.review_store, reviews_routes.company_store, reviews_routes.company_versions,
+         reviews_routes.review_search_index, reviews_routes.lane_analytics) = saved
+        reviews_routes.build_company_indexes(list(reviews_routes.mock_companies.values()))
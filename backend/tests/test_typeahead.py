@@ -0,0 +1,69 @@
+"""
+Test Company Typeahead
+"""
+
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.services.typeahead import PrefixIndex
+
+client = TestClient(app)
+
+
+def make_company(company_id, legal_name, score, dba_name=None, mc_number=None):
+    """Build a minimal company dict"""
+    return {
+        "id": company_id,
+        "legal_name": legal_name,
+        "dba_name": dba_name,
+        "mc_number": mc_number,
+        "ranking_score": score,
+    }
+
+
+def test_prefix_index_ranks_by_score():
+    """Prefix matches come back best ranked first"""
+    index = PrefixIndex()
+    index.add(make_company("c1", "Swift Transportation", 3.0))
+    index.add(make_company("c2", "Swift Load Brokers", 4.5))
+    index.add(make_company("c3", "Apex Logistics", 5.0, mc_number="12345"))
+
+    assert index.suggest("sw") == ["c2", "c1"]
+    assert index.suggest("swift tr") == ["c1"]
+    assert index.suggest("123") == ["c3"]
+    assert index.suggest("zzz") == []
+
+
+def test_prefix_index_updates_incrementally():
+    """Cached short-prefix results follow adds, re-scores and removals"""
+    index = PrefixIndex()
+    index.add(make_company("c1", "Swift Transportation", 3.0))
+    assert index.suggest("s") == ["c1"]
+
+    index.add(make_company("c2", "J.B. Hunt", 4.0, dba_name="Swift Hunt"))
+    assert index.suggest("s") == ["c2", "c1"]
+    assert index.suggest("jb hu") == ["c2"]
+
+    index.update_score("c1", 5.0)
+    assert index.suggest("s") == ["c1", "c2"]
+
+    index.remove("c1")
+    assert index.suggest("s") == ["c2"]
+    assert len(index) == 1
+
+
+def test_suggest_endpoint():
+    """Typeahead endpoint returns company summaries"""
+    response = client.get("/api/companies/suggest", params={"q": "swi"})
+    assert response.status_code == 200
+    names = [c["legal_name"] for c in response.json()["suggestions"]]
+    assert "Swift Transportation" in names
+    assert "Swift Load Brokers" in names
+
+    response = client.get("/api/companies/suggest", params={"q": "9876"})
+    assert len(response.json()["suggestions"]) == 8
@@ -0,0 +1,136 @@
+"""
+Test FMCSA Verification Cache
+"""
+
+import asyncio
+import httpx
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.fmcsa_service import FMCSAService
+from src.services.verification_cache import FRESH, MISS, STALE, VerificationCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingAPI:
+    """QCMobile stand-in that counts calls; numbers in `unknown` are 404s"""
+
+    def __init__(self, unknown=(), status=200):
+        self.calls = 0
+        self.unknown = set(unknown)
+        self.status = status
+        self.name = "Original"
+
+    def __call__(self, request):
+        self.calls += 1
+        number = request.url.path.rsplit("/", 1)[-1]
+        if number in self.unknown:
+            return httpx.Response(404)
+        if self.status != 200:
+            return httpx.Response(self.status)
+        return httpx.Response(200, json={"content": {"carrier": {
+            "mcNumber": number, "legalName": f"{self.name} {number}", "entityType": "BROKER",
+        }}})
+
+
+def make_service(api, clock):
+    cache = VerificationCache(max_size=100, ttl=60, negative_ttl=10, stale_ttl=60, clock=clock)
+    return FMCSAService(
+        api_key="test-key",
+        api_url="https://fmcsa.test/carriers",
+        transport=httpx.MockTransport(api),
+        cache=cache
+    )
+
+
+def test_lru_eviction_and_counters():
+    """Least recently used entries go first; every lookup is counted"""
+    clock = FakeClock()
+    cache = VerificationCache(max_size=2, ttl=60, clock=clock)
+    cache.store("a", {"n": 1})
+    cache.store("b", {"n": 2})
+    assert cache.lookup("a") == (FRESH, {"n": 1})   # a is now most recent
+    cache.store("c", {"n": 3})                      # evicts b
+
+    assert cache.lookup("b") == (MISS, None)
+    assert cache.lookup("c") == (FRESH, {"n": 3})
+    assert cache.stats() == {
+        "size": 2, "max_size": 2, "hits": 2, "stale_hits": 0,
+        "misses": 1, "evictions": 1, "hit_rate": 0.6667
+    }
+
+
+def test_entries_go_stale_then_expire():
+    """Fresh until the TTL, stale for stale_ttl more, then gone; not-found uses its own TTL"""
+    clock = FakeClock()
+    cache = VerificationCache(ttl=60, negative_ttl=10, stale_ttl=30, clock=clock)
+    cache.store("found", {"n": 1})
+    cache.store("unknown", None)
+
+    clock.now = 20
+    assert cache.lookup("found") == (FRESH, {"n": 1})
+    assert cache.lookup("unknown") == (STALE, None)
+    clock.now = 75
+    assert cache.lookup("found") == (STALE, {"n": 1})
+    clock.now = 90
+    assert cache.lookup("found") == (MISS, None)
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_repeat_lookups_skip_the_network():
+    """Hits and not-found numbers are answered from the cache"""
+    api = CountingAPI(unknown={"404404"})
+    service = make_service(api, FakeClock())
+
+    first = await service.verify_mc_number("123456")
+    assert await service.verify_mc_number("123456") == first
+    assert await service.verify_mc_number("404404") is None
+    assert await service.verify_mc_number("404404") is None
+    assert api.calls == 2
+    assert service.cache.stats()["hits"] == 2
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    """A failed call is retried next time instead of being remembered as not-found"""
+    api = CountingAPI(status=503)
+    service = make_service(api, FakeClock())
+
+    assert await service.verify_mc_number("123456") is None
+    api.status = 200
+    assert (await service.verify_mc_number("123456"))["company_name"] == "Original 123456"
+    assert api.calls == 2
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_served_while_refreshing():
+    """A stale entry is returned at once and replaced by a background refresh"""
+    api = CountingAPI()
+    clock = FakeClock()
+    service = make_service(api, clock)
+    await service.verify_mc_number("123456")
+
+    clock.now = 90
+    api.name = "Renamed"
+    stale = await service.verify_mc_number("123456")
+    assert stale["company_name"] == "Original 123456"
+
+    await asyncio.gather(*service._fetches.values())
+    fresh = await service.verify_mc_number("123456")
+    assert fresh["company_name"] == "Renamed 123456"
+    assert api.calls == 2
+    await service.close()
@@ -0,0 +1,130 @@
+"""
+Test Batch DOT/MC Verification
+"""
+
+import asyncio
+import json
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.routes import verification
+from src.services.fmcsa_service import FMCSAService
+from src.utils.rate_limit import TokenBucket
+
+client = TestClient(app)
+
+
+def read_lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class StandInAPI:
+    """QCMobile stand-in: the number sets how long it takes (ms); 404 and 503 are errors"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, request):
+        self.calls += 1
+        number = request.url.path.rsplit("/", 1)[-1]
+        if number in ("404", "503"):
+            return httpx.Response(int(number))
+        await asyncio.sleep(int(number) / 1000)
+        return httpx.Response(200, json={"content": {"carrier": {
+            "mcNumber": number, "dotNumber": number, "legalName": f"Carrier {number}",
+        }}})
+
+
+@pytest.fixture
+def live_service(monkeypatch):
+    api = StandInAPI()
+    service = FMCSAService(api_key="test-key", api_url="https://fmcsa.test/carriers", transport=httpx.MockTransport(api))
+    monkeypatch.setattr(verification, "fmcsa_service", service)
+    return api
+
+
+def test_batch_mock_mode_dedupes():
+    """Each distinct (type, number) is answered once"""
+    response = client.post("/api/verify/batch", json={
+        "mc_numbers": ["111", "222", "111"],
+        "dot_numbers": ["111"],
+    })
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = read_lines(response)
+    assert sorted((line["type"], line.get("mc_number") or line.get("dot_number")) for line in lines) == [
+        ("dot", "111"), ("mc", "111"), ("mc", "222"),
+    ]
+    assert all(line["verified"] for line in lines)
+
+
+def test_batch_streams_in_completion_order(live_service):
+    """Fast lookups come back before slow ones; failures are reported per line"""
+    response = client.post("/api/verify/batch", json={"mc_numbers": ["300", "404", "503", "10"]})
+    lines = read_lines(response)
+
+    assert [line["mc_number"] for line in lines][-1] == "300"
+    by_number = {line["mc_number"]: line for line in lines}
+    assert by_number["10"]["company_name"] == "Carrier 10"
+    assert by_number["404"]["verified"] is False and "error" not in by_number["404"]
+    assert by_number["503"]["error"] == "FMCSA API error: 503"
+    assert live_service.calls == 4
+
+
+def test_batch_rejects_bad_numbers():
+    assert client.post("/api/verify/batch", json={"mc_numbers": ["12AB"]}).status_code == 422
+    too_many = [str(i) for i in range(verification.MAX_BATCH_VERIFY + 1)]
+    assert client.post("/api/verify/batch", json={"dot_numbers": too_many}).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_calls():
+    """After the burst, calls are spaced out at the refill rate"""
+    bucket = TokenBucket(rate=50, capacity=2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(7):
+        await bucket.acquire()
+    # 2 from the burst, then 5 at 20 ms apart
+    assert loop.time() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_batch_lookups_are_rate_limited():
+    """Uncached lookups wait for tokens; cache hits do not"""
+    loop = asyncio.get_running_loop()
+    sent = []
+
+    def handler(request):
+        sent.append(loop.time())
+        number = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"content": {"carrier": {"mcNumber": number, "dotNumber": number}}})
+
+    service = FMCSAService(
+        api_key="test-key",
+        api_url="https://fmcsa.test/carriers",
+        transport=httpx.MockTransport(handler),
+        rate_limiter=TokenBucket(rate=50, capacity=2),
+    )
+    numbers = [str(n) for n in range(1, 8)]
+    results = await asyncio.gather(*(service.lookup("mc", n) for n in numbers))
+    assert [r["mc_number"] for r in results] == numbers
+
+    # 2 from the burst, then one every 20 ms - checked cumulatively, since
+    # one late wakeup can shorten the gap after it
+    assert len(sent) == 7
+    assert all(sent[i] - sent[0] >= (i - 1) * 0.02 - 0.005 for i in range(2, 7))
+
+    start = loop.time()
+    await asyncio.gather(*(service.lookup("mc", n) for n in numbers))
+    assert len(sent) == 7
+    assert loop.time() - start < 0.02
+    await service.close()
@@ -0,0 +1,172 @@
+"""
+Test Vote Buffer
+"""
+
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import app
+from src.routes import reviews as reviews_routes
+from src.services.review_store import InMemoryReviewStore
+from src.services.vote_buffer import VoteBuffer
+
+client = TestClient(app)
+
+
+def make_store():
+    """Store with one review that already has votes"""
+    return InMemoryReviewStore([{
+        "id": "r1",
+        "company_id": "c1",
+        "created_at": "2024-01-01T00:00:00",
+        "overall_rating": 4,
+        "status": "published",
+        "helpful_count": 5,
+    }])
+
+
+@pytest.mark.asyncio
+async def test_votes_coalesce_into_one_write():
+    """Many votes become one batched write per flush"""
+    store = make_store()
+    writes = []
+
+    async def flush_to(deltas):
+        writes.append(deltas)
+        await store.apply_counts(deltas)
+
+    buffer = VoteBuffer(flush_to=flush_to)
+    for _ in range(10):
+        buffer.record("r1", "helpful", "c1")
+    buffer.record("r1", "not_helpful", "c1")
+
+    review = await store.get("r1")
+    assert review["helpful_count"] == 5
+    assert buffer.overlay(review)["helpful_count"] == 15
+    assert buffer.overlay(review)["not_helpful_count"] == 1
+
+    await buffer.flush()
+    assert writes == [{"r1": {"helpful_count": 10, "not_helpful_count": 1}}]
+    review = await store.get("r1")
+    assert review["helpful_count"] == 15
+    assert buffer.overlay(review) is review
+
+    await buffer.flush()
+    assert len(writes) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_votes():
+    """Votes survive a failed write and go out with the next flush"""
+    store = make_store()
+    fail = [True]
+
+    async def flush_to(deltas):
+        if fail.pop():
+            raise RuntimeError("database down")
+        await store.apply_counts(deltas)
+
+    buffer = VoteBuffer(flush_to=flush_to, max_pending=2)
+    buffer.record("r1", "helpful", "c1")
+    buffer.record("r1", "helpful", "c1")
+    assert buffer.is_full
+
+    with pytest.raises(RuntimeError):
+        await buffer.flush()
+    assert buffer.pending("r1") == {"helpful_count": 2}
+
+    fail.append(False)
+    await buffer.flush()
+    assert (await store.get("r1"))["helpful_count"] == 7
+
+
+@pytest.mark.asyncio
+async def test_generation_tracks_pending_votes_per_company():
+    """The ETag generation moves with every vote and clears once they are persisted"""
+    fail = [False, True]
+
+    async def flush_to(deltas):
+        if fail.pop():
+            raise RuntimeError("database down")
+
+    buffer = VoteBuffer(flush_to=flush_to)
+    assert buffer.generation("c1") == ""
+
+    buffer.record("r1", "helpful", "c1")
+    first = buffer.generation("c1")
+    buffer.record("r1", "not_helpful", "c1")
+    buffer.record("r9", "helpful", "c2")
+    assert len({"", first, buffer.generation("c1")}) == 3
+    assert buffer.pending_votes("c1") == 2
+    assert buffer.pending_votes() == 3
+    # Another worker's pending votes never yield the same generation
+    other = VoteBuffer(flush_to=flush_to)
+    other.record("r2", "helpful", "c1")
+    other.record("r2", "helpful", "c1")
+    assert other.generation("c1") != buffer.generation("c1")
+
+    with pytest.raises(RuntimeError):
+        await buffer.flush()
+    assert buffer.pending_votes("c1") == 2
+
+    await buffer.flush()
+    assert buffer.generation("c1") == buffer.generation() == ""
+
+
+def test_vote_endpoint_counts_both_vote_types():
+    """Both vote types show up immediately"""
+    before = client.get("/api/reviews/review-2").json()
+    client.post("/api/reviews/review-2/vote", params={"vote_type": "helpful"})
+    response = client.post("/api/reviews/review-2/vote", params={"vote_type": "not_helpful"})
+
+    data = response.json()
+    assert data["helpful_count"] == before["helpful_count"] + 1
+    assert data["not_helpful_count"] == before["not_helpful_count"] + 1
+    assert client.get("/api/reviews/review-2").json()["not_helpful_count"] == data["not_helpful_count"]
+
+
+@pytest.mark.asyncio
+async def test_flush_soon_runs_in_the_background():
+    """A full buffer is flushed by a task; its failure is logged and the votes kept"""
+    calls = []
+    release = asyncio.Event()
+
+    async def flush_to(deltas):
+        calls.append(deltas)
+        await release.wait()
+        if len(calls) == 1:
+            raise RuntimeError("database down")
+
+    buffer = VoteBuffer(flush_to=flush_to, max_pending=1)
+    buffer.record("r1", "helpful", "c1")
+    buffer.flush_soon()
+    await asyncio.sleep(0)
+    buffer.record("r1", "helpful", "c1")
+    buffer.flush_soon()           # one already running - not started again
+    release.set()
+    await buffer.stop()
+
+    # The failed batch went back into the buffer and out with stop()'s flush
+    assert calls == [{"r1": {"helpful_count": 1}}, {"r1": {"helpful_count": 2}}]
+    assert buffer.pending("r1") == {}
+
+
+def test_vote_survives_failed_flush(monkeypatch):
+    """Filling the buffer while the store is down still answers with the recorded counts"""
+    async def failing(deltas):
+        raise RuntimeError("database down")
+
+    buffer = VoteBuffer(flush_to=failing, max_pending=1)
+    monkeypatch.setattr(reviews_routes, "vote_buffer", buffer)
+    before = client.get("/api/reviews/review-1").json()["helpful_count"]
+
+    response = client.post("/api/reviews/review-1/vote", params={"vote_type": "helpful"})
+    assert response.status_code == 200
+    assert response.json()["helpful_count"] == before + 1
+    assert buffer.pending("review-1") == {"helpful_count": 1}